@@ -0,0 +1,9 @@
+"""Benchmarks de la aplicacion y de los motores de ``planeacion``.
+
+``python -m benchmarks`` recorre cada seccion del menu lateral con el
+``AppTest`` de Streamlit (sin navegador) y mide tiempo, memoria pico y
+tamano de las figuras enviadas; despues mide los motores de calculo a
+varios tamanos de datos. Los resultados se guardan como JSON en
+``benchmarks/resultados`` con el commit actual en el nombre, y
+``python -m benchmarks --compare A.json B.json`` compara dos corridas.
+"""
@@ -0,0 +1,107 @@
+"""Linea de comandos: ``python -m benchmarks [--quick] [--only secciones|kernels]``."""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+RESULTS_DIR = Path(__file__).resolve().parent / "resultados"
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _git(*args) -> str:
+    try:
+        return subprocess.run(["git", *args], cwd=ROOT, capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def _rows(results: dict) -> dict:
+    rows = {}
+    for row in results.get("sections", []):
+        rows[("seccion", row["section"], "rerun_s")] = row["rerun_s"]
+        rows[("seccion", row["section"], "cold_s")] = row["cold_s"]
+        rows[("seccion", row["section"], "peak_bytes")] = row["peak_bytes"]
+        rows[("seccion", row["section"], "figure_bytes")] = row["figure_bytes"]
+    for row in results.get("kernels", []):
+        rows[("kernel", f"{row['kernel']}[{row['size']:,}]", "min_s")] = row["min_s"]
+    return rows
+
+
+def compare(old_path, new_path, threshold: float = 1.2) -> int:
+    """Imprime la razon nuevo / anterior; regresa 1 si algo empeoro mas de ``threshold``."""
+    old = json.loads(Path(old_path).read_text())
+    new = json.loads(Path(new_path).read_text())
+    old_rows, new_rows = _rows(old), _rows(new)
+    print(f"{old.get('commit', '?')[:10]} -> {new.get('commit', '?')[:10]}")
+    worse = False
+    for key in sorted(old_rows.keys() & new_rows.keys()):
+        before, after = old_rows[key], new_rows[key]
+        ratio = after / before if before else float("inf") if after else 1.0
+        flag = ""
+        if ratio > threshold:
+            flag, worse = "  <-- regresion", True
+        elif ratio < 1.0 / threshold:
+            flag = "  mejora"
+        print(f"{key[0]:8} {key[1]:38} {key[2]:13} {before:14.4g} {after:14.4g} {ratio:7.2f}x{flag}")
+    return 1 if worse else 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument("--only", choices=("secciones", "kernels"), help="Mide solo una de las dos partes.")
+    parser.add_argument("--quick", action="store_true", help="Tamanos pequenos de los kernels.")
+    parser.add_argument("--section", action="append", help="Seccion a medir (se puede repetir).")
+    parser.add_argument("--kernel", action="append", help="Kernel a medir (se puede repetir).")
+    parser.add_argument("--repeat", type=int, default=5, help="Repeticiones por kernel y tamano.")
+    parser.add_argument("--output", type=Path, help="Archivo JSON de salida.")
+    parser.add_argument("--compare", nargs=2, metavar=("ANTERIOR", "NUEVO"), help="Compara dos resultados.")
+    parser.add_argument("--threshold", type=float, default=1.2, help="Razon a partir de la cual hay regresion.")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        return compare(*args.compare, threshold=args.threshold)
+
+    sys.path.insert(0, str(ROOT))
+    commit = _git("rev-parse", "HEAD")
+    results = {
+        "commit": commit,
+        "dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "quick": args.quick,
+    }
+    if args.only != "kernels":
+        from benchmarks import secciones
+
+        results["sections"] = []
+        for name in args.section or secciones.sections():
+            row = secciones.measure(name)
+            results["sections"].append(row)
+            print(
+                f"{name:14} frio {row['cold_s']:7.3f} s  rerun {row['rerun_s']:7.3f} s  "
+                f"pico {row['peak_bytes'] / 2**20:8.1f} MiB  figuras {row['figures']:2d} "
+                f"({row['figure_bytes'] / 1024:,.0f} KiB)"
+            )
+    if args.only != "secciones":
+        from benchmarks import kernels
+
+        results["kernels"] = []
+        for name in args.kernel or kernels.KERNELS:
+            for row in kernels.run([name], quick=args.quick, repeat=args.repeat):
+                results["kernels"].append(row)
+                print(f"{row['kernel']:18} {row['size']:>9,}  min {row['min_s'] * 1000:10.2f} ms")
+
+    output = args.output or RESULTS_DIR / f"{time.strftime('%Y%m%d-%H%M%S')}-{commit[:10] or 'sin-git'}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2))
+    print(f"Resultados en {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+"""Micro-benchmarks de los motores de calculo a varios tamanos de datos.
+
+Cada kernel tiene una funcion ``setup(tamano)`` que arma las entradas
+(fuera de la medicion) y la llamada que se mide. El tiempo reportado es
+el minimo de ``repeat`` ejecuciones, que es el menos afectado por el
+ruido del sistema; tambien se guarda la mediana.
+"""
+
+import statistics
+import time
+
+import numpy as np
+
+from planeacion import pronostico
+from planeacion.costos import candidate_plans, evaluate_plans
+from planeacion.crp import capacity_requirements, operation_loads
+from planeacion.ejemplos import (
+    demo_capacity, demo_demand_history, demo_hierarchy, demo_lot_costs, demo_mrp, demo_routings, demo_skus,
+)
+from planeacion.inventario import inventory_policy
+from planeacion.jerarquia import Hierarchy
+from planeacion.lotes import compare_policies
+from planeacion.mrp import explode
+from planeacion.muestreo import downsample
+from planeacion.sensibilidad import cost_grid
+
+HORIZON = 24
+
+
+def _skus(n):
+    return (demo_skus(n),)
+
+
+def _mrp(n):
+    return (*demo_mrp(n, HORIZON), HORIZON)
+
+
+def _history(n):
+    return (demo_demand_history(n), 13)
+
+
+def _lots(n):
+    requirements = np.random.default_rng(0).poisson(40.0, size=(n, HORIZON)).astype(np.float64)
+    return (requirements, *demo_lot_costs(n))
+
+
+def _crp(n):
+    items, bom, mps = demo_mrp(n, HORIZON)
+    orders = explode(items, bom, mps, HORIZON).orders()
+    routings = demo_routings(items["item"], 20)
+    return orders, routings, demo_capacity(operation_loads(orders, routings)), HORIZON
+
+
+def _tree(n):
+    return (demo_hierarchy(n),)
+
+
+def _series(n):
+    return (np.cumsum(np.random.default_rng(0).normal(size=n)), 1_200)
+
+
+_FACTORS = [0.5 + 0.1 * i for i in range(11)]
+_PLANS = candidate_plans(np.linspace(0.50, 0.999, 60), np.linspace(0.25, 3.0, 56))
+
+# nombre: (setup, funcion, tamanos, tamanos en modo rapido)
+KERNELS = {
+    "eoq_policy": (_skus, inventory_policy, (1_000, 10_000, 100_000, 500_000), (1_000, 10_000)),
+    "eoq_sensitivity": (
+        _skus, lambda skus: cost_grid(skus, _FACTORS, _FACTORS, _FACTORS), (1_000, 10_000, 100_000), (1_000,),
+    ),
+    "plan_costs": (_skus, lambda skus: evaluate_plans(skus, _PLANS), (1_000, 10_000, 100_000), (1_000,)),
+    "mrp_explode": (_mrp, explode, (500, 2_000, 10_000, 50_000), (500, 2_000)),
+    "lot_sizing": (_lots, compare_policies, (100, 1_000, 10_000), (100,)),
+    "crp_load": (_crp, capacity_requirements, (500, 2_000, 10_000), (500,)),
+    "forecast_ses": (
+        _history, lambda h, horizon: pronostico.run(h, "exponential_smoothing", horizon),
+        (1_000, 10_000, 100_000), (1_000,),
+    ),
+    "forecast_best_fit": (_history, pronostico.best_fit, (1_000, 10_000, 50_000), (1_000,)),
+    "hierarchy_rollup": (_tree, Hierarchy.from_table, (10_000, 100_000, 1_000_000), (10_000,)),
+    "downsample_lttb": (_series, downsample, (10_000, 100_000, 1_000_000), (10_000,)),
+}
+
+
+def measure(name: str, size: int, repeat: int = 5) -> dict:
+    setup, function, _, _ = KERNELS[name]
+    args = setup(size)
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(*args)
+        times.append(time.perf_counter() - start)
+    return {"kernel": name, "size": size, "min_s": min(times), "median_s": statistics.median(times), "repeat": repeat}
+
+
+def run(names=None, quick: bool = False, repeat: int = 5) -> list:
+    results = []
+    for name in names or KERNELS:
+        _, _, sizes, quick_sizes = KERNELS[name]
+        for size in quick_sizes if quick else sizes:
+            results.append(measure(name, size, repeat=repeat))
+    return results
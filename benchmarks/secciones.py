@@ -0,0 +1,87 @@
+"""Costo de cada seccion de ``operaciones.py`` medido con ``AppTest``.
+
+Por seccion se reporta:
+
+* ``cold_s``: primera ejecucion con los caches de Streamlit vacios (el
+  cache en disco de ``planeacion.persistencia`` se conserva).
+* ``rerun_s``: una ejecucion mas con los caches ya llenos, que es lo que
+  cuesta cada interaccion.
+* ``peak_bytes``: memoria pico de Python durante una ejecucion en frio
+  (``tracemalloc``, en una pasada aparte porque lo hace mas lento).
+* ``figures`` y ``figure_bytes``: numero de graficas Plotly y tamano de
+  su JSON, es decir, lo que se envia al navegador.
+"""
+
+import logging
+import time
+import tracemalloc
+from pathlib import Path
+
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+APP = Path(__file__).resolve().parent.parent / "operaciones.py"
+
+# AppTest corre sin servidor y Streamlit lo advierte en cada ejecucion.
+logging.getLogger("streamlit").setLevel(logging.ERROR)
+
+
+def _clear_caches() -> None:
+    st.cache_data.clear()
+    st.cache_resource.clear()
+
+
+def _open(section: str, timeout: float) -> AppTest:
+    app = AppTest.from_file(str(APP), default_timeout=timeout)
+    app.run()
+    if section != app.sidebar.radio[0].value:
+        app.sidebar.radio[0].set_value(section).run()
+    return app
+
+
+def sections(timeout: float = 300) -> list:
+    """Opciones del menu lateral, en orden."""
+    app = AppTest.from_file(str(APP), default_timeout=timeout)
+    app.run()
+    return list(app.sidebar.radio[0].options)
+
+
+def _figures(app: AppTest):
+    specs = [element.proto.spec for element in app.get("plotly_chart")]
+    return len(specs), sum(len(spec.encode()) for spec in specs)
+
+
+def measure(section: str, timeout: float = 300) -> dict:
+    """Mide una seccion; lanza ``RuntimeError`` si la seccion falla."""
+    _clear_caches()
+    start = time.perf_counter()
+    app = _open(section, timeout)
+    cold = time.perf_counter() - start
+    if app.exception:
+        raise RuntimeError(f"La seccion {section} fallo: {app.exception[0].value}")
+
+    start = time.perf_counter()
+    app.run()
+    rerun = time.perf_counter() - start
+    figures, figure_bytes = _figures(app)
+
+    _clear_caches()
+    tracemalloc.start()
+    try:
+        _open(section, timeout)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "section": section,
+        "cold_s": cold,
+        "rerun_s": rerun,
+        "peak_bytes": peak,
+        "figures": figures,
+        "figure_bytes": figure_bytes,
+    }
+
+
+def run(names=None, timeout: float = 300) -> list:
+    return [measure(name, timeout) for name in (names or sections(timeout))]
@@ -0,0 +1,7 @@
+"""Secciones de la aplicacion, una por opcion del menu lateral.
+
+``operaciones.py`` importa cada modulo solo cuando se abre su seccion
+por primera vez y llama a su funcion ``render``; las bibliotecas pesadas
+(plotly, pandas y los motores de ``planeacion``) se importan dentro de
+los modulos que las usan.
+"""
@@ -0,0 +1,65 @@
+"""Bibliografia completa del proyecto (APA 7.0)."""
+
+import streamlit as st
+
+
+def render():
+    st.markdown("## Bibliografía Completa del Proyecto")
+    st.markdown("**Formato: APA 7.0**")
+    
+    st.markdown("""
+    ### Libros de Texto Principal
+    
+    Chase, R. B., & Jacobs, F. R. (2018). *Administración de operaciones: Producción y cadena de suministros* (15.ª ed.). McGraw-Hill Education.
+    
+    Chopra, S., & Meindl, P. (2016). *Administración de la cadena de suministro: Estrategia, planeación y operación* (6.ª ed.). Pearson Educación.
+    
+    Heizer, J., Render, B., & Munson, C. (2020). *Principios de administración de operaciones* (13.ª ed.). Pearson.
+    
+    Krajewski, L. J., Malhotra, M. K., & Ritzman, L. P. (2019). *Administración de operaciones: Procesos y cadenas de valor* (12.ª ed.). Pearson.
+    
+    ### Referencias Complementarias
+    
+    Schroeder, R. G., Goldstein, S. M., & Rungtusanatham, M. J. (2018). *Operations management in the supply chain: Decisions and cases* (7.ª ed.). McGraw-Hill.
+    
+    Slack, N., Brandon-Jones, A., & Johnston, R. (2019). *Operations management* (9.ª ed.). Pearson Education.
+    
+    Tersine, R. J. (2017). *Principles of inventory and materials management* (4.ª ed.). Prentice Hall.
+    
+    West, D. M. (2018). *The future of work: Robots, AI, and automation*. Brookings Institution Press.
+    
+    ### Artículos y Publicaciones en Revistas
+    
+    Bortolotti, T., Boscari, S., & Danese, P. (2015). Successful lean implementation: Organizational culture and soft lean practices. 
+    *International Journal of Production Economics*, 160, 21-32.
+    
+    Dey, S., Biswas, S., Sarkar, A., & Mukherjee, K. (2019). Analyzing the effects of supply chain network disruption due to manufacturing 
+    yield uncertainty. *International Journal of Production Research*, 57(16), 4992-5008.
+    
+    Gunasekaran, A., Patel, C., & McGaughey, R. (2017). A framework for supply chain performance measurement. *International Journal of 
+    Production Economics*, 87(3), 333-347.
+    
+    Müller, R., & Turner, J. R. (2018). Leadership competency in project and program management. *Project Management Journal*. 
+    Educational & Management Services.
+    
+    ### Normas y Estándares
+    
+    International Organization for Standardization (2015). *ISO 31000: Risk management - Principles and guidelines*. ISO.
+    
+    International Organization for Standardization (2018). *ISO 9001: Quality management systems - Requirements*. ISO.
+    
+    Project Management Institute (2017). *A guide to the project management body of knowledge (PMBOK Guide)* (6.ª ed.). PMI.
+    
+    ### Recursos de Consulta en Línea
+    
+    American Production and Inventory Control Society (APICS). (2023). *APICS Dictionary*. Consultado de https://www.apics.org/
+    
+    Council of Supply Chain Management Professionals (CSMP). (2023). *Supply Chain Management Body of Knowledge*. Consultado de 
+    https://www.csmp.org/
+    """)
+    
+    st.divider()
+    st.info("""
+    **Nota Metodológica:** Esta bibliografía ha sido compilada siguiendo los estándares APA 7.0. Cada referencia incluida ha sido 
+    seleccionada por su relevancia teórica o práctica al contenido del curso.
+    """)
@@ -0,0 +1,185 @@
+"""Datos locales y calculos compartidos por varias secciones.
+
+Los motores de ``planeacion`` se importan dentro de cada funcion para
+que abrir una seccion no cargue los de las demas.
+"""
+
+import time
+from pathlib import Path
+
+import streamlit as st
+
+from planeacion.medicion import TRACER
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# -----------------------------------------------------------------------------
+# DATOS LOCALES (compartidos entre sesiones; se releen solo si el archivo cambia)
+# -----------------------------------------------------------------------------
+DATA_DIR = ROOT / "datos"
+WORKBOOK = "hoja_de_calculo"
+
+
+@st.cache_resource
+def data_store():
+    from planeacion.datos import DataStore
+
+    return DataStore(DATA_DIR)
+
+
+def local_workbook(key):
+    with TRACER.span("datos/hoja_de_calculo"):
+        workbook = data_store().workbook(WORKBOOK)
+    if workbook is None:
+        st.info(
+            f"Exporte la hoja de calculo como XLSX a `{DATA_DIR.name}/{WORKBOOK}.xlsx` para consultarla "
+            "aqui sin conexion a internet."
+        )
+        return
+    sheet = st.selectbox("Hoja", list(workbook), key=key)
+    st.dataframe(workbook[sheet], use_container_width=True, height=500)
+
+
+# -----------------------------------------------------------------------------
+# MOTORES DE CALCULO (con cache entre reruns)
+# -----------------------------------------------------------------------------
+# Los calculos pesados tambien se guardan en disco (por hash de sus entradas)
+# para que sobrevivan a reinicios y se compartan entre procesos.
+CACHE_DIR = ROOT / ".cache"
+
+
+@st.cache_resource
+def result_cache():
+    from planeacion.persistencia import ResultCache
+
+    return ResultCache(CACHE_DIR / "resultados.sqlite")
+
+
+@st.cache_data(show_spinner=False)
+def skus_demo(n):
+    from planeacion.ejemplos import demo_skus
+
+    return demo_skus(n)
+
+
+@st.cache_data(show_spinner=False)
+def mrp_demo(n_items, horizon):
+    from planeacion.ejemplos import demo_mrp
+
+    return demo_mrp(n_items, horizon)
+
+
+@st.cache_data(show_spinner="Explotando MRP...")
+def explode_plan(items, bom, mps, horizon):
+    from planeacion.mrp import explode
+
+    return result_cache().memoize(explode)(items, bom, mps, horizon)
+
+
+# -----------------------------------------------------------------------------
+# FIGURAS Y ARCHIVOS ESTATICOS (en memoria, compartidos entre sesiones)
+# -----------------------------------------------------------------------------
+@st.cache_resource
+def asset_cache():
+    from planeacion.activos import AssetCache
+
+    return AssetCache()
+
+
+def cached_figure(key, build, *args):
+    """Figura ``build(*args)`` ya construida y serializada para ``key``.
+
+    Se guarda como ``SerializedFigure``: armarla, validarla y codificar sus
+    arreglos ocurre una vez; en cada rerun ``st.plotly_chart`` solo
+    decodifica y vuelve a escribir el JSON guardado, que es lo que pesa.
+    """
+    from paginas.graficas import SerializedFigure
+
+    with TRACER.span(f"figura/{build.__name__.lstrip('_')}"):
+        return asset_cache().value(
+            key, build, *args, convert=SerializedFigure, size=lambda figure: figure.nbytes,
+        )
+
+
+def asset_file(path, reader=None):
+    """Contenido de un archivo estatico (texto, o lo que regrese ``reader``);
+    se relee solo si el archivo cambia."""
+    if reader is None:
+        return asset_cache().file(path)
+    return asset_cache().file(path, reader)
+
+
+def remembered(name, key, compute, *args):
+    """Resultado de ``compute(*args)`` guardado en la sesion bajo ``name``.
+
+    Se recalcula solo cuando cambia ``key``; los paneles "que pasa si"
+    (fragmentos) lo usan para no repetir calculos entre sus reruns. Los
+    argumentos se guardan junto al resultado, de modo que ``key`` puede
+    usar ``id()`` de ellos sin que otro objeto reutilice ese id.
+    """
+    stored = st.session_state.get(name)
+    if stored is not None and stored[0] == key:
+        return stored[1]
+    value = compute(*args)
+    st.session_state[name] = (key, value, args)
+    return value
+
+
+# -----------------------------------------------------------------------------
+# TRABAJOS EN SEGUNDO PLANO (pool de procesos compartido por todas las sesiones)
+# -----------------------------------------------------------------------------
+@st.cache_resource
+def job_runner():
+    from planeacion.trabajos import JobRunner
+
+    return JobRunner(CACHE_DIR / "trabajos.sqlite")
+
+
+def background_job(name, key, label, function, *args, **kwargs):
+    """Resultado de ``function(*args, **kwargs)`` calculado en segundo plano.
+
+    Regresa ``None`` (y muestra el avance) mientras el trabajo no termina.
+    El id del trabajo se guarda en la sesion bajo ``name``; si cambia
+    ``key`` (o el resultado ya no esta en el almacen) se cancela el
+    trabajo anterior y se envia uno nuevo.
+    """
+    runner = job_runner()
+    stored = st.session_state.get(name)
+    status = runner.status(stored[1]) if stored is not None and stored[0] == key else None
+    if status is not None and status.state == "done":
+        try:
+            return runner.result(stored[1])
+        except KeyError:
+            # El almacen ya desalojo el resultado (LRU): se vuelve a calcular.
+            status = None
+    if status is None:
+        if stored is not None:
+            runner.forget(stored[1])
+        stored = (key, runner.submit(function, *args, label=label, **kwargs))
+        st.session_state[name] = stored
+        status = runner.status(stored[1])
+    if status.state == "failed":
+        st.error(f"El trabajo '{status.label}' fallo: {status.error}")
+    elif status.state == "cancelled":
+        st.warning(f"Trabajo '{status.label}' cancelado. Cambie algun parametro para enviarlo de nuevo.")
+    else:
+        _job_progress(stored[1])
+    return None
+
+
+@st.fragment(run_every=1.0)
+def _job_progress(job_id):
+    # Solo se dibuja mientras el trabajo esta en cola o corriendo; al terminar
+    # (bien, con error o cancelado) se vuelve a ejecutar la pagina, que ya no
+    # monta este fragmento y deja de consultar el estado.
+    runner = job_runner()
+    status = runner.status(job_id)
+    if status is None or status.state not in ("queued", "running"):
+        st.rerun()
+    if status.state == "queued":
+        text = f"{status.label}: en cola ({sum(j.state == 'queued' for j in runner.jobs())} trabajos esperando)"
+    else:
+        text = f"{status.label}: {status.fraction:.0%} ({time.time() - status.submitted:,.0f} s)"
+    st.progress(status.fraction, text=text)
+    if st.button("Cancelar", key=f"cancelar_{job_id}"):
+        runner.cancel(job_id)
@@ -0,0 +1,69 @@
+"""Panel de diagnostico del menu lateral: tiempos por tramo y cProfile.
+
+Ambas opciones vienen apagadas. Los controles se dibujan al final de la
+pagina, pero ``start`` lee su valor de la sesion al inicio del rerun para
+que la medicion cubra todo el script. ``stop`` debe llamarse en un
+``finally``: un ``st.rerun()`` a media pagina no llega a ``panel`` y el
+perfilador quedaria activo en el hilo de la sesion.
+"""
+
+import cProfile
+import io
+import pstats
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from paginas.comun import CACHE_DIR
+from planeacion.medicion import TRACER
+
+
+def _current_run():
+    # Streamlit arma una lista nueva de fragmentos en cada rerun parcial; en
+    # los reruns completos ``start`` ya limpia los tramos.
+    ctx = get_script_run_ctx()
+    return None if ctx is None else ctx.fragment_ids_this_run
+
+
+TRACER.run = _current_run
+
+
+def start():
+    """Inicia la medicion del rerun; regresa el perfilador activo o ``None``."""
+    TRACER.begin(st.session_state.get("diagnostico_tiempos", False))
+    if not st.session_state.get("diagnostico_perfil", False):
+        return None
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:
+        # Python 3.12+: solo un perfilador a la vez por interprete (otra
+        # sesion ya esta perfilando); este rerun se mide sin cProfile.
+        return None
+    return profiler
+
+
+def stop(profiler):
+    if profiler is not None:
+        profiler.disable()
+
+
+def panel(profiler, top: int = 25):
+    spans = TRACER.spans()
+    with st.sidebar.expander("Diagnostico"):
+        st.toggle("Medir tiempos por seccion y grafica", key="diagnostico_tiempos")
+        st.toggle("Perfilar cada rerun (cProfile)", key="diagnostico_perfil")
+        if spans:
+            st.dataframe(
+                [{"tramo": name, "ms": round(seconds * 1000, 2)} for name, seconds in spans],
+                use_container_width=True,
+                hide_index=True,
+            )
+        if TRACER.stats():
+            if st.button("Exportar metricas"):
+                paths = [TRACER.export(CACHE_DIR / name) for name in ("metricas.json", "metricas.prom")]
+                st.caption("Escritas en " + ", ".join(f"`{path.name}`" for path in paths) + f" (`{CACHE_DIR.name}`).")
+        if profiler is not None:
+            output = io.StringIO()
+            pstats.Stats(profiler, stream=output).sort_stats("cumulative").print_stats(top)
+            st.code(output.getvalue(), language="text")
@@ -0,0 +1,116 @@
+"""Colores corporativos y hoja de estilo comun a todas las secciones."""
+
+COLOR_PRIMARY = "#003366"  # Azul Estrategia
+COLOR_SECONDARY = "#00B050" # Verde Recursos
+COLOR_TERTIARY = "#C00000"  # Rojo Costos
+COLOR_BG = "#0b1220"
+
+# CSS Personalizado para dar formato académico
+CSS = f"""
+    <style>
+    :root {{
+        --bg: {COLOR_BG};
+        --panel: #111827;
+        --panel-2: #0f172a;
+        --text: #e5e7eb;
+        --muted: #9ca3af;
+        --accent: {COLOR_PRIMARY};
+        --gold: #c9a65d;
+        --border: rgba(201, 166, 93, 0.6);
+    }}
+
+    html, body, [data-testid="stAppViewContainer"] {{
+        background: radial-gradient(1200px 600px at 15% 0%, #0f172a, #0b1220 60%) !important;
+        color: var(--text) !important;
+        font-family: 'Arial', sans-serif;
+    }}
+
+    .main, .block-container {{
+        background-color: transparent !important;
+    }}
+
+    h1, h2, h3, h4, h5 {{
+        color: var(--text) !important;
+        font-family: 'Arial Black', 'Arial', sans-serif;
+        letter-spacing: 0.3px;
+    }}
+
+    h1 {{
+        border-bottom: 2px solid var(--accent);
+        padding-bottom: 10px;
+    }}
+
+    p, li, span, label {{
+        color: var(--text) !important;
+    }}
+
+    .author-card {{
+        background: linear-gradient(180deg, #0f1b33 0%, #0b1528 100%);
+        border: 1px solid var(--border);
+        border-radius: 12px;
+        padding: 12px 14px;
+        box-shadow: 0 6px 18px rgba(0, 0, 0, 0.25);
+    }}
+
+    .author-tag {{
+        font-size: 1.05rem;
+        color: var(--gold);
+        font-weight: bold;
+        text-align: right;
+        letter-spacing: 0.2px;
+    }}
+
+    .author-subtitle {{
+        color: #9cc5ff;
+        font-size: 0.95rem;
+        text-align: right;
+        margin-top: 6px;
+    }}
+
+    .subtitle-accent {{
+        color: #9cc5ff;
+        font-weight: 600;
+    }}
+
+    .citation {{
+        font-size: 0.8rem;
+        color: var(--muted);
+        font-style: italic;
+    }}
+
+    .big-font {{
+        font-size: 1.05rem;
+        line-height: 1.7;
+        text-align: justify;
+        color: var(--text);
+    }}
+
+    .stMarkdown, .stCaption {{
+        color: var(--text) !important;
+    }}
+
+    [data-testid="stMetric"] {{
+        background: var(--panel);
+        border: 1px solid var(--border);
+        border-radius: 12px;
+        padding: 10px 12px;
+    }}
+
+    [data-testid="stExpander"] {{
+        background: var(--panel-2);
+        border: 1px solid var(--border);
+        border-radius: 12px;
+    }}
+
+    .stPlotlyChart {{
+        background: var(--panel-2);
+        border-radius: 14px;
+        padding: 8px;
+        border: 1px solid rgba(255, 255, 255, 0.08);
+    }}
+
+    hr, .stDivider {{
+        border-color: rgba(255, 255, 255, 0.12) !important;
+    }}
+    </style>
+"""
@@ -0,0 +1,88 @@
+"""Trazas de Plotly para series largas (Semanas 3 y 4).
+
+Las graficas de planeacion crecen con el horizonte y el numero de
+centros de trabajo o SKUs. Estas funciones arman las trazas de modo que
+el JSON de la figura y el tiempo de dibujo no crezcan con los datos:
+
+* ``line`` reduce la serie en el servidor (``planeacion.muestreo``) a
+  unos puntos por pixel del ancho de la grafica.
+* Arriba de ``WEBGL_POINTS`` puntos se usa ``Scattergl`` (WebGL) en
+  lugar de ``Scatter`` (SVG).
+* Los arreglos se envian como numpy de tipo compacto; Plotly los
+  serializa como arreglos tipados en base64 en lugar de listas de texto.
+* ``SerializedFigure`` guarda una figura ya validada como JSON, para que
+  ``st.plotly_chart`` no la vuelva a validar ni a codificar en cada rerun.
+"""
+
+import json
+
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from planeacion.muestreo import compact, downsample
+
+# Ancho supuesto (pixeles) de una grafica a todo lo ancho de la pagina; las
+# que van en columnas pasan el suyo.
+WIDTH = 1200
+WEBGL_POINTS = 2_000
+
+# Argumentos de la traza con un valor por punto: se recortan junto con x, y.
+_PER_POINT = ("text", "hovertext", "customdata")
+
+
+def _scatter(count: int):
+    return go.Scattergl if count > WEBGL_POINTS else go.Scatter
+
+
+def line(x, y, width: int = WIDTH, method: str = "lttb", **kwargs):
+    """Traza de linea de ``y`` contra ``x`` (``None``: 1, 2, ...) con a lo mas
+    un punto por pixel (dos con ``method="min_max"``, minimo y maximo)."""
+    y = np.asarray(y, dtype=np.float64)
+    x = np.arange(1, len(y) + 1) if x is None else np.asarray(x)
+    n_out = width * (2 if method == "min_max" else 1)
+    if len(y) > n_out:
+        keep = downsample(y, n_out, x, method)
+        for name in _PER_POINT:
+            if name in kwargs and np.ndim(kwargs[name]) and len(kwargs[name]) == len(y):
+                kwargs[name] = np.asarray(kwargs[name])[keep]
+        x, y = x[keep], y[keep]
+    return _scatter(len(y))(x=compact(x), y=compact(y), **kwargs)
+
+
+def markers(x, y, **kwargs):
+    """Nube de puntos sin reducir (cada punto es un candidato)."""
+    y = np.asarray(y)
+    return _scatter(len(y))(x=compact(x), y=compact(y), mode="markers", **kwargs)
+
+
+def bars(x, y, **kwargs):
+    """Barras con arreglos compactos; una barra por categoria."""
+    return go.Bar(x=compact(x), y=compact(y), **kwargs)
+
+
+class SerializedFigure(go.Figure):
+    """Figura ya validada y serializada (arreglos en base64).
+
+    ``st.plotly_chart`` convierte la figura con ``to_dict`` y la vuelve a
+    codificar: aqui ``to_dict`` solo decodifica el JSON guardado, cuyos
+    arreglos ya son texto. ``nbytes`` es el tamano de ese JSON. La figura
+    queda vacia para Plotly: no debe modificarse.
+    """
+
+    def __init__(self, figure):
+        super().__init__()
+        self._json = pio.to_json(figure, validate=False)
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._json)
+
+    def to_dict(self) -> dict:
+        return json.loads(self._json)
+
+    def to_plotly_json(self) -> dict:
+        return self.to_dict()
+
+    def to_json(self, *args, **kwargs) -> str:
+        return self._json
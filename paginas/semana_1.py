@@ -0,0 +1,186 @@
+"""Semana 1: linea de tiempo historica.
+
+Los periodos viven en ``assets/semana_1_timeline.json`` (o ``.yaml`` /
+``.yml``): una lista con ``id``, ``start``, ``end`` (vacio: hasta hoy),
+``title``, ``summary``, ``detail`` (Markdown) y ``keywords``. La grafica
+recibe solo una ventana de ``WINDOW`` periodos con su periodo, titulo y
+resumen; el analisis detallado de un periodo se envia hasta que se hace
+clic en su nodo.
+"""
+
+import json
+import textwrap
+from pathlib import Path
+
+import plotly.graph_objects as go
+import streamlit as st
+
+from paginas.comun import asset_file, cached_figure
+from paginas.estilo import COLOR_PRIMARY, COLOR_TERTIARY
+from planeacion.medicion import TRACER
+
+ASSETS_DIR = Path(__file__).resolve().parent.parent / "assets"
+TIMELINE = "semana_1_timeline"
+SUFFIXES = (".json", ".yaml", ".yml")
+FIELDS = ("id", "start", "title", "summary", "detail")
+WINDOW = 5
+
+
+def _timeline_path():
+    for suffix in SUFFIXES:
+        candidate = ASSETS_DIR / f"{TIMELINE}{suffix}"
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def _read_timeline(path):
+    text = path.read_text(encoding="utf-8")
+    if path.suffix == ".json":
+        periods = json.loads(text)
+    else:
+        try:
+            import yaml
+        except ImportError:
+            raise ValueError("Se necesita PyYAML para leer la linea de tiempo en YAML.") from None
+        try:
+            periods = yaml.safe_load(text)
+        except yaml.YAMLError as exc:
+            raise ValueError(str(exc)) from None
+    if not isinstance(periods, list) or not periods:
+        raise ValueError("El archivo debe contener una lista de periodos.")
+    for number, period in enumerate(periods, start=1):
+        missing = [field for field in FIELDS if field not in period]
+        if missing:
+            raise ValueError(f"Al periodo {number} le faltan los campos: {', '.join(missing)}")
+    ids = [period["id"] for period in periods]
+    if len(set(ids)) != len(ids):
+        raise ValueError("Hay periodos con el mismo id.")
+    return sorted(periods, key=lambda period: period["start"])
+
+
+def _end(period):
+    return period["end"] if period.get("end") is not None else "hoy"
+
+
+def _years(period):
+    return f"{period['start']}–{_end(period)}"
+
+
+def _timeline_figure(window, selected):
+    positions = list(range(len(window)))
+    figure = go.Figure()
+    figure.add_trace(go.Scatter(
+        x=[-0.5, len(window) - 0.5], y=[0, 0], mode="lines", line=dict(color="#bdc3c7", width=4),
+        hoverinfo="skip", showlegend=False,
+    ))
+    figure.add_trace(go.Scatter(
+        x=positions,
+        y=[0] * len(window),
+        mode="markers+text",
+        customdata=[period["id"] for period in window],
+        text=[f"<b>{_years(period)}</b>" for period in window],
+        textposition="top center",
+        hovertext=[textwrap.fill(period["summary"], 45).replace("\n", "<br>") for period in window],
+        hovertemplate="%{hovertext}<extra></extra>",
+        marker=dict(
+            size=38,
+            color=[COLOR_TERTIARY if period["id"] == selected else COLOR_PRIMARY for period in window],
+            line=dict(color="#ffffff", width=3),
+        ),
+        showlegend=False,
+    ))
+    for position, period in zip(positions, window):
+        figure.add_annotation(
+            x=position, y=-0.35, text=textwrap.fill(period["title"], 18).replace("\n", "<br>"),
+            showarrow=False, yanchor="top",
+        )
+    figure.update_layout(
+        height=320, margin=dict(t=10, l=10, r=10, b=10), dragmode=False,
+        xaxis=dict(visible=False, range=[-0.6, len(window) - 0.4], fixedrange=True),
+        yaxis=dict(visible=False, range=[-1.2, 0.8], fixedrange=True),
+    )
+    return figure
+
+
+def _open_period():
+    # Clic en un nodo: su analisis se muestra debajo de la grafica.
+    points = st.session_state["semana_1_grafica"].selection.points
+    if points and points[0].get("customdata") is not None:
+        st.session_state["semana_1_periodo"] = points[0]["customdata"]
+
+
+def _choose_period():
+    st.session_state["semana_1_periodo"] = st.session_state["semana_1_elegir"]
+
+
+@st.fragment
+def _timeline(path):
+    # Fragmento: moverse por la linea de tiempo o abrir un periodo solo vuelve
+    # a ejecutar este panel.
+    try:
+        with TRACER.span("semana_1/linea_de_tiempo"):
+            periods = asset_file(path, _read_timeline)
+    except ValueError as exc:
+        st.error(f"No fue posible leer `{path.name}`: {exc}")
+        return
+    first = 0
+    if len(periods) > WINDOW:
+        first = st.select_slider(
+            "Periodos", options=range(len(periods) - WINDOW + 1),
+            format_func=lambda i: f"{periods[i]['start']}–{_end(periods[i + WINDOW - 1])}",
+        )
+    window = periods[first:first + WINDOW]
+    selected = st.session_state.get("semana_1_periodo")
+
+    stat = path.stat()
+    st.plotly_chart(
+        cached_figure((str(path), stat.st_mtime_ns, stat.st_size, first, selected), _timeline_figure, window, selected),
+        use_container_width=True, key="semana_1_grafica", selection_mode="points", on_select=_open_period,
+        config={"displayModeBar": False},
+    )
+    titles = {period["id"]: f"{_years(period)} · {period['title']}" for period in window}
+    st.selectbox(
+        "Periodo", list(titles), index=None, format_func=titles.get, key="semana_1_elegir",
+        placeholder="Elija un periodo (o haga clic en su nodo)", on_change=_choose_period,
+    )
+
+    period = next((period for period in periods if period["id"] == selected), None)
+    if period is None:
+        st.info("Haga clic en un nodo de la línea de tiempo para ver el análisis detallado del período.")
+        return
+    st.markdown(f"#### {period['title']} ({_years(period)})")
+    st.markdown(period["detail"])
+    if period.get("keywords"):
+        st.caption("Palabras clave: " + ", ".join(period["keywords"]))
+
+
+def render():
+    st.markdown("## Semana 1: Conceptos Iniciales - Línea de Tiempo Histórica")
+    
+    st.subheader("Introducción")
+    st.markdown("""
+    La administración de operaciones ha evolucionado significativamente a lo largo de más de 250 años. Desde los principios de la 
+    manufactura artesanal hasta la automatización digital contemporánea, cada era ha dejado su huella en cómo planificamos y controlamos 
+    la producción. Esta semana exploraremos cómo los conceptos fundamentales de la planeación se han desarrollado, permitiéndonos comprender 
+    por qué los métodos modernos son efectivos.
+    """)
+    
+    st.subheader("Desarrollo")
+    st.markdown("""Haga clic en los nodos circulares de la línea de tiempo para desplegar el análisis detallado de cada período.""")
+
+    path = _timeline_path()
+    if path is None:
+        st.error("No se encontro el archivo de linea de tiempo. Verifique la carpeta assets.")
+    else:
+        _timeline(path)
+    
+    st.divider()
+    st.subheader("Conclusión y Reflexión del Aprendizaje")
+    st.markdown("""
+    La evolución histórica de la administración de operaciones demuestra que cada innovación surgió en respuesta a desafíos específicos 
+    de su época. La Revolución Industrial introdujo la producción en serie, el fordismo revolucionó con la estandarización, la era post-guerra 
+    trajo la gestión de la calidad, y la era digital ha integrado sistemas en tiempo real. Entender esta progresión nos permite apreciar que 
+    los métodos contemporáneos de planeación no surgieron del vacío, sino como refinamientos iterativos de principios fundamentales. 
+    La pregunta crítica para la ingeniería moderna es: ¿cómo integramos la flexibilidad digital con la eficiencia de los sistemas clásicos?
+    """)
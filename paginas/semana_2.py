@@ -0,0 +1,307 @@
+"""Semana 2: inventarios, modelos de optimizacion y control."""
+
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+from paginas.comun import background_job, cached_figure, data_store, local_workbook, result_cache, skus_demo
+from paginas.estilo import COLOR_SECONDARY, COLOR_TERTIARY
+from planeacion.inventario import inventory_policy, policy_summary
+from planeacion.multiarticulo import abc_xyz, constrained_eoq
+from planeacion.persistencia import content_key
+from planeacion.sensibilidad import SensitivityCache, inputs_key, tornado
+from planeacion.simulacion import simulate
+
+
+@st.cache_data(show_spinner="Calculando politica de inventario...")
+def _inventory_policy(skus):
+    return inventory_policy(skus)
+
+
+@st.cache_data(show_spinner="Simulando politicas de inventario...")
+def _simulate(policy, replications, distribution, seed):
+    return result_cache().memoize(simulate)(
+        policy,
+        n_periods=52,
+        replications=replications,
+        demand_distribution=distribution,
+        seed=seed,
+        chunk_size=500,
+    )
+
+
+@st.cache_resource
+def _sensitivity_cache():
+    # Compartido entre sesiones: las rebanadas S x H ya calculadas se reutilizan.
+    return SensitivityCache()
+
+
+@st.cache_data(show_spinner=False)
+def _tornado(skus, change):
+    return tornado(skus, change)
+
+
+@st.cache_data(show_spinner="Resolviendo lotes con restricciones...")
+def _constrained_eoq(skus, budget_share, space_share):
+    # Los limites se expresan como fraccion de lo que requeriria el EOQ libre.
+    eoq = (2.0 * skus["demand"] * skus["S"] / skus["H"]) ** 0.5
+    budget = budget_share * float((skus["unit_cost"] * eoq).sum())
+    space = space_share * float((skus["unit_space"] * eoq).sum())
+    return constrained_eoq(skus, budget=budget, space=space)
+
+
+@st.cache_data(show_spinner=False)
+def _abc_xyz(skus):
+    return abc_xyz(skus)
+
+
+def _sensitivity_figure(penalty, factors, d_factor):
+    figure = go.Figure(data=go.Heatmap(
+        z=penalty,
+        x=[f"{h:.1f}" for h in factors],
+        y=[f"{s:.1f}" for s in factors],
+        colorscale="Reds",
+        colorbar=dict(title="% sobre optimo"),
+        hovertemplate="S x%{y} | H x%{x}<br>Penalizacion: %{z:.2f}%<extra></extra>",
+    ))
+    figure.update_layout(
+        title=f"Penalizacion por no re-optimizar el lote (D x{d_factor:.1f})",
+        xaxis_title="Factor H",
+        yaxis_title="Factor S",
+        height=420,
+    )
+    return figure
+
+
+def _tornado_figure(policy, change):
+    bars = _tornado(policy, change)
+    figure = go.Figure()
+    figure.add_trace(go.Bar(
+        y=bars["parameter"], x=bars["low"], orientation="h",
+        name=f"-{change:.0%}", marker_color=COLOR_SECONDARY,
+    ))
+    figure.add_trace(go.Bar(
+        y=bars["parameter"], x=bars["high"], orientation="h",
+        name=f"+{change:.0%}", marker_color=COLOR_TERTIARY,
+    ))
+    figure.update_layout(
+        title="Cambio en el costo anual con el EOQ base",
+        barmode="overlay",
+        xaxis_title="Cambio en costo ($)",
+        height=420,
+    )
+    return figure
+
+
+@st.fragment
+def _eoq_what_if(policy, key):
+    # Fragmento: mover estos controles solo vuelve a ejecutar este panel.
+    st.markdown("### Analisis de Sensibilidad del EOQ")
+    st.markdown(
+        "Costo anual del catalogo cuando S, H y D difieren de los valores con que se calculo el EOQ. "
+        "El mapa compara mantener el lote actual contra re-optimizarlo; el tornado muestra que "
+        "parametro mueve mas el costo."
+    )
+    factors = [round(0.5 + 0.1 * i, 1) for i in range(11)]
+    col_sens_1, col_sens_2 = st.columns([1, 2])
+    with col_sens_1:
+        d_factor = st.select_slider("Factor de demanda (D real / D estimada)", options=factors, value=1.0)
+        s_factor = st.select_slider("Factor del costo de pedir (S real / S estimado)", options=factors, value=1.0)
+        h_factor = st.select_slider("Factor del costo de mantener (H real / H estimado)", options=factors, value=1.0)
+        change = st.slider("Variacion del tornado", min_value=0.05, max_value=0.5, value=0.2, step=0.05)
+    try:
+        optimal, fixed = _sensitivity_cache().slice(policy, factors, factors, d_factor, key=key)
+    except ValueError as exc:
+        st.error(f"No fue posible calcular la sensibilidad: {exc}")
+        return
+    penalty = (fixed / optimal - 1.0) * 100.0
+    i_s, i_h = factors.index(s_factor), factors.index(h_factor)
+    with col_sens_1:
+        w1, w2 = st.columns(2)
+        w1.metric("Costo con el EOQ actual", f"${fixed[i_s, i_h]:,.0f}")
+        w2.metric("Costo re-optimizado", f"${optimal[i_s, i_h]:,.0f}", f"{-penalty[i_s, i_h]:.2f}%")
+    with col_sens_2:
+        st.plotly_chart(
+            cached_figure((key, d_factor), _sensitivity_figure, penalty, factors, d_factor), use_container_width=True
+        )
+    st.plotly_chart(
+        cached_figure((key, change), _tornado_figure, policy, change), use_container_width=True
+    )
+    st.caption(
+        f"Con D x{d_factor:.1f}, S x{s_factor:.1f} y H x{h_factor:.1f}, mantener el EOQ actual cuesta "
+        f"{penalty[i_s, i_h]:.2f}% mas que re-optimizar: el costo total es plano cerca del EOQ."
+    )
+
+
+def render():
+    st.markdown("## Semana 2: Inventarios - Modelos de Optimización y Control")
+    
+    st.subheader("Introducción")
+    st.markdown("""
+    La gestión de inventarios es uno de los pilares fundamentales de la planeación de la producción. Los inventarios representan un balance 
+    delicado: demasiados generan costos innecesarios, mientras que demasiado pocos resultan en faltantes y pérdida de clientes. 
+    Esta semana abordaremos los modelos matemáticos que permiten optimizar esta decisión crítica.
+    """)
+    
+    st.subheader("Desarrollo")
+    st.markdown("""
+    **Modelos Aplicados:**
+    
+    1. **EOQ (Economic Order Quantity):** Determina el lote económico que minimiza el costo total de inventario.
+    2. **Safety Stock:** Calcula el inventario de seguridad para protegerse contra variabilidad en la demanda.
+    3. **Cycle Stock:** Representa el inventario promedio durante el período de reorden.
+    
+    **Resolución de Ejercicios en Clase:**
+    
+    - Cálculo de EOQ para diferentes productos con demandas variadas
+    - Análisis de sensibilidad: impacto de cambios en costos de ordenar y mantener
+    - Determinación de puntos de reorden considerando lead time y variabilidad
+    - Evaluación de políticas de inventario para múltiples artículos con restricciones presupuestarias
+
+    """)
+
+    st.markdown("### Motor de Inventarios (EOQ, Safety Stock, Cycle Stock)")
+    st.markdown(
+        "Cargue un CSV con las columnas `demand` (anual), `S`, `H`, `lead_time` (semanas), "
+        "`sigma_demand` (semanal) y `service_level`, o genere un catalogo de ejemplo."
+    )
+    col_inv_1, col_inv_2 = st.columns([1, 2])
+    with col_inv_1:
+        n_skus = st.number_input("SKUs de ejemplo", min_value=10, max_value=500_000, value=1000, step=1000)
+    with col_inv_2:
+        skus_file = st.file_uploader("Tabla de SKUs (CSV)", type=["csv"], key="skus_semana_2")
+
+    local_skus = data_store().table("skus", "skus")
+    if skus_file is not None:
+        skus = pd.read_csv(skus_file)
+    elif local_skus is not None:
+        skus = local_skus
+        st.caption(f"Usando la tabla local `{data_store().path('skus').name}` ({len(skus):,} SKUs).")
+    else:
+        skus = skus_demo(int(n_skus))
+    try:
+        policy = _inventory_policy(skus)
+    except (KeyError, ValueError) as exc:
+        st.error(f"No fue posible calcular la politica de inventario: {exc}")
+    else:
+        summary = policy_summary(policy)
+        m1, m2, m3, m4 = st.columns(4)
+        m1.metric("SKUs", f"{summary['skus']:,}")
+        m2.metric("Inventario promedio", f"{summary['average_inventory']:,.0f}")
+        m3.metric("Safety Stock total", f"{summary['safety_stock']:,.0f}")
+        m4.metric("Costo total anual", f"${summary['total_cost']:,.0f}")
+        st.dataframe(policy.head(1000), use_container_width=True, hide_index=True)
+        st.caption("Se muestran los primeros 1,000 SKUs; el calculo se realiza sobre todo el catalogo.")
+
+        st.markdown("### Simulacion Monte Carlo del Nivel de Servicio")
+        st.markdown(
+            "Se simula la politica (s, Q) calculada arriba con demanda y lead time aleatorios para estimar "
+            "el fill rate, el nivel de servicio de ciclo y el costo de faltantes que realmente se obtienen."
+        )
+        col_mc_1, col_mc_2, col_mc_3 = st.columns(3)
+        with col_mc_1:
+            replications = st.select_slider("Replicas", options=[50, 100, 200, 500, 1000], value=100)
+        with col_mc_2:
+            distribution = st.selectbox("Distribucion de la demanda", ["normal", "gamma", "poisson"])
+        with col_mc_3:
+            seed = st.number_input("Semilla", min_value=0, value=2026, step=1)
+        col_mc_4, col_mc_5 = st.columns(2)
+        with col_mc_4:
+            run_simulation = st.toggle("Ejecutar simulacion")
+        with col_mc_5:
+            in_background = st.checkbox(
+                "En segundo plano", help="La simulacion corre en un proceso aparte y la pagina sigue respondiendo."
+            )
+        simulated = None
+        if run_simulation and in_background:
+            simulated = background_job(
+                "semana_2_simulacion",
+                content_key(policy, replications, distribution, int(seed)),
+                "Simulacion Monte Carlo",
+                simulate,
+                policy,
+                n_periods=52,
+                replications=replications,
+                demand_distribution=distribution,
+                seed=int(seed),
+                chunk_size=500,
+            )
+        elif run_simulation:
+            simulated = _simulate(policy, replications, distribution, int(seed))
+        if simulated is not None:
+            s1, s2, s3, s4 = st.columns(4)
+            s1.metric("Nivel de servicio objetivo", f"{policy['service_level'].mean():.1%}")
+            s2.metric("Nivel de servicio simulado", f"{simulated['cycle_service_level'].mean():.1%}")
+            s3.metric("Fill rate simulado", f"{simulated['fill_rate'].mean():.1%}")
+            s4.metric("Costo de faltantes / semana", f"${simulated['stockout_cost'].sum():,.0f}")
+            st.dataframe(
+                pd.concat([policy.filter(["sku", "service_level"]), simulated], axis=1).head(1000),
+                use_container_width=True,
+                hide_index=True,
+            )
+
+        _eoq_what_if(policy, inputs_key(policy))
+
+        st.markdown("### Politica Multi-articulo con Restricciones")
+        st.markdown(
+            "Lotes de todo el catalogo cuando la inversion en inventario y el espacio de almacen son limitados. "
+            "Requiere las columnas `unit_cost` y `unit_space`; los limites se fijan como porcentaje de lo que "
+            "usaria el EOQ sin restricciones."
+        )
+        col_lim_1, col_lim_2 = st.columns(2)
+        with col_lim_1:
+            budget_share = st.slider("Presupuesto disponible (%)", min_value=10, max_value=100, value=70, step=5)
+        with col_lim_2:
+            space_share = st.slider("Espacio disponible (%)", min_value=10, max_value=100, value=80, step=5)
+        try:
+            constrained = _constrained_eoq(policy, budget_share / 100, space_share / 100)
+            classified = _abc_xyz(policy)
+        except (KeyError, ValueError) as exc:
+            st.error(f"No fue posible calcular la politica con restricciones: {exc}")
+        else:
+            c1, c2, c3, c4 = st.columns(4)
+            c1.metric("Inversion en lotes", f"${constrained.budget_used:,.0f}")
+            c2.metric("Espacio ocupado", f"{constrained.space_used:,.0f}")
+            c3.metric("Multiplicadores (presupuesto, espacio)",
+                      f"{constrained.budget_multiplier:.3f} / {constrained.space_multiplier:.3f}")
+            c4.metric("Costo adicional anual", f"${constrained.cost_increase:,.0f}")
+
+            matrix = pd.crosstab(classified["abc"], classified["xyz"]).reindex(
+                index=list("ABC"), columns=list("XYZ"), fill_value=0
+            )
+            value_share = classified.groupby("abc")["annual_value"].sum() / classified["annual_value"].sum()
+            col_cls_1, col_cls_2 = st.columns([1, 2])
+            with col_cls_1:
+                st.markdown("**Matriz ABC / XYZ (numero de SKUs)**")
+                st.dataframe(matrix, use_container_width=True)
+                st.caption(
+                    "Valor anual por clase: "
+                    + ", ".join(f"{label} {share:.0%}" for label, share in value_share.items())
+                )
+            with col_cls_2:
+                by_class = (
+                    constrained.policy.assign(abc_xyz=classified["abc_xyz"].to_numpy())
+                    .groupby("abc_xyz")[["eoq", "eoq_constrained", "total_cost", "unconstrained_cost"]]
+                    .sum()
+                    .reset_index()
+                )
+                st.dataframe(by_class, use_container_width=True, hide_index=True)
+
+    st.markdown("**Hoja de Calculo (Semana 2):**")
+    st.markdown(
+        "Liga del archivo editable: "
+        "https://docs.google.com/spreadsheets/d/1kHWG78i48QyYPmPU9v-0kOSGTHMTFRi-KWRVQucJ-lk/edit?gid=89536769#gid=89536769"
+    )
+    st.markdown(
+        "Copia local de la hoja de calculo (carpeta `datos`); se vuelve a leer solo cuando el archivo cambia."
+    )
+    local_workbook("hoja_semana_2")
+    
+    st.divider()
+    st.subheader("Conclusión y Reflexión del Aprendizaje")
+    st.markdown("""
+    Los modelos de optimización de inventarios demuestran que la decisión sobre "cuánto producir" no es arbitraria, sino que puede ser 
+    sustentada matemáticamente. Sin embargo, en la práctica, muchas variables (cambios de mercado, estacionalidad, disponibilidad de proveedores) 
+    hacen que estos modelos clásicos sean puntos de partida, no soluciones finales. La verdadera habilidad del ingeniero de producción es 
+    reconocer cuándo se justifica alejarse de los modelos teóricos y adaptar la estrategia a la realidad operativa.
+    """)
@@ -0,0 +1,537 @@
+"""Semana 3: sistema de planeacion, recursos y estructura de costos."""
+
+import functools
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+from paginas.comun import (
+    asset_cache, background_job, cached_figure, data_store, explode_plan, local_workbook, mrp_demo, result_cache,
+    skus_demo,
+)
+from paginas.estilo import COLOR_PRIMARY, COLOR_SECONDARY, COLOR_TERTIARY
+from paginas.graficas import bars, line, markers
+from planeacion.agregada import COST_COLUMNS, compare_strategies, scenarios
+from planeacion.costos import candidate_plans, cheapest_plan, evaluate_plans, pareto_frontier
+from planeacion.crp import CapacityProfile, capacity_requirements, level_load, operation_loads
+from planeacion.ejemplos import demo_aggregate, demo_capacity, demo_hierarchy, demo_routings
+from planeacion.jerarquia import OTHERS, Hierarchy
+from planeacion.medicion import TRACER
+
+AGGREGATE_SCENARIOS = {"Base": 1.0, "Demanda alta (+20%)": 1.2, "Demanda baja (-15%)": 0.85}
+
+
+@st.cache_data(show_spinner=False)
+def _aggregate_inputs(n_families, scenario_names):
+    families, demand = demo_aggregate(n_families)
+    return scenarios(families, demand, {name: AGGREGATE_SCENARIOS[name] for name in scenario_names})
+
+
+@st.cache_data(show_spinner="Optimizando planes agregados...")
+def _aggregate_plans(n_families, scenario_names):
+    families, demand = _aggregate_inputs(n_families, scenario_names)
+    return result_cache().memoize(compare_strategies)(families, demand)
+
+
+@st.cache_data(show_spinner="Evaluando planes candidatos...")
+def _plan_costs(n_skus):
+    plans = candidate_plans(np.linspace(0.50, 0.999, 60), np.linspace(0.25, 3.0, 56))
+    evaluated = evaluate_plans(skus_demo(n_skus), plans)
+    return evaluated, pareto_frontier(evaluated)
+
+
+@st.cache_data(show_spinner=False)
+def _demo_crp(n_items, horizon, n_work_centers):
+    items, bom, mps = mrp_demo(n_items, horizon)
+    orders = explode_plan(items, bom, mps, horizon).orders()
+    routings = demo_routings(items["item"], n_work_centers)
+    capacity = demo_capacity(operation_loads(orders, routings))
+    return orders, routings, capacity
+
+
+@st.cache_data(show_spinner="Calculando carga de capacidad...")
+def _capacity_profile(n_items, horizon, n_work_centers):
+    orders, routings, capacity = _demo_crp(n_items, horizon, n_work_centers)
+    return capacity_requirements(orders, routings, capacity, horizon)
+
+
+@st.cache_data(show_spinner="Nivelando carga con capacidad finita...")
+def _load_leveling(n_items, horizon, n_work_centers, capacity_level=100):
+    orders, routings, capacity = _demo_crp(n_items, horizon, n_work_centers)
+    capacity = capacity.assign(capacity=capacity["capacity"] * (capacity_level / 100.0))
+    return result_cache().memoize(level_load)(orders, routings, capacity, horizon)
+
+
+# Mapa conceptual del sistema como tabla de jerarquia; solo las hojas traen
+# valor propio y los totales de cada rama se acumulan al construirla.
+CONCEPT_MAP = pd.DataFrame([
+    ("SISTEMA DE PLANEACION DE LA PRODUCCION", "", 0, "#2c3e50"),
+    ("ELEMENTOS ESTRATEGICOS", "SISTEMA DE PLANEACION DE LA PRODUCCION", 0, COLOR_PRIMARY),
+    ("GESTION DE RECURSOS", "SISTEMA DE PLANEACION DE LA PRODUCCION", 0, COLOR_SECONDARY),
+    ("COSTOS Y GASTOS", "SISTEMA DE PLANEACION DE LA PRODUCCION", 0, COLOR_TERTIARY),
+    ("Planeacion Agregada (6-18 meses)", "ELEMENTOS ESTRATEGICOS", 10, "#d6e6f2"),
+    ("Programa Maestro (MPS)", "ELEMENTOS ESTRATEGICOS", 8, "#d6e6f2"),
+    ("Estrategia de Operaciones", "ELEMENTOS ESTRATEGICOS", 9, "#d6e6f2"),
+    ("Objetivos Organizacionales (ROI, Share)", "ELEMENTOS ESTRATEGICOS", 8, "#d6e6f2"),
+    ("Capacidad (Instalaciones)", "GESTION DE RECURSOS", 12, "#d9f2e3"),
+    ("Mano de Obra (Fuerza Laboral)", "GESTION DE RECURSOS", 12, "#d9f2e3"),
+    ("Materiales (MRP / BOM)", "GESTION DE RECURSOS", 11, "#d9f2e3"),
+    ("Costos de Inventario", "COSTOS Y GASTOS", 10, "#f5d6d6"),
+    ("Costos de Produccion", "COSTOS Y GASTOS", 10, "#f5d6d6"),
+    ("Costos de Faltantes", "COSTOS Y GASTOS", 10, "#f5d6d6"),
+], columns=["id", "parent", "value", "color"])
+
+HIERARCHY_SOURCES = {
+    "archivo": "Archivo local (datos/jerarquia)",
+    "concepto": "Mapa conceptual del sistema",
+    "demo": "Arbol de costos de ejemplo",
+}
+
+
+def _concept_hierarchy():
+    return Hierarchy.from_table(CONCEPT_MAP)
+
+
+def _demo_hierarchy(n_nodes):
+    return Hierarchy.from_table(demo_hierarchy(n_nodes))
+
+
+def _hierarchy(source, n_nodes=None):
+    """``(clave, jerarquia)`` de la fuente elegida. La jerarquia (CSR y
+    totales acumulados) se arma una vez por contenido y se comparte entre
+    sesiones."""
+    if source == "archivo":
+        path = data_store().path("jerarquia")
+        stat = path.stat()
+        key = ("archivo", str(path), stat.st_mtime_ns, stat.st_size)
+        build, args = Hierarchy.from_table, (data_store().table("jerarquia", "hierarchy"),)
+    elif source == "demo":
+        key, build, args = ("demo", n_nodes), _demo_hierarchy, (n_nodes,)
+    else:
+        key, build, args = ("concepto",), _concept_hierarchy, ()
+    with TRACER.span(f"jerarquia/{source}"):
+        return key, asset_cache().value(key, build, *args, size=lambda hierarchy: hierarchy.nbytes)
+
+
+def _hierarchy_figure(view, colors):
+    # Las ramas con niveles que no se enviaron se marcan con una flecha.
+    figure = go.Figure(go.Sunburst(
+        ids=view["id"],
+        labels=view["label"] + np.where(view["more"], " ▸", ""),
+        parents=view["parent"],
+        values=view["value"],
+        customdata=view[["children"]],
+        branchvalues="total",
+        marker=dict(colors=view["id"].map(colors) if colors else None, line=dict(color="#ffffff", width=2)),
+        insidetextorientation="radial",
+        hovertemplate="%{label}<br>Valor: %{value:,.0f}<br>Subniveles directos: %{customdata[0]:,}<extra></extra>",
+    ))
+
+    figure.update_layout(
+        margin=dict(t=10, l=10, r=10, b=10),
+        height=600
+    )
+    return figure
+
+
+def _set_focus(key, focus):
+    st.session_state["jerarquia_foco"] = (key, focus)
+
+
+def _drill_down(key, hierarchy, focus):
+    # Clic en la grafica: un sector con hijos pasa a ser el foco; el centro sube un nivel.
+    points = st.session_state["jerarquia_grafica"].selection.points
+    node = points[0].get("id") if points else None
+    if node is None or node.startswith(OTHERS):
+        return
+    if node == focus:
+        parent = hierarchy.parent[hierarchy.position(node)]
+        _set_focus(key, hierarchy.ids[parent] if parent >= 0 else None)
+    elif hierarchy.n_children([hierarchy.position(node)])[0]:
+        _set_focus(key, node)
+
+
+def _choose_focus(key):
+    _set_focus(key, st.session_state["jerarquia_bajar"])
+
+
+@st.fragment
+def _hierarchy_explorer():
+    # Fragmento: navegar la jerarquia solo vuelve a ejecutar este panel. El
+    # navegador recibe unicamente los niveles cercanos al foco.
+    sources = {name: label for name, label in HIERARCHY_SOURCES.items()
+               if name != "archivo" or data_store().path("jerarquia") is not None}
+    source = st.radio("Jerarquia", list(sources), format_func=sources.get, horizontal=True)
+    n_nodes = None
+    if source == "demo":
+        n_nodes = st.select_slider("Nodos del arbol", options=[10_000, 25_000, 50_000, 100_000], value=50_000)
+    try:
+        key, hierarchy = _hierarchy(source, n_nodes)
+    except (KeyError, ValueError) as exc:
+        st.error(f"No fue posible leer la jerarquia de `{data_store().path('jerarquia').name}`: {exc}")
+        key, hierarchy = _hierarchy("concepto")
+    depth = st.slider("Niveles visibles debajo del foco", min_value=1, max_value=4, value=2)
+
+    stored = st.session_state.get("jerarquia_foco")
+    focus = stored[1] if stored is not None and stored[0] == key else None
+    with TRACER.span("jerarquia/vista"):
+        view = hierarchy.view(focus, depth)
+
+    path = hierarchy.path(focus) if focus is not None else []
+    col_path, col_up, col_root = st.columns([4, 1, 1])
+    with col_path:
+        labels = [hierarchy.labels[hierarchy.position(node)] for node in path]
+        st.caption("Foco: " + (" › ".join(labels) if labels else "raiz"))
+    parent = path[-2] if len(path) > 1 else None
+    col_up.button("Subir un nivel", on_click=_set_focus, args=(key, parent), disabled=focus is None,
+                  use_container_width=True)
+    col_root.button("Raiz", on_click=_set_focus, args=(key, None), disabled=focus is None, use_container_width=True)
+
+    branches = view[(view["depth"] == view["depth"].min() + 1) & (view["children"] > 0)]
+    branches = branches[~branches["id"].str.startswith(OTHERS)].nlargest(500, "value")
+    if len(branches):
+        st.selectbox(
+            "Bajar a", branches["id"], index=None, format_func=dict(zip(branches["id"], branches["label"])).get,
+            placeholder="Elija una rama (o haga clic en ella en la grafica)", key="jerarquia_bajar",
+            on_change=_choose_focus, args=(key,),
+        )
+
+    colors = dict(zip(CONCEPT_MAP["id"], CONCEPT_MAP["color"])) if key == ("concepto",) else None
+    st.plotly_chart(
+        cached_figure((key, focus, depth), _hierarchy_figure, view, colors),
+        use_container_width=True, key="jerarquia_grafica", selection_mode="points",
+        on_select=functools.partial(_drill_down, key, hierarchy, focus),
+    )
+    st.caption(
+        f"{len(view):,} de {len(hierarchy):,} nodos enviados al navegador; ▸ marca las ramas con mas "
+        "niveles (clic para bajar, clic en el centro para subir)."
+    )
+
+
+def _funnel_figure():
+    figure = go.Figure(go.Funnel(
+        y = ["Vision Corporativa", "Estrategia Operaciones", "Planeacion Agregada", "Programa Maestro (MPS)", "Ejecucion (Piso)"],
+        x = [100, 80, 60, 40, 20],
+        textinfo = "value+percent initial",
+        marker = {"color": [COLOR_PRIMARY, "#1a5276", "#2980b9", "#5499c7", "#a9cce3"]}
+    ))
+    figure.update_layout(title="Jerarquia de la Planeacion (Despliegue)", showlegend=False, height=350)
+    return figure
+
+
+def _aggregate_figure(totals):
+    cost_labels = {
+        "hiring": "Contratacion", "firing": "Despidos", "regular_labor": "Mano de obra regular",
+        "overtime": "Tiempo extra", "subcontract": "Subcontratacion", "inventory": "Inventario",
+        "backorder": "Pedidos atrasados",
+    }
+    figure = go.Figure()
+    for column, label in cost_labels.items():
+        figure.add_trace(bars(
+            x=[f"{strategy}<br>{scenario}" for scenario, strategy in totals.index],
+            y=totals[column],
+            name=label,
+        ))
+    figure.update_layout(
+        barmode="stack", title="Costo total del horizonte por estrategia y escenario", height=420,
+        yaxis_title="Costo ($)",
+    )
+    return figure
+
+
+def _plan_figure(agg_demand, agg_plans, row):
+    figure = go.Figure()
+    months = [f"Mes {m}" for m in range(1, agg_demand.shape[1] + 1)]
+    figure.add_trace(bars(x=months, y=agg_demand[row], name="Demanda", marker_color="#a9cce3"))
+    for name, plan in agg_plans.items():
+        monthly = plan.family(row)
+        figure.add_trace(line(
+            x=months, y=monthly["regular"] + monthly["overtime"] + monthly["subcontract"],
+            mode="lines+markers", name=f"Produccion {name}",
+        ))
+    figure.update_layout(title="Demanda y produccion mensual por estrategia", height=380)
+    return figure
+
+
+def _crp_figure(wc_profile, work_center):
+    categories = [f"Semana {t + 1}" for t in wc_profile["period"]]
+    overloaded = wc_profile["overload"] > 1e-6
+    figure = go.Figure()
+    figure.add_trace(bars(
+        x=categories,
+        y=wc_profile["load"],
+        name='Carga Requerida (Demanda)',
+        marker_color=np.where(overloaded, COLOR_TERTIARY, COLOR_SECONDARY),
+    ))
+    figure.add_trace(line(x=categories, y=wc_profile["capacity"], method="min_max", mode='lines', name='Capacidad Disponible', line=dict(color='red', width=3, dash='dash')))
+
+    figure.update_layout(title=f"Analisis CRP (Capacity Requirements Planning) - {work_center}", height=350)
+    return figure
+
+
+def _cost_figure(chosen):
+    labels_cost = ['Materia Prima', 'Mano de Obra', 'Mantenimiento Inv (H)', 'Costos de Pedir (S)', 'Faltantes']
+    values_cost = [chosen[c] for c in ("materials", "labor", "holding", "ordering", "shortage")]
+    colors_cost = [COLOR_TERTIARY, '#e74c3c', '#ec7063', '#f1948a', '#fadbd8']
+
+    figure = go.Figure(data=[go.Pie(labels=labels_cost, values=values_cost, hole=.4, marker_colors=colors_cost)])
+    figure.update_layout(title="Distribucion del Costo Logistico del Plan Elegido", height=350)
+    return figure
+
+
+def _pareto_figure(evaluated, frontier, chosen):
+    relevant = evaluated["holding"] + evaluated["ordering"] + evaluated["shortage"]
+    figure = go.Figure()
+    figure.add_trace(markers(
+        x=relevant, y=evaluated["fill_rate"], name="Planes candidatos",
+        marker=dict(color="#95a5a6", size=4, opacity=0.5),
+    ))
+    figure.add_trace(line(
+        x=frontier["holding"] + frontier["ordering"] + frontier["shortage"], y=frontier["fill_rate"],
+        mode="lines+markers", name="Frontera de Pareto", line=dict(color=COLOR_PRIMARY, width=3),
+    ))
+    figure.add_trace(go.Scatter(
+        x=[chosen["holding"] + chosen["ordering"] + chosen["shortage"]], y=[chosen["fill_rate"]],
+        mode="markers", name="Plan elegido", marker=dict(color=COLOR_TERTIARY, size=14, symbol="star"),
+    ))
+    figure.update_layout(
+        title=f"Trade-off Nivel de Servicio vs Costo Relevante ({len(evaluated):,} planes)",
+        xaxis_title="Costo relevante anual: H + S + faltantes ($)", yaxis_title="Fill rate", height=420,
+    )
+    return figure
+
+
+
+@st.fragment
+def _capacity_what_if():
+    # Fragmento: cambiar el centro, la nivelacion o la capacidad solo vuelve
+    # a ejecutar este panel.
+    profile = _capacity_profile(2000, 24, 8)
+    bottleneck = profile.work_centers[int((profile.load > profile.capacity).sum(axis=1).argmax())]
+    work_center = st.selectbox("Centro de trabajo", profile.work_centers, index=profile.work_centers.get_loc(bottleneck))
+    finite = st.checkbox("Nivelar con capacidad finita (adelantar ordenes a semanas con holgura)")
+    capacity_level = st.slider("Nivel de capacidad (% de la instalada)", min_value=70, max_value=130, value=100, step=5)
+    if finite:
+        leveling = _load_leveling(2000, 24, 8, capacity_level)
+        profile = leveling.leveled
+    else:
+        # La carga no depende de la capacidad: solo se escala el techo.
+        profile = CapacityProfile(profile.work_centers, profile.load, profile.capacity * (capacity_level / 100.0))
+    wc_profile = profile.work_center(work_center)
+    categories = [f"Semana {t + 1}" for t in wc_profile["period"]]
+    overloaded = wc_profile["overload"] > 1e-6
+
+    st.plotly_chart(
+        cached_figure((2000, 24, 8, work_center, finite, capacity_level), _crp_figure, wc_profile, work_center),
+        use_container_width=True,
+    )
+    if overloaded.any():
+        weeks = ", ".join(c for c, o in zip(categories, overloaded) if o)
+        st.caption(
+            f"Fig 2. Visualizacion de cuellos de botella: {weeks} excede(n) la capacidad instalada "
+            f"({wc_profile['overload'].sum():,.0f} h), requiriendo horas extra o nivelacion de carga."
+        )
+    else:
+        st.caption("Fig 2. Visualizacion de cuellos de botella: la carga del centro cabe en la capacidad instalada.")
+    if finite:
+        wc_moves = leveling.moves[leveling.moves["work_center"] == work_center]
+        st.caption(
+            f"Nivelacion: {len(wc_moves):,} movimientos adelantan {wc_moves['hours'].sum():,.0f} h en {work_center}; "
+            f"el tiempo extra solo cubre lo que no cabe en semanas anteriores."
+        )
+        with st.expander("Movimientos de ordenes propuestos"):
+            st.dataframe(wc_moves.round(2), use_container_width=True, hide_index=True)
+
+
+def render():
+    # ENCABEZADO ESPECÍFICO PARA SEMANA 3
+    col_header_1, col_header_2 = st.columns([3, 1])
+    with col_header_1:
+        st.title("SISTEMA INTEGRAL DE PLANEACIÓN DE LA PRODUCCIÓN")
+        st.markdown('<span class="subtitle-accent">Enfoque Sistémico: Estrategia, Recursos y Costos</span>', unsafe_allow_html=True)
+    
+    with col_header_2:
+        st.markdown("<br>", unsafe_allow_html=True)
+        st.markdown(
+            '<div class="author-card">'
+            '<div class="author-tag">Autor:<br>Ing. Jaime Silva Betancourt</div>'
+            '<div class="author-subtitle">Maestría en Ingeniería Industrial</div>'
+            '</div>',
+            unsafe_allow_html=True
+        )
+    
+    st.divider()
+    
+    st.markdown("""
+    ### Objetivo de la actividad
+    Elabora un esquema o mapa conceptual (o mapa mental) en el que representes el Sistema de Planeacion de la Produccion, destacando de manera clara principales elementos que se debe considerar:
+
+    - La integracion de los elementos estrategicos (planeacion agregada, estrategia de operaciones, objetivos organizacionales).
+    - Los elementos relacionados con la gestion de recursos (capacidad, mano de obra, materiales).
+    - Los aspectos vinculados a costos y gastos dentro del sistema de planeacion.
+    - Incluye palabras clave o breves descripciones que expliquen la funcion de cada elemento dentro del sistema.
+    """)
+
+    st.markdown("**Hoja de Calculo (MPS - Semana 3):**")
+    st.markdown(
+        "Liga del archivo editable: "
+        "https://docs.google.com/spreadsheets/d/1kHWG78i48QyYPmPU9v-0kOSGTHMTFRi-KWRVQucJ-lk/edit?gid=89536769#gid=89536769"
+    )
+    st.markdown(
+        "Copia local de la hoja de calculo (carpeta `datos`); se vuelve a leer solo cuando el archivo cambia."
+    )
+    local_workbook("hoja_semana_3")
+
+    st.subheader("1. Mapa Conceptual Jerarquico del Sistema")
+    st.markdown("""
+    Este diagrama interactivo presenta la jerarquia del sistema en formato tipo pastel.
+    Haga clic en cada seccion para desplegar los niveles inferiores y explorar la relacion entre decisiones.
+    La misma vista acepta jerarquias grandes (BOM, arboles de costos) desde `datos/jerarquia`
+    (CSV, Parquet o XLSX con columnas `id`, `parent`, `value` y, opcionalmente, `label`).
+    """)
+
+    _hierarchy_explorer()
+
+    st.divider()
+
+    st.subheader("2. Desglose Analitico y Visualizacion de Datos")
+    st.markdown("Analisis profundo de los tres pilares fundamentales, sustentado en teoria de operaciones.")
+
+    # --- ESTRATEGIA ---
+    col1, col2 = st.columns([1, 1])
+    
+    with col1:
+        st.markdown("### Alineacion Estrategica (Top-Down)")
+        st.markdown("""
+        <div class="big-font">
+        La planeacion de la produccion no es un evento aislado, sino la traduccion operativa de la vision empresarial.
+        Segun <b>Heizer y Render (2020)</b>, la estrategia de operaciones debe alinearse con la mision para generar una ventaja competitiva sostenible.
+        
+        * <b>Planeacion Agregada:</b> Equilibra la oferta y demanda a mediano plazo, definiendo niveles de produccion, inventario y mano de obra.
+        * <b>Objetivos Organizacionales:</b> Se traducen en KPIs como Nivel de Servicio y Rotacion de Activos.
+        </div>
+        """, unsafe_allow_html=True)
+        
+    with col2:
+        st.plotly_chart(cached_figure("funnel", _funnel_figure), use_container_width=True)
+        st.caption("Fig 1. El 'Embudo de Decision': Como la estrategia se refina hasta llegar a la orden de produccion.")
+
+    st.markdown("### Planeacion Agregada (6-18 meses)")
+    st.markdown(
+        "Comparacion de las estrategias de persecucion, nivelada y mixta (programa lineal de costo minimo) "
+        "para cada familia de productos y escenario de demanda en un horizonte de 18 meses."
+    )
+    col_agg_1, col_agg_2 = st.columns([1, 2])
+    with col_agg_1:
+        n_families = st.select_slider("Familias de productos", options=[10, 50, 100, 300], value=50)
+        scenario_names = st.multiselect("Escenarios", list(AGGREGATE_SCENARIOS), default=list(AGGREGATE_SCENARIOS))
+        agg_background = st.checkbox(
+            "En segundo plano", key="semana_3_agregada_fondo",
+            help="El programa lineal corre en un proceso aparte y la pagina sigue respondiendo.",
+        )
+    aggregate = None
+    if scenario_names:
+        families, agg_demand = _aggregate_inputs(n_families, tuple(scenario_names))
+        if agg_background:
+            aggregate = background_job(
+                "semana_3_agregada", (n_families, tuple(scenario_names)), "Planes agregados",
+                compare_strategies, families, agg_demand,
+            )
+        else:
+            aggregate = _aggregate_plans(n_families, tuple(scenario_names))
+    if aggregate is not None:
+        agg_table, agg_plans = aggregate
+        agg_table = agg_table.assign(scenario=pd.concat([families["scenario"]] * len(agg_plans), ignore_index=True))
+        totals = agg_table.groupby(["scenario", "strategy"], sort=False)[list(COST_COLUMNS)].sum()
+        agg_key = (n_families, tuple(scenario_names))
+        with col_agg_2:
+            st.plotly_chart(cached_figure(agg_key, _aggregate_figure, totals), use_container_width=True)
+
+        row = st.selectbox(
+            "Familia / escenario",
+            range(len(families)),
+            format_func=lambda i: f"{families['family'].iat[i]} - {families['scenario'].iat[i]}",
+        )
+        st.plotly_chart(
+            cached_figure(agg_key + (row,), _plan_figure, agg_demand, agg_plans, row), use_container_width=True
+        )
+        family_costs = agg_table.iloc[[row + k * len(families) for k in range(len(agg_plans))]]
+        best = family_costs.loc[family_costs["total"].idxmin(), "strategy"]
+        st.caption(
+            f"La estrategia de menor costo para {families['family'].iat[row]} ({families['scenario'].iat[row]}) es "
+            f"{best}: ${family_costs['total'].min():,.0f} en el horizonte."
+        )
+
+    st.divider()
+
+    # --- RECURSOS ---
+    col1, col2 = st.columns([1, 1])
+    
+    with col1:
+        st.markdown("### Gestion de la Capacidad y Materiales")
+        st.markdown("""
+        <div class="big-font">
+        La gestion de recursos busca asegurar la disponibilidad de los factores de produccion (4M: Materiales, Maquinas, Mano de obra, Metodos).
+        
+        * <b>Capacidad:</b> Determina el "techo" de produccion. Segun <b>Chase y Jacobs (2018)</b>, la planeacion debe considerar la eficiencia (OEE) y no solo la capacidad teorica.
+        * <b>Materiales (MRP):</b> Transforma los requerimientos brutos en netos mediante la Lista de Materiales (BOM) y el inventario disponible.
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        _capacity_what_if()
+
+    st.divider()
+
+    # --- COSTOS ---
+    col1, col2 = st.columns([1, 1])
+    
+    with col1:
+        st.markdown("### Estructura de Costos y Optimizacion")
+        st.markdown("""
+        <div class="big-font">
+        El objetivo final es minimizar el Costo Total Relevante. Existe un <i>Trade-off</i> constante entre nivel de servicio e inventario.
+        
+        * <b>Costos de Inventario (H):</b> Incluyen capital inmovilizado, seguros y obsolescencia. Representan entre el 15-40% del valor del producto al ano.
+        * <b>Costo de Faltantes:</b> Es el mas critico y dificil de medir (perdida de clientes y reputacion).
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        evaluated, frontier = _plan_costs(5000)
+        min_fill_rate = st.slider("Fill rate minimo del plan", min_value=0.90, max_value=0.999, value=0.98, step=0.001,
+                                  format="%.3f")
+        chosen = cheapest_plan(evaluated, min_fill_rate)
+        # El plan elegido es un renglon de la rejilla (fija para 5000 SKUs).
+        st.plotly_chart(cached_figure((5000, chosen.name), _cost_figure, chosen), use_container_width=True)
+        st.caption(
+            f"Fig 3. Plan de menor costo con fill rate de al menos {min_fill_rate:.1%}: nivel de servicio de ciclo "
+            f"{chosen['service_level']:.1%} y lotes de {chosen['lot_multiplier']:.2f} x EOQ. El mantenimiento (H) "
+            f"representa {chosen['holding'] / chosen['total']:.1%} del costo total."
+        )
+
+    st.plotly_chart(
+        cached_figure((5000, chosen.name), _pareto_figure, evaluated, frontier, chosen), use_container_width=True
+    )
+
+    st.divider()
+
+    with st.expander("Referencias Bibliograficas (Formato APA 7.0)", expanded=True):
+        st.markdown("""
+        * Chase, R. B., & Jacobs, F. R. (2018). *Administracion de operaciones: Produccion y cadena de suministros* (15.ª ed.). McGraw-Hill Education.
+        * Chopra, S., & Meindl, P. (2016). *Administracion de la cadena de suministro: Estrategia, planeacion y operacion* (6.ª ed.). Pearson Educacion.
+        * Heizer, J., Render, B., & Munson, C. (2020). *Principios de administracion de operaciones* (13.ª ed.). Pearson.
+        * Krajewski, L. J., Malhotra, M. K., & Ritzman, L. P. (2019). *Administracion de operaciones: Procesos y cadenas de valor* (12.ª ed.). Pearson.
+        """)
+    
+    st.divider()
+    st.subheader("Conclusión y Reflexión del Aprendizaje")
+    st.markdown("""
+    El análisis multidimensional del sistema de planeación revela una verdad fundamental: no existe una "época de oro" en la que se puede 
+    optimizar una sola variable (costo, tiempo, o calidad) sin afectar las demás. La excelencia operativa emerge de la comprensión profunda 
+    de estos tradeoffs y la capacidad de equilibrar objetivos competidores. Los roles de futuro en ingeniería industrial serán aquellos 
+    que puedan ver más allá de los números y entender las implicaciones humanas, ambientales y de mercado de sus decisiones. 
+    La tecnología (AI, IoT, blockchain) son herramientas poderosas, pero sin una comprensión sistemática, se vuelven ineficaces.
+    """)
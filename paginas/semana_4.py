@@ -0,0 +1,378 @@
+"""Semana 4: plan maestro de produccion (PMP) y MRP."""
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+from paginas.comun import (
+    background_job, cached_figure, data_store, explode_plan, local_workbook, mrp_demo, remembered, result_cache,
+)
+from paginas.estilo import COLOR_SECONDARY, COLOR_TERTIARY
+from paginas.graficas import WIDTH, line
+from planeacion import bullwhip, pronostico
+from planeacion.bullwhip import customer_demand, simulate_chain
+from planeacion.ejemplos import demo_demand_history, demo_lot_costs
+from planeacion.lotes import POLICIES, compare_policies
+from planeacion.mrp import explode, net_change
+from planeacion.persistencia import content_key
+
+
+@st.cache_data(show_spinner="Ajustando pronosticos...")
+def _forecast(n_series, method, horizon):
+    history = demo_demand_history(n_series)
+    if method == "best_fit":
+        return history, result_cache().memoize(pronostico.best_fit)(history, horizon, chunk_size=20_000)
+    return history, result_cache().memoize(pronostico.run)(history, method, horizon, chunk_size=20_000)
+
+
+@st.cache_data(show_spinner="Pronosticando el PMP...")
+def _forecast_mps(end_items, horizon):
+    # Historia de ejemplo por articulo final; el pronostico de mejor ajuste de
+    # cada uno es su PMP en el horizonte del MRP.
+    history = demo_demand_history(len(end_items))
+    fc = result_cache().memoize(pronostico.best_fit)(history, horizon, chunk_size=20_000)
+    return fc.to_mps(end_items)
+
+
+@st.cache_data(show_spinner="Comparando tecnicas de lotificacion...")
+def _compare_lot_sizing(items, net):
+    # Requerimientos netos de los articulos finales del plan ya explotado
+    # (tablas locales o de ejemplo); los costos S y H son de ejemplo.
+    S, H = demo_lot_costs(len(items))
+    costs, plans = compare_policies(net, S, H)
+    costs.insert(0, "item", items)
+    return costs, plans
+
+
+@st.cache_data(show_spinner="Simulando la cadena de suministro...")
+def _bullwhip(replications, n_echelons, lead_time, forecast, share_demand, negative_orders, policy, smoothing):
+    demand = customer_demand(replications, 104 + 10, mean=100.0, sigma=10.0, seed=2026)
+    chain = simulate_chain(
+        demand,
+        lead_times=[lead_time] * n_echelons,
+        forecast=forecast,
+        share_demand=share_demand,
+        negative_orders=negative_orders,
+        policy=policy,
+        smoothing=smoothing,
+    )
+    # Solo se conserva lo que se grafica: la cadena completa pesa decenas de MB.
+    return chain.amplification(), chain.orders[:, 0]
+
+
+def _net_change(plan, item, on_hand, lead_time, mps_period, mps_quantity):
+    return net_change(
+        plan,
+        mps=pd.DataFrame({"item": [item], "period": [mps_period - 1], "quantity": [mps_quantity]}),
+        on_hand={item: on_hand},
+        lead_time={item: lead_time},
+    )
+
+
+@st.fragment
+def _net_change_what_if(plan, item, horizon):
+    # Fragmento: editar el escenario solo vuelve a ejecutar este panel.
+    st.markdown("#### Regeneracion Net-Change (que pasa si...)")
+    st.markdown(
+        "Modifique el inventario disponible o el lead time del articulo seleccionado, o la cantidad del PMP "
+        "de un articulo final: solo se re-explotan el subarbol y los periodos afectados."
+    )
+    i_item = plan.index_of(item)
+    col_nc_1, col_nc_2, col_nc_3 = st.columns(3)
+    with col_nc_1:
+        new_on_hand = st.number_input("Inventario disponible", min_value=0.0, value=float(plan.on_hand[i_item]))
+    with col_nc_2:
+        new_lead_time = st.number_input("Lead time (semanas)", min_value=0, max_value=horizon, value=int(plan.lead_time[i_item]))
+    with col_nc_3:
+        mps_period = st.number_input("Semana del PMP", min_value=1, max_value=horizon, value=1)
+    mps_quantity = st.number_input(
+        "Cantidad del PMP en esa semana (solo articulos finales)",
+        min_value=0.0,
+        value=float(plan.independent[i_item, mps_period - 1]),
+    )
+
+    changed_plan, regenerated = remembered(
+        "semana_4_net_change",
+        (id(plan), item, new_on_hand, new_lead_time, mps_period, mps_quantity),
+        _net_change, plan, item, new_on_hand, new_lead_time, mps_period, mps_quantity,
+    )
+    st.caption(f"Articulos re-explotados: {len(regenerated):,} de {len(plan.items):,}.")
+    st.dataframe(changed_plan.record(item).round(1), use_container_width=True)
+
+
+def _forecast_figure(history, fc, series):
+    weeks_history = np.arange(1, history.shape[1] + 1)
+    weeks_forecast = np.arange(history.shape[1] + 1, history.shape[1] + fc.forecast.shape[1] + 1)
+    figure = go.Figure()
+    figure.add_trace(line(weeks_history, history[series], method="min_max", mode="lines", name="Demanda real", line=dict(color="#9cc5ff")))
+    figure.add_trace(line(weeks_history, fc.fitted[series], mode="lines", name="Ajuste", line=dict(color=COLOR_SECONDARY, dash="dot")))
+    figure.add_trace(line(weeks_forecast, fc.forecast[series], mode="lines", name="Pronostico", line=dict(color=COLOR_TERTIARY, width=3)))
+    figure.update_layout(title=f"Serie {series + 1}: {fc.method[series]} (MAE {fc.mae[series]:,.1f})", height=350)
+    return figure
+
+
+def _amplification_figure(amplification):
+    figure = go.Figure(go.Bar(
+        x=amplification["echelon"],
+        y=amplification["amplification"],
+        marker_color=[COLOR_SECONDARY] + [COLOR_TERTIARY] * (len(amplification) - 1),
+        text=[f"{a:,.1f}x" for a in amplification["amplification"]],
+        textposition="outside",
+    ))
+    figure.update_layout(
+        title="Amplificacion de la varianza de los pedidos", yaxis_type="log",
+        yaxis_title="Var(pedidos) / Var(demanda)", height=380,
+    )
+    return figure
+
+
+def _orders_figure(amplification, sample):
+    figure = go.Figure()
+    for i, name in enumerate(amplification["echelon"]):
+        figure.add_trace(line(None, sample[i], width=WIDTH // 2, mode="lines", name=name))
+    figure.update_layout(title="Pedidos semanales (una replica)", xaxis_title="Semana", height=380)
+    return figure
+
+
+@st.fragment
+def _bullwhip_what_if():
+    # Fragmento: los controles de la cadena solo vuelven a ejecutar este panel.
+    st.markdown("#### Efecto Latigo (Bullwhip) en la Cadena de Suministro")
+    st.markdown(
+        "Cada eslabon pronostica la demanda que recibe y pide con una politica de inventario objetivo; "
+        "la variabilidad de los pedidos crece aguas arriba. Reduzca el lead time, comparta la demanda "
+        "del cliente o suavice la politica para ver como se atenua; pedir en lotes (s, S) la amplifica."
+    )
+    col_bw_1, col_bw_2, col_bw_3 = st.columns(3)
+    with col_bw_1:
+        bw_replications = st.select_slider("Replicas", options=[100, 500, 1000, 2000, 5000], value=1000, key="bw_reps")
+        bw_echelons = st.slider("Eslabones", min_value=2, max_value=5, value=4)
+    with col_bw_2:
+        bw_lead_time = st.slider("Lead time por eslabon (semanas)", min_value=0, max_value=8, value=2)
+        bw_forecast = st.selectbox(
+            "Pronostico de cada eslabon",
+            ["exponential", "moving_average"],
+            format_func={"exponential": "Suavizamiento exponencial", "moving_average": "Promedio movil"}.get,
+        )
+    with col_bw_3:
+        bw_share = st.checkbox("Compartir la demanda del cliente")
+        bw_negative = st.checkbox("Permitir devoluciones (pedidos negativos)", value=True)
+        bw_policy = st.selectbox(
+            "Politica de pedidos",
+            list(bullwhip.POLICIES),
+            format_func={
+                "order_up_to": "Inventario objetivo (order-up-to)",
+                "proportional": "Inventario objetivo suavizado",
+                "s_S": "Punto de reorden y lote (s, S)",
+            }.get,
+        )
+        bw_smoothing = st.slider(
+            "Fraccion de la diferencia que se corrige (suavizado)", min_value=0.1, max_value=1.0, value=0.5,
+            step=0.1, disabled=bw_policy != "proportional",
+        )
+    bw_key = (bw_replications, bw_echelons, bw_lead_time, bw_forecast, bw_share, bw_negative, bw_policy, bw_smoothing)
+    amplification, sample = _bullwhip(*bw_key)
+
+    col_bw_4, col_bw_5 = st.columns(2)
+    with col_bw_4:
+        st.plotly_chart(cached_figure(bw_key, _amplification_figure, amplification), use_container_width=True)
+    with col_bw_5:
+        st.plotly_chart(cached_figure(bw_key, _orders_figure, amplification, sample), use_container_width=True)
+    st.caption(
+        f"Con {bw_echelons} eslabones y lead time de {bw_lead_time} semanas, la varianza de los pedidos del "
+        f"{amplification['echelon'].iat[-1]} es {amplification['amplification'].iat[-1]:,.1f} veces la de la "
+        f"demanda del cliente ({bw_replications:,} replicas de 104 semanas)."
+    )
+
+
+def _mrp_results(plan, items, bom, horizon):
+    m1, m2, m3, m4 = st.columns(4)
+    m1.metric("Articulos", f"{len(items):,}")
+    m2.metric("Relaciones BOM", f"{len(bom):,}")
+    m3.metric("Niveles", int(plan.low_level_code.max()) + 1)
+    m4.metric("Articulos con atraso", int((plan.past_due > 0).sum()))
+
+    item = st.selectbox("Registro MRP del articulo", plan.items[:500])
+    st.dataframe(plan.record(item).round(1), use_container_width=True)
+
+    with st.expander("Pegging y donde-se-usa del articulo"):
+        st.caption(
+            f"BOM en arreglos compactos: {plan.bom.nbytes / 1024:,.0f} KiB "
+            f"({plan.bom.nbytes / max(plan.bom.n_edges, 1):.0f} bytes por relacion)."
+        )
+        peg_period = st.slider("Semana del requerimiento", min_value=1, max_value=horizon, value=1)
+        st.markdown("**Articulos finales y semanas del PMP que generan el requerimiento:**")
+        st.dataframe(plan.peg(item, peg_period - 1), use_container_width=True, hide_index=True)
+        st.markdown("**Articulos finales que usan el componente:**")
+        st.dataframe(plan.bom.where_used_items(item, end_items_only=True), use_container_width=True, hide_index=True)
+
+    st.markdown("#### Dimensionamiento de Lotes del PMP")
+    st.markdown(
+        "Se comparan Lote por Lote, Cantidad Fija (EOQ), POQ, Silver-Meal y Wagner-Whitin "
+        "sobre los requerimientos netos de todos los articulos finales en una sola corrida."
+    )
+    end_items = plan.low_level_code == 0
+    lot_costs, lot_plans = _compare_lot_sizing(np.asarray(plan.items[end_items]), plan.net[end_items])
+    col_lot_1, col_lot_2 = st.columns([1, 2])
+    with col_lot_1:
+        st.markdown("**Tecnica de menor costo por articulo:**")
+        st.dataframe(lot_costs["best"].value_counts().rename("articulos"), use_container_width=True)
+    with col_lot_2:
+        st.markdown("**Costo total del catalogo por tecnica:**")
+        st.bar_chart(lot_costs[list(POLICIES)].sum())
+    lot_item = st.selectbox("Plan de lotes del articulo final", lot_costs["item"])
+    i_lot = int(lot_costs.index[lot_costs["item"] == lot_item][0])
+    st.dataframe(
+        pd.DataFrame(
+            {name: lot_plans[name][i_lot] for name in POLICIES},
+            index=[f"S{t + 1}" for t in range(plan.horizon)],
+        ).T.round(0),
+        use_container_width=True,
+    )
+
+    _net_change_what_if(plan, item, horizon)
+
+
+def render():
+    st.markdown("## Semana 4: Plan Maestro de Producción (PMP) y Material Requirements Planning (MRP)")
+    
+    st.subheader("Introducción")
+    st.markdown("""
+    Una vez entendemos el sistema integral y hemos optimizado los inventarios, llegamos a la etapa operativa donde los planes se convierten 
+    en acciones concretas. El Plan Maestro de Producción (PMP) y el Material Requirements Planning (MRP) son los mecanismos a través de 
+    los cuales la estrategia se traduce en programas de producción detallados y requisiciones de materiales. Esta semana aplicaremos estos 
+    métodos a casos prácticos.
+    """)
+    
+    st.subheader("Desarrollo")
+    st.markdown("""
+    **1. Plan Maestro de Producción (PMP):**
+    
+    Es el plan de producción expresado en términos de artículos finales. Establece el "qué" y el "cuándo" producir.
+    - Horizonte: Generalmente 12-24 semanas hacia el futuro
+    - Frecuencia de actualización: Semanal o quincenal
+    - Input: Pronóstico de demanda + Órdenes confirmadas + Política de inventario de seguridad
+    - Output: Programa de producción de artículos finales
+    
+    **2. Material Requirements Planning (MRP):**
+    
+    Transforma los requisitos del PMP en requisitos de componentes y materia prima.
+    - Entrada: Estructura del producto (BOM), lead times, inventarios disponibles, PMP
+    - Proceso: Desagregación de demanda independiente en demanda dependiente
+    - Salida: Programas de compra / producción para cada componente
+
+    """)
+
+    st.markdown("**Hoja de Calculo (MRP - Semana 4):**")
+    st.markdown(
+        "Liga del archivo editable: "
+        "https://docs.google.com/spreadsheets/d/1kHWG78i48QyYPmPU9v-0kOSGTHMTFRi-KWRVQucJ-lk/edit?gid=89536769#gid=89536769"
+    )
+    st.markdown(
+        "Copia local de la hoja de calculo (carpeta `datos`); se vuelve a leer solo cuando el archivo cambia."
+    )
+    local_workbook("hoja_semana_4")
+
+    st.markdown("### Pronostico de Demanda (entrada del PMP)")
+    st.markdown(
+        "Las series de demanda se ajustan todas a la vez sobre una matriz SKU x semana; "
+        "el mejor ajuste elige, por serie, la tecnica de menor error absoluto medio."
+    )
+    forecast_methods = {
+        "best_fit": "Mejor ajuste por serie",
+        "moving_average": "Promedio movil",
+        "exponential_smoothing": "Suavizamiento simple",
+        "holt": "Holt",
+        "holt_winters": "Holt-Winters",
+        "croston": "Croston (intermitente)",
+    }
+    col_fc_1, col_fc_2 = st.columns(2)
+    with col_fc_1:
+        n_series = st.number_input("Series de demanda", min_value=10, max_value=200_000, value=3000, step=1000)
+    with col_fc_2:
+        method = st.selectbox("Tecnica", list(forecast_methods), format_func=forecast_methods.get)
+    history, fc = _forecast(int(n_series), method, 24)
+    series = st.slider("Serie a graficar", min_value=1, max_value=int(n_series), value=1) - 1
+
+    st.plotly_chart(
+        cached_figure((int(n_series), method, 24, series), _forecast_figure, history, fc, series),
+        use_container_width=True,
+    )
+    if method == "best_fit":
+        st.dataframe(pd.Series(fc.method).value_counts().rename("series"), use_container_width=True)
+
+    st.markdown("### Explosion MRP Multinivel")
+    st.markdown(
+        "Los articulos se ordenan por codigo de bajo nivel y cada nivel se netea, desfasa por lead time "
+        "y explota a sus componentes en una sola pasada."
+    )
+    col_mrp_1, col_mrp_2 = st.columns(2)
+    with col_mrp_1:
+        n_items = st.number_input("Articulos en la BOM", min_value=10, max_value=100_000, value=2000, step=1000)
+    with col_mrp_2:
+        horizon = st.slider("Horizonte (semanas)", min_value=4, max_value=52, value=24)
+    mrp_background = st.checkbox(
+        "En segundo plano", key="semana_4_mrp_fondo",
+        help="La explosion corre en un proceso aparte y la pagina sigue respondiendo.",
+    )
+
+    local_mrp = [data_store().table(name, name) for name in ("items", "bom", "demand")]
+    if all(table is not None for table in local_mrp):
+        items, bom, mps = local_mrp
+        st.caption("Usando las tablas locales `items`, `bom` y `demand` de la carpeta `datos`.")
+    else:
+        items, bom, mps = mrp_demo(int(n_items), horizon)
+    mps_from_forecast = st.checkbox(
+        "PMP desde el pronostico de mejor ajuste", key="semana_4_pmp_pronostico",
+        help="Reemplaza el PMP (tabla `demand` o de ejemplo) por el pronostico de cada articulo final.",
+    )
+    if mps_from_forecast:
+        end_items = items.loc[~items["item"].isin(bom["child"]), "item"].to_numpy()
+        mps = _forecast_mps(end_items, horizon)
+        st.caption(
+            f"PMP de los {len(end_items):,} articulos finales: pronostico de mejor ajuste de cada uno "
+            f"({horizon} semanas, historia de ejemplo). El inventario disponible se dimensiono para el PMP "
+            "original, asi que las diferencias aparecen como atrasos."
+        )
+    if mrp_background:
+        plan = background_job(
+            "semana_4_mrp", content_key(items, bom, mps, horizon), "Explosion MRP", explode, items, bom, mps, horizon,
+        )
+    else:
+        plan = explode_plan(items, bom, mps, horizon)
+    if plan is not None:
+        _mrp_results(plan, items, bom, horizon)
+
+    _bullwhip_what_if()
+
+    st.markdown("""
+    
+    **Ejercicios Realizados en Clase:**
+    
+    - Desarrollo de tablas y cálculos correspondientes de MRP para productos multicomponentes
+    - Análisis de lead times y sus implicaciones en el horizonte de planeación
+    - Ajustes aplicados conforme a observaciones previas de retroalimentación de clase
+    
+    **Resultados Obtenidos y Análisis:**
+    
+    - Se demostró cómo un retraso en el suministro de un solo componente puede disrumpar todo el PMP
+    - Se ilustró el efecto "bullwhip" en cadenas de suministro multicapa
+    - Se cuantificó el impacto de la reducción de lead times en mejora de responsividad
+    """)
+    
+    st.info("""
+    **Nota:** Los ejercicios aplicados en clase incluyen casos reales adaptados de la industria de manufactura, 
+    permitiendo la vivencia práctica de los conceptos teóricos desarrollados en semanas anteriores.
+    """)
+    
+    st.divider()
+    st.subheader("Conclusión y Reflexión del Aprendizaje")
+    st.markdown("""
+    El PMP y MRP son más que herramientas de programación: representan el puente entre estrategia y ejecución. Su efectividad depende 
+    criterialmente de la calidad de los datos, la actualidad de la información y la disciplina en su mantenimiento. En la era del 
+    "big data" y "real-time monitoring", estos métodos clásicos continúan siendo relevantes, pero ahora pueden potenciarse con 
+    inteligencia artificial para predicciones más precisas y adaptaciones automáticas. La lección fundamental es que la tecnología es 
+    un amplificador: puede mejorar un proceso mal diseñado o un proceso bien diseñado, pero nunca puede compensar la falta de comprensión 
+    conceptual. Como ingenieros, nuestra responsabilidad es dominar ambos: la teoría y la tecnología.
+    """)
@@ -0,0 +1,6 @@
+"""Motores de calculo del Sistema de Planeacion de la Produccion.
+
+Cada modulo es independiente de Streamlit y opera sobre columnas de
+NumPy / pandas, de modo que la interfaz (``operaciones.py``) solo se
+encarga de capturar parametros y dibujar resultados.
+"""
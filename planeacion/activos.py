@@ -0,0 +1,115 @@
+"""Cache en memoria de figuras y archivos estaticos, acotada en bytes.
+
+Pensada para compartirse entre sesiones de Streamlit (por ejemplo, con
+``st.cache_resource``) y evitar en cada rerun:
+
+* Reconstruir figuras: ``value(key, build, *args)`` guarda lo que
+  devuelve ``build`` bajo ``key`` (las entradas de datos de la figura)
+  y la version del codigo de ``build`` (``persistencia.code_version``),
+  de modo que editar la funcion que arma la figura invalida sus entradas.
+* Releer archivos: ``file(path)`` guarda el contenido y solo lo vuelve a
+  leer cuando cambian ``mtime`` y tamano y, ademas, el hash del
+  contenido (igual que ``DataStore``).
+
+Cuando el tamano total rebasa ``max_bytes`` se descartan las entradas
+usadas hace mas tiempo (LRU). Los valores se comparten entre llamadas:
+no deben modificarse en sitio.
+"""
+
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from planeacion.datos import file_digest
+from planeacion.persistencia import code_version
+
+
+def _read_text(path: Path) -> str:
+    return path.read_text(encoding="utf-8", errors="ignore")
+
+
+class AssetCache:
+    """Cache LRU de valores en memoria, acotada a ``max_bytes``."""
+
+    def __init__(self, max_bytes: int = 64 * 2**20):
+        self.max_bytes = int(max_bytes)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _lookup(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def _hit(self, value):
+        with self._lock:
+            self.hits += 1
+        return value
+
+    def _store(self, key, entry) -> None:
+        with self._lock:
+            self.misses += 1
+            if entry["size"] > self.max_bytes:
+                return
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous["size"]
+            self._entries[key] = entry
+            self._bytes += entry["size"]
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted["size"]
+
+    def value(self, key, build, *args, size=len, convert=None):
+        """Valor de ``build(*args)`` para ``key``; ``size(valor)`` da su peso
+        en bytes. ``key`` debe identificar el contenido de ``args``.
+
+        ``convert`` (opcional) transforma el resultado antes de guardarlo,
+        por ejemplo a la forma serializada que se usa en cada rerun.
+        """
+        key = ("value", key, getattr(build, "__qualname__", repr(build)), code_version(build))
+        entry = self._lookup(key)
+        if entry is not None:
+            return self._hit(entry["value"])
+        value = build(*args)
+        if convert is not None:
+            value = convert(value)
+        self._store(key, {"value": value, "size": int(size(value))})
+        return value
+
+    def file(self, path, reader=_read_text):
+        """Contenido de ``path`` leido con ``reader`` (texto UTF-8 por omision)."""
+        path = Path(path)
+        stat = path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        key = ("file", str(path.resolve()), code_version(reader))
+        entry = self._lookup(key)
+        if entry is not None and entry["signature"] == signature:
+            return self._hit(entry["value"])
+
+        digest = file_digest(path)
+        if entry is not None and entry["digest"] == digest:
+            with self._lock:
+                entry["signature"] = signature
+            return self._hit(entry["value"])
+
+        value = reader(path)
+        self._store(key, {"value": value, "size": stat.st_size, "signature": signature, "digest": digest})
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries), "bytes": self._bytes, "max_bytes": self.max_bytes,
+                "hits": self.hits, "misses": self.misses,
+            }
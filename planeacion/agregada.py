@@ -0,0 +1,275 @@
+"""Planeacion agregada de 6 a 18 meses (Semana 3).
+
+Compara tres estrategias para cada familia de productos:
+
+* ``Persecucion``: la plantilla sigue a la demanda (contratar y despedir).
+* ``Nivelada``: plantilla constante; el inventario y los pedidos
+  atrasados absorben las variaciones.
+* ``Mixta``: plan de costo minimo de un programa lineal que combina
+  plantilla, tiempo extra, subcontratacion, inventario y atrasos.
+
+Las dos primeras tienen forma cerrada y se calculan para todas las
+familias a la vez. Los programas lineales de muchas familias (o
+escenarios) se resuelven juntos como un solo LP disperso diagonal por
+bloques con HiGHS, de ``block_size`` problemas por llamada; los bloques
+pueden repartirse en un pool de procesos.
+
+Columnas de ``families`` (costos por mes):
+
+* ``initial_workforce``, ``initial_inventory``.
+* ``units_per_worker`` (produccion regular por trabajador al mes) y
+  ``overtime_limit`` (unidades extra por trabajador al mes).
+* ``wage``, ``hire_cost``, ``fire_cost`` (por trabajador).
+* ``overtime_cost``, ``subcontract_cost``, ``holding_cost`` y
+  ``backorder_cost`` (por unidad).
+* Opcional ``subcontract_limit`` (unidades por mes).
+
+La plantilla se trata como variable continua (relajacion lineal).
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from scipy.optimize import linprog
+
+STRATEGIES = ("Persecucion", "Nivelada", "Mixta")
+COST_COLUMNS = ("hiring", "firing", "regular_labor", "overtime", "subcontract", "inventory", "backorder")
+PARAMETERS = (
+    "initial_workforce", "initial_inventory", "units_per_worker", "overtime_limit", "wage",
+    "hire_cost", "fire_cost", "overtime_cost", "subcontract_cost", "holding_cost", "backorder_cost",
+)
+# Orden de las variables de cada periodo en el LP.
+_VARIABLES = ("workforce", "hired", "fired", "regular", "overtime", "subcontract", "inventory", "backorder")
+
+
+@dataclass
+class AggregatePlan:
+    """Plan por familia (filas) y mes (columnas) con su desglose de costos."""
+
+    strategy: str
+    workforce: np.ndarray
+    hired: np.ndarray
+    fired: np.ndarray
+    regular: np.ndarray
+    overtime: np.ndarray
+    subcontract: np.ndarray
+    inventory: np.ndarray
+    backorder: np.ndarray
+    costs: pd.DataFrame
+
+    @property
+    def horizon(self) -> int:
+        return self.workforce.shape[1]
+
+    def family(self, row: int) -> pd.DataFrame:
+        """Plan mes a mes de una familia (posicion en ``families``)."""
+        return pd.DataFrame({
+            "month": np.arange(1, self.horizon + 1),
+            **{name: getattr(self, name)[row] for name in _VARIABLES},
+        })
+
+
+def _parameters(families: pd.DataFrame) -> dict:
+    missing = [c for c in PARAMETERS if c not in families.columns]
+    if missing:
+        raise ValueError(f"Faltan columnas en la tabla de familias: {', '.join(missing)}")
+    values = {name: families[name].to_numpy(dtype=np.float64) for name in PARAMETERS}
+    if (values["units_per_worker"] <= 0).any():
+        raise ValueError("La productividad por trabajador debe ser mayor que cero.")
+    limit = families["subcontract_limit"] if "subcontract_limit" in families.columns else None
+    values["subcontract_limit"] = np.full(len(families), np.inf) if limit is None else limit.to_numpy(dtype=np.float64)
+    return values
+
+
+def _demand(demand, n_families: int) -> np.ndarray:
+    matrix = np.asarray(demand, dtype=np.float64)
+    if matrix.ndim == 1:
+        matrix = matrix[None, :]
+    if matrix.shape[0] != n_families:
+        raise ValueError("La demanda debe tener un renglon por familia.")
+    if (matrix < 0).any():
+        raise ValueError("La demanda no puede ser negativa.")
+    return matrix
+
+
+def _plan(strategy, params, **arrays) -> AggregatePlan:
+    p = params
+    costs = pd.DataFrame({
+        "hiring": (arrays["hired"] * p["hire_cost"][:, None]).sum(axis=1),
+        "firing": (arrays["fired"] * p["fire_cost"][:, None]).sum(axis=1),
+        "regular_labor": (arrays["workforce"] * p["wage"][:, None]).sum(axis=1),
+        "overtime": (arrays["overtime"] * p["overtime_cost"][:, None]).sum(axis=1),
+        "subcontract": (arrays["subcontract"] * p["subcontract_cost"][:, None]).sum(axis=1),
+        "inventory": (arrays["inventory"] * p["holding_cost"][:, None]).sum(axis=1),
+        "backorder": (arrays["backorder"] * p["backorder_cost"][:, None]).sum(axis=1),
+    })
+    costs["total"] = costs[list(COST_COLUMNS)].sum(axis=1)
+    return AggregatePlan(strategy=strategy, costs=costs, **arrays)
+
+
+def _workforce_changes(workforce, initial):
+    change = np.diff(workforce, axis=1, prepend=initial[:, None])
+    return np.maximum(change, 0.0), np.maximum(-change, 0.0)
+
+
+def chase(families: pd.DataFrame, demand) -> AggregatePlan:
+    """Persecucion: se produce con tiempo regular lo que pide cada mes,
+    despues de consumir el inventario inicial."""
+    p = _parameters(families)
+    d = _demand(demand, len(families))
+    cumulative = np.cumsum(d, axis=1)
+    uncovered = np.maximum(cumulative - p["initial_inventory"][:, None], 0.0)
+    regular = np.diff(uncovered, axis=1, prepend=0.0)
+    workforce = regular / p["units_per_worker"][:, None]
+    hired, fired = _workforce_changes(workforce, p["initial_workforce"])
+    zeros = np.zeros_like(d)
+    return _plan(
+        "Persecucion", p, workforce=workforce, hired=hired, fired=fired, regular=regular,
+        overtime=zeros, subcontract=zeros.copy(),
+        inventory=np.maximum(p["initial_inventory"][:, None] - cumulative, 0.0), backorder=zeros.copy(),
+    )
+
+
+def level(families: pd.DataFrame, demand) -> AggregatePlan:
+    """Nivelada: plantilla constante que cubre la demanda neta del horizonte."""
+    p = _parameters(families)
+    d = _demand(demand, len(families))
+    horizon = d.shape[1]
+    net = np.maximum(d.sum(axis=1) - p["initial_inventory"], 0.0)
+    crew = net / (p["units_per_worker"] * horizon)
+    workforce = np.repeat(crew[:, None], horizon, axis=1)
+    regular = workforce * p["units_per_worker"][:, None]
+    position = p["initial_inventory"][:, None] + np.cumsum(regular - d, axis=1)
+    hired, fired = _workforce_changes(workforce, p["initial_workforce"])
+    zeros = np.zeros_like(d)
+    return _plan(
+        "Nivelada", p, workforce=workforce, hired=hired, fired=fired, regular=regular,
+        overtime=zeros, subcontract=zeros.copy(),
+        inventory=np.maximum(position, 0.0), backorder=np.maximum(-position, 0.0),
+    )
+
+
+def _lp_block(p, d):
+    """LP diagonal por bloques de ``n`` familias x ``T`` meses."""
+    n, T = d.shape
+    K = len(_VARIABLES)
+    var = np.arange(n * K * T).reshape(n, K, T)
+    W, Hr, F, P, O, C, I, B = (var[:, k] for k in range(K))
+    t = np.broadcast_to(np.arange(T), (n, T))
+    later = t >= 1
+
+    def block(rows, *terms):
+        # terms: (columnas, coeficiente, mascara opcional) con forma (n, T).
+        r, c, v = [], [], []
+        for columns, coefficient, *mask in terms:
+            keep = np.broadcast_to(mask[0] if mask else True, (n, T))
+            r.append(rows[keep])
+            c.append(columns[keep])
+            v.append(np.broadcast_to(coefficient, (n, T))[keep])
+        return np.concatenate(r), np.concatenate(c), np.concatenate(v)
+
+    previous = np.maximum(t - 1, 0)
+    rows_eq = np.arange(n * 2 * T).reshape(n, 2, T)
+    staff = block(rows_eq[:, 0], (W, 1.0), (np.take_along_axis(W, previous, 1), -1.0, later), (Hr, -1.0), (F, 1.0))
+    stock = block(
+        rows_eq[:, 1], (I, 1.0), (B, -1.0),
+        (np.take_along_axis(I, previous, 1), -1.0, later), (np.take_along_axis(B, previous, 1), 1.0, later),
+        (P, -1.0), (O, -1.0), (C, -1.0),
+    )
+    b_eq = np.zeros((n, 2, T))
+    b_eq[:, 0, 0] = p["initial_workforce"]
+    b_eq[:, 1] = -d
+    b_eq[:, 1, 0] += p["initial_inventory"]
+
+    rows_ub = rows_eq
+    regular = block(rows_ub[:, 0], (P, 1.0), (W, -p["units_per_worker"][:, None]))
+    extra = block(rows_ub[:, 1], (O, 1.0), (W, -p["overtime_limit"][:, None]))
+
+    def matrix(*parts):
+        r, c, v = (np.concatenate(x) for x in zip(*parts))
+        return sparse.csr_matrix((v, (r, c)), shape=(n * 2 * T, n * K * T))
+
+    cost = np.zeros((n, K, T))
+    for k, name in ((0, "wage"), (1, "hire_cost"), (2, "fire_cost"), (4, "overtime_cost"),
+                    (5, "subcontract_cost"), (6, "holding_cost"), (7, "backorder_cost")):
+        cost[:, k] = p[name][:, None]
+    upper = np.full((n, K, T), np.inf)
+    upper[:, 5] = p["subcontract_limit"][:, None]
+    upper[:, 7, -1] = 0.0  # sin atrasos al final del horizonte
+    bounds = np.column_stack([np.zeros(n * K * T), upper.ravel()])
+    return cost.ravel(), matrix(regular, extra), matrix(staff, stock), b_eq.ravel(), bounds
+
+
+def _solve_block(params, demand) -> np.ndarray:
+    c, A_ub, A_eq, b_eq, bounds = _lp_block(params, demand)
+    result = linprog(c, A_ub=A_ub, b_ub=np.zeros(A_ub.shape[0]), A_eq=A_eq, b_eq=b_eq,
+                     bounds=bounds, method="highs")
+    if result.status != 0:
+        raise ValueError(f"No se encontro un plan agregado factible: {result.message}")
+    return np.maximum(result.x, 0.0).reshape(len(demand), len(_VARIABLES), demand.shape[1])
+
+
+def mixed(families: pd.DataFrame, demand, block_size: int = 100, workers=None, progress=None) -> AggregatePlan:
+    """Mixta: plan de costo minimo (LP con HiGHS) para todas las familias.
+
+    ``workers`` > 1 resuelve los bloques en un ``ProcessPoolExecutor``.
+    ``progress(hechos, total)``, si se da, se llama al resolver cada bloque.
+    """
+    p = _parameters(families)
+    d = _demand(demand, len(families))
+    step = max(int(block_size), 1)
+    tasks = [
+        ({name: values[start:start + step] for name, values in p.items()}, d[start:start + step])
+        for start in range(0, len(d), step)
+    ]
+    parts = []
+    if workers and workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for part in pool.map(_solve_block, *zip(*tasks)):
+                parts.append(part)
+                if progress is not None:
+                    progress(len(parts), len(tasks))
+    else:
+        for task in tasks:
+            parts.append(_solve_block(*task))
+            if progress is not None:
+                progress(len(parts), len(tasks))
+    solution = np.concatenate(parts) if parts else np.zeros((0, len(_VARIABLES), d.shape[1]))
+    return _plan("Mixta", p, **{name: solution[:, k] for k, name in enumerate(_VARIABLES)})
+
+
+def compare_strategies(families: pd.DataFrame, demand, block_size: int = 100, workers=None, progress=None):
+    """Evalua las tres estrategias para todas las familias.
+
+    Regresa una tabla larga (familia x estrategia) con el desglose de
+    costos y un diccionario con los planes por estrategia. ``progress``
+    reporta el avance del plan mixto (ver ``mixed``).
+    """
+    plans = {
+        "Persecucion": chase(families, demand),
+        "Nivelada": level(families, demand),
+        "Mixta": mixed(families, demand, block_size=block_size, workers=workers, progress=progress),
+    }
+    labels = families["family"].to_numpy() if "family" in families.columns else np.arange(len(families))
+    table = pd.concat(
+        [plan.costs.assign(family=labels, strategy=name) for name, plan in plans.items()],
+        ignore_index=True,
+    )
+    return table[["family", "strategy", *COST_COLUMNS, "total"]], plans
+
+
+def scenarios(families: pd.DataFrame, demand, factors: dict):
+    """Replica cada familia por escenario de demanda (``nombre: factor``).
+
+    El factor puede ser un escalar o un arreglo por mes. Regresa la tabla
+    de familias con la columna ``scenario`` y la matriz de demanda, listas
+    para evaluarse en un solo lote.
+    """
+    d = _demand(demand, len(families))
+    names = list(factors)
+    expanded = pd.concat([families.assign(scenario=name) for name in names], ignore_index=True)
+    matrix = np.concatenate([d * np.asarray(factors[name], dtype=np.float64) for name in names])
+    return expanded, matrix
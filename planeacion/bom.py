@@ -0,0 +1,235 @@
+"""Lista de materiales compacta en arreglos paralelos (CSR).
+
+Las aristas padre -> componente se guardan ordenadas por padre en cuatro
+arreglos paralelos (``parent``, ``child``, ``qty_per``, ``scrap``) con
+tipos de 32 bits, junto con dos indices de renglon:
+
+* ``child_ptr``: los componentes de ``i`` estan en
+  ``child_ptr[i]:child_ptr[i + 1]``.
+* ``parent_ptr`` / ``where_used``: indice inverso (donde se usa); las
+  posiciones de las aristas cuyo componente es ``i`` estan en
+  ``where_used[parent_ptr[i]:parent_ptr[i + 1]]``.
+
+Con ambos indices las consultas de explosion, donde-se-usa y pegging
+recorren solo las aristas de la respuesta, nunca la BOM completa.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+INDEX_DTYPE = np.int32
+QUANTITY_DTYPE = np.float32
+
+
+def gather(ptr: np.ndarray, rows: np.ndarray) -> np.ndarray:
+    """Posiciones de los renglones CSR de ``rows``, concatenadas."""
+    counts = ptr[rows + 1] - ptr[rows]
+    total = counts.sum()
+    if not total:
+        return np.empty(0, dtype=np.int64)
+    return np.repeat(ptr[rows] - np.cumsum(counts) + counts, counts) + np.arange(total)
+
+
+@dataclass(frozen=True)
+class BOM:
+    """Lista de materiales indexada por posicion de articulo."""
+
+    items: pd.Index
+    parent: np.ndarray
+    child: np.ndarray
+    qty_per: np.ndarray
+    scrap: np.ndarray
+    child_ptr: np.ndarray
+    parent_ptr: np.ndarray
+    where_used: np.ndarray
+
+    @classmethod
+    def from_frame(cls, frame: pd.DataFrame, items=None) -> "BOM":
+        """Construye la BOM desde una tabla ``parent``, ``child``, ``qty_per``
+        y opcionalmente ``scrap``.
+
+        ``items`` fija el orden de los articulos (por ejemplo, el de la tabla
+        de articulos del MRP); si se omite se usan los que aparecen en la BOM.
+        """
+        if items is None:
+            items = pd.unique(pd.concat([frame["parent"], frame["child"]], ignore_index=True))
+        index = pd.Index(items)
+        if not index.is_unique:
+            raise ValueError("La tabla de articulos tiene claves repetidas.")
+
+        parent = index.get_indexer(frame["parent"])
+        child = index.get_indexer(frame["child"])
+        if (parent < 0).any() or (child < 0).any():
+            raise ValueError("La lista de materiales referencia articulos inexistentes.")
+        qty_per = frame["qty_per"].to_numpy(dtype=QUANTITY_DTYPE)
+        if "scrap" in frame.columns:
+            scrap = frame["scrap"].to_numpy(dtype=QUANTITY_DTYPE)
+        else:
+            scrap = np.zeros(len(frame), dtype=QUANTITY_DTYPE)
+
+        n_items = len(index)
+        order = np.argsort(parent, kind="stable")
+        parent = parent[order].astype(INDEX_DTYPE)
+        child = child[order].astype(INDEX_DTYPE)
+        where_used = np.argsort(child, kind="stable").astype(INDEX_DTYPE)
+        return cls(
+            items=index,
+            parent=parent,
+            child=child,
+            qty_per=qty_per[order],
+            scrap=scrap[order],
+            child_ptr=np.searchsorted(parent, np.arange(n_items + 1)).astype(INDEX_DTYPE),
+            parent_ptr=np.searchsorted(child[where_used], np.arange(n_items + 1)).astype(INDEX_DTYPE),
+            where_used=where_used,
+        )
+
+    @property
+    def n_items(self) -> int:
+        return len(self.items)
+
+    @property
+    def n_edges(self) -> int:
+        return len(self.parent)
+
+    @property
+    def usage(self) -> np.ndarray:
+        """Cantidad por unidad del padre incluyendo la merma."""
+        return self.qty_per.astype(np.float64) * (1.0 + self.scrap.astype(np.float64))
+
+    @property
+    def nbytes(self) -> int:
+        """Memoria de los arreglos de aristas e indices (sin las claves)."""
+        return sum(
+            getattr(self, name).nbytes
+            for name in ("parent", "child", "qty_per", "scrap", "child_ptr", "parent_ptr", "where_used")
+        )
+
+    def positions(self, keys) -> np.ndarray:
+        rows = self.items.get_indexer(np.atleast_1d(keys))
+        if (rows < 0).any():
+            raise KeyError("Articulo desconocido en la lista de materiales.")
+        return rows
+
+    def children_edges(self, rows: np.ndarray) -> np.ndarray:
+        """Aristas (posiciones) cuyos padres son ``rows``."""
+        return gather(self.child_ptr, rows)
+
+    def parent_edges(self, rows: np.ndarray) -> np.ndarray:
+        """Aristas (posiciones) cuyos componentes son ``rows``."""
+        return self.where_used[gather(self.parent_ptr, rows)]
+
+    def low_level_codes(self) -> np.ndarray:
+        """Codigo de bajo nivel de cada articulo (orden topologico por oleadas).
+
+        Cada oleada de Kahn procesa a la vez todos los articulos cuyos padres
+        ya fueron procesados; el numero de oleada es la ruta mas larga desde
+        un articulo final, es decir, su codigo de bajo nivel.
+        """
+        indegree = np.diff(self.parent_ptr).astype(np.int64)
+        llc = np.full(self.n_items, -1, dtype=np.int64)
+        frontier = np.flatnonzero(indegree == 0)
+        level = 0
+        while len(frontier):
+            llc[frontier] = level
+            touched = self.child[self.children_edges(frontier)]
+            indegree -= np.bincount(touched, minlength=self.n_items)
+            touched = np.unique(touched)
+            frontier = touched[indegree[touched] == 0]
+            level += 1
+
+        if (llc < 0).any():
+            raise ValueError("La lista de materiales contiene un ciclo; no es posible asignar niveles.")
+        return llc
+
+    def where_used_items(self, item, end_items_only: bool = False) -> pd.DataFrame:
+        """Todos los ensambles que usan ``item`` directa o indirectamente.
+
+        Regresa el articulo, el nivel de distancia y la cantidad acumulada
+        por unidad del ensamble (producto de ``usage`` por la ruta mas
+        corta encontrada).
+        """
+        frontier = self.positions(item)
+        quantity = np.ones(len(frontier))
+        seen = {int(frontier[0])}
+        found_rows, found_depth, found_qty = [], [], []
+        depth = 0
+        usage = self.usage
+        while len(frontier):
+            depth += 1
+            counts = self.parent_ptr[frontier + 1] - self.parent_ptr[frontier]
+            edges = self.parent_edges(frontier)
+            parents = self.parent[edges].astype(np.int64)
+            qty = np.repeat(quantity, counts) * usage[edges]
+            parents, first = np.unique(parents, return_index=True)
+            fresh = np.array([p not in seen for p in parents], dtype=bool)
+            parents, qty = parents[fresh], qty[first][fresh]
+            seen.update(parents.tolist())
+            found_rows.append(parents)
+            found_depth.append(np.full(len(parents), depth))
+            found_qty.append(qty)
+            frontier, quantity = parents, qty
+
+        rows = np.concatenate(found_rows) if found_rows else np.empty(0, dtype=np.int64)
+        result = pd.DataFrame({
+            "item": self.items.to_numpy()[rows],
+            "depth": np.concatenate(found_depth) if found_depth else rows,
+            "qty_per_assembly": np.concatenate(found_qty) if found_qty else rows.astype(float),
+        })
+        if end_items_only:
+            result = result[self.parent_ptr[rows + 1] == self.parent_ptr[rows]]
+        return result.reset_index(drop=True)
+
+    def peg(self, item, period: int, releases, receipts, lead_time, independent) -> pd.DataFrame:
+        """Pegging: que articulos finales y semanas del PMP generan el
+        requerimiento bruto de ``item`` en ``period``.
+
+        Se sube por el indice donde-se-usa siguiendo solo los padres con
+        liberacion planeada en el periodo del requerimiento; la liberacion
+        del padre en ``t`` cubre su requerimiento en ``t + LT`` (o, si es la
+        liberacion atrasada del periodo 0, sus recepciones hasta ``LT``).
+        Las matrices son articulos x periodos, como las de un ``MRPPlan``.
+        """
+        horizon = releases.shape[1]
+        frontier_rows = self.positions(item)
+        frontier_periods = np.array([period], dtype=np.int64)
+        drivers = [pd.DataFrame({
+            "end_item": self.items.to_numpy()[frontier_rows],
+            "mps_period": frontier_periods,
+            "mps_quantity": independent[frontier_rows, frontier_periods],
+        })]
+        seen = set()
+        while len(frontier_rows):
+            counts = self.parent_ptr[frontier_rows + 1] - self.parent_ptr[frontier_rows]
+            edges = self.parent_edges(frontier_rows)
+            parents = self.parent[edges].astype(np.int64)
+            periods = np.repeat(frontier_periods, counts)
+            active = releases[parents, periods] > 0
+            parents, periods = parents[active], periods[active]
+
+            late = [
+                (p, t)
+                for p in parents[periods == 0].tolist()
+                for t in range(min(int(lead_time[p]), horizon))
+                if receipts[p, t] > 0
+            ]
+            periods = periods + lead_time[parents]
+            if late:
+                parents = np.concatenate([parents, [p for p, _ in late]])
+                periods = np.concatenate([periods, [t for _, t in late]])
+            inside = periods < horizon
+            pairs = np.unique(np.stack([parents[inside], periods[inside]]), axis=1)
+            fresh = np.array([(p, t) not in seen for p, t in pairs.T], dtype=bool)
+            parents, periods = pairs[0, fresh], pairs[1, fresh]
+            seen.update(zip(parents.tolist(), periods.tolist()))
+
+            drivers.append(pd.DataFrame({
+                "end_item": self.items.to_numpy()[parents],
+                "mps_period": periods,
+                "mps_quantity": independent[parents, periods],
+            }))
+            frontier_rows, frontier_periods = parents, periods
+
+        result = pd.concat(drivers, ignore_index=True)
+        return result[result["mps_quantity"] > 0].reset_index(drop=True)
@@ -0,0 +1,193 @@
+"""Simulador del efecto latigo (bullwhip) en una cadena multinivel (Semana 4).
+
+La cadena va del cliente al ultimo proveedor: el eslabon 0 (minorista)
+recibe la demanda del cliente y cada eslabon ``i`` recibe como demanda
+los pedidos del eslabon ``i - 1``. Cada eslabon revisa su posicion de
+inventario ``IP`` cada periodo (despues de surtir su demanda) con una de
+las politicas de ``POLICIES``::
+
+    S_t = (L + 1) * F_t            (F: pronostico de su demanda)
+
+    order_up_to:  o_t = S_t - IP_t = D_t + (S_t - S_{t-1})
+    proportional: o_t = F_t + beta * (S_t - F_t - IP_t)
+    s_S:          o_t = S_t + Q_t - IP_t si IP_t < S_t, si no 0
+                  (Q_t = lot_periods * F_t)
+
+``proportional`` (order-up-to suavizado) corrige solo la fraccion
+``beta`` de la diferencia contra el objetivo; con ``beta = 1`` es
+order-up-to y con ``beta < 1`` atenua el efecto latigo. ``s_S`` pide en
+lotes, solo cuando la posicion cae debajo del punto de reorden.
+
+El inventario de seguridad constante no altera los pedidos y se omite.
+Con order-up-to y pedidos negativos permitidos (devoluciones) cada
+eslabon es un filtro lineal sobre el eje del tiempo, asi que se calcula
+con ``scipy.signal.lfilter`` para todas las replicas y periodos a la
+vez; el unico ciclo recorre los eslabones. En los demas casos se lleva
+la posicion de inventario periodo a periodo, vectorizado sobre las
+replicas.
+
+Con ``share_demand=True`` todos los eslabones pronostican la demanda del
+cliente (informacion compartida) en lugar de los pedidos que reciben.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+from scipy.signal import lfilter
+
+ECHELONS = ("Minorista", "Distribuidor", "Mayorista", "Planta", "Proveedor")
+FORECASTS = ("exponential", "moving_average")
+POLICIES = ("order_up_to", "proportional", "s_S")
+
+
+@dataclass
+class BullwhipResult:
+    """Demanda del cliente (renglon 0) y pedidos de cada eslabon.
+
+    ``orders`` tiene forma (eslabones + 1, replicas, periodos).
+    """
+
+    echelons: list
+    orders: np.ndarray
+    lead_times: np.ndarray
+
+    def amplification(self) -> pd.DataFrame:
+        """Varianza de los pedidos por eslabon y su amplificacion.
+
+        La varianza se calcula por replica sobre el tiempo y se promedia
+        entre replicas. ``amplification`` compara contra la demanda del
+        cliente y ``stage_amplification`` contra el eslabon anterior.
+        """
+        variance = self.orders.var(axis=2, ddof=1).mean(axis=1)
+        return pd.DataFrame({
+            "echelon": ["Cliente", *self.echelons],
+            "lead_time": np.concatenate([[np.nan], self.lead_times]),
+            "mean_order": self.orders.mean(axis=(1, 2)),
+            "variance": variance,
+            "amplification": variance / variance[0],
+            "stage_amplification": np.concatenate([[1.0], variance[1:] / variance[:-1]]),
+        })
+
+
+def customer_demand(replications: int, n_periods: int, mean=100.0, sigma=10.0, rho=0.0, seed=0) -> np.ndarray:
+    """Demanda AR(1) ``D_t = mean + rho*(D_{t-1} - mean) + e_t`` por replica."""
+    rng = np.random.default_rng(seed)
+    noise = rng.normal(0.0, sigma, size=(replications, n_periods))
+    start = noise[:, :1] / np.sqrt(max(1.0 - rho**2, 1e-12))
+    deviation, _ = lfilter([1.0], [1.0, -rho], noise[:, 1:], axis=1, zi=rho * start)
+    return mean + np.concatenate([start, deviation], axis=1)
+
+
+def _forecast(demand, method, alpha, window):
+    # El nivel inicial es el promedio de los primeros periodos (tantos como
+    # la edad promedio de los datos del pronostico), no solo el primero: con
+    # pedidos en lotes el primer pedido puede ser cero o varias veces la media.
+    if method == "exponential":
+        start = demand[:, :max(int(round(2.0 / alpha - 1.0)), 1)].mean(axis=1, keepdims=True)
+        forecast, _ = lfilter([alpha], [1.0, -(1.0 - alpha)], demand, axis=1, zi=(1.0 - alpha) * start)
+        return forecast
+    if method == "moving_average":
+        window = max(int(window), 1)
+        start = demand[:, :window].mean(axis=1, keepdims=True)
+        padded = np.concatenate([np.repeat(start, window, axis=1), demand], axis=1)
+        prefix = np.cumsum(padded, axis=1)
+        return (prefix[:, window:] - prefix[:, :-window]) / window
+    raise ValueError(f"Metodo de pronostico desconocido: {method}")
+
+
+def _orders(demand, forecast, lead_time, negative_orders, policy="order_up_to", smoothing=1.0, lot_periods=0.0):
+    target = (lead_time + 1) * forecast
+    if policy == "order_up_to" and negative_orders:
+        return demand + np.diff(target, axis=1, prepend=target[:, :1])
+    orders = np.empty_like(demand)
+    position = target[:, 0].copy()
+    if policy == "s_S":
+        # Cada replica arranca en un punto distinto del ciclo del lote: si
+        # todas pidieran juntas en el primer periodo, el eslabon de arriba
+        # veria un solo pedido enorme.
+        replicas = len(position)
+        position += lot_periods * forecast[:, 0] * (np.arange(replicas) + 0.5) / replicas
+    beta = smoothing if policy == "proportional" else 1.0
+    for t in range(demand.shape[1]):
+        position -= demand[:, t]
+        if policy == "s_S":
+            order = np.where(position < target[:, t], target[:, t] + lot_periods * forecast[:, t] - position, 0.0)
+        else:
+            # order_up_to es el caso beta = 1 de proportional.
+            order = (1.0 - beta) * forecast[:, t] + beta * (target[:, t] - position)
+            if not negative_orders:
+                order = np.maximum(order, 0.0)
+        orders[:, t] = order
+        position += order
+    return orders
+
+
+def _per_echelon(value, n_echelons, name, dtype=np.float64):
+    try:
+        return np.broadcast_to(np.asarray(value, dtype=dtype), (n_echelons,))
+    except ValueError:
+        raise ValueError(f"{name} debe tener un valor por eslabon.") from None
+
+
+def simulate_chain(
+    demand,
+    lead_times=(2, 2, 2, 2, 2),
+    forecast: str = "exponential",
+    alpha=0.3,
+    window=4,
+    share_demand: bool = False,
+    negative_orders: bool = True,
+    warmup: int = 10,
+    echelons=None,
+    policy="order_up_to",
+    smoothing=0.5,
+    lot_periods=2.0,
+) -> BullwhipResult:
+    """Simula la cadena para una matriz de demanda (replicas x periodos).
+
+    ``lead_times``, ``alpha``, ``window``, ``policy`` (``POLICIES``),
+    ``smoothing`` (``beta`` de ``proportional``, en (0, 1]) y
+    ``lot_periods`` (lote de ``s_S`` en periodos de pronostico) aceptan un
+    valor por eslabon. Los primeros ``warmup`` periodos se descartan del
+    resultado.
+    """
+    demand = np.atleast_2d(np.asarray(demand, dtype=np.float64))
+    lead_times = np.asarray(lead_times, dtype=np.float64)
+    n_echelons = len(lead_times)
+    alpha = _per_echelon(alpha, n_echelons, "alpha")
+    window = _per_echelon(window, n_echelons, "window")
+    policy = _per_echelon(policy, n_echelons, "policy", dtype=object)
+    smoothing = _per_echelon(smoothing, n_echelons, "smoothing")
+    lot_periods = _per_echelon(lot_periods, n_echelons, "lot_periods")
+    if ((alpha <= 0) | (alpha > 1)).any():
+        raise ValueError("alpha debe estar en (0, 1].")
+    unknown = sorted(set(policy) - set(POLICIES))
+    if unknown:
+        raise ValueError(f"Politica desconocida: {', '.join(map(str, unknown))} (opciones: {', '.join(POLICIES)})")
+    if ((smoothing <= 0) | (smoothing > 1)).any():
+        raise ValueError("smoothing debe estar en (0, 1].")
+    if (lot_periods < 0).any():
+        raise ValueError("lot_periods no puede ser negativo.")
+    if echelons is None:
+        echelons = [ECHELONS[i] if i < len(ECHELONS) else f"Eslabon {i + 1}" for i in range(n_echelons)]
+
+    orders = np.empty((n_echelons + 1,) + demand.shape)
+    orders[0] = demand
+    if share_demand:
+        shared = [_forecast(demand, forecast, alpha[i], window[i]) for i in range(n_echelons)]
+    for i in range(n_echelons):
+        incoming = orders[i]
+        prediction = shared[i] if share_demand else _forecast(incoming, forecast, alpha[i], window[i])
+        orders[i + 1] = _orders(
+            incoming, prediction, lead_times[i], negative_orders, policy[i], smoothing[i], lot_periods[i]
+        )
+    return BullwhipResult(echelons=list(echelons), orders=orders[:, :, warmup:], lead_times=lead_times)
+
+
+def chen_bound(lead_time, window) -> np.ndarray:
+    """Cota inferior de Chen et al. (2000) para la amplificacion de un
+    eslabon con promedio movil de ``window`` periodos y demanda i.i.d."""
+    L = np.asarray(lead_time, dtype=np.float64)
+    p = np.asarray(window, dtype=np.float64)
+    return 1.0 + 2.0 * (L + 1) / p + 2.0 * (L + 1) ** 2 / p**2
@@ -0,0 +1,117 @@
+"""Costo total relevante de planes de inventario candidatos (Semana 3).
+
+Un plan candidato fija, para todo el catalogo, un nivel de servicio de
+ciclo objetivo y un multiplicador del EOQ. Cada plan se evalua con el
+modelo (Q, r) de revision continua y demanda normal durante el lead
+time; el costo anual se separa en:
+
+* ``materials``: ``demand * unit_cost``.
+* ``labor``: ``demand * labor_cost``.
+* ``holding``: ``H * (Q/2 + safety_stock)``.
+* ``ordering``: ``S * demand / Q``.
+* ``shortage``: ``shortage_cost`` por unidad faltante esperada,
+  ``(demand / Q) * sigma_L * G(z)`` con ``G`` la funcion de perdida
+  normal.
+
+El fill rate del catalogo es ``1 - faltantes / demanda`` ponderado por
+demanda. Todos los planes se evaluan a la vez como arreglos.
+"""
+
+import numpy as np
+import pandas as pd
+from scipy.special import ndtr, ndtri
+
+from planeacion.inventario import validate_skus
+
+COST_COLUMNS = ("materials", "labor", "holding", "ordering", "shortage")
+
+
+def normal_loss(z) -> np.ndarray:
+    """Funcion de perdida normal estandar ``G(z) = phi(z) - z * (1 - Phi(z))``."""
+    z = np.asarray(z, dtype=np.float64)
+    return np.exp(-0.5 * z**2) / np.sqrt(2.0 * np.pi) - z * ndtr(-z)
+
+
+def candidate_plans(service_levels, lot_multipliers) -> pd.DataFrame:
+    """Rejilla de planes: todas las combinaciones de nivel de servicio y
+    multiplicador del EOQ."""
+    service, multiplier = np.meshgrid(
+        np.asarray(service_levels, dtype=np.float64),
+        np.asarray(lot_multipliers, dtype=np.float64),
+        indexing="ij",
+    )
+    return pd.DataFrame({"service_level": service.ravel(), "lot_multiplier": multiplier.ravel()})
+
+
+def _optional(skus, name):
+    if name in skus.columns:
+        return skus[name].to_numpy(dtype=np.float64)
+    return np.zeros(len(skus))
+
+
+def evaluate_plans(skus: pd.DataFrame, plans: pd.DataFrame, periods_per_year: float = 52.0) -> pd.DataFrame:
+    """Desglose de costos anuales y fill rate de cada plan candidato.
+
+    ``plans`` requiere ``service_level`` (0-1, exclusivo) y
+    ``lot_multiplier`` (> 0). Las columnas ``unit_cost``, ``labor_cost``
+    y ``shortage_cost`` de los SKUs son opcionales (cero si faltan).
+    """
+    validate_skus(skus)
+    service = plans["service_level"].to_numpy(dtype=np.float64)
+    multiplier = plans["lot_multiplier"].to_numpy(dtype=np.float64)
+    if ((service <= 0) | (service >= 1)).any():
+        raise ValueError("El nivel de servicio debe estar entre 0 y 1 (exclusivo).")
+    if (multiplier <= 0).any():
+        raise ValueError("El multiplicador del lote debe ser mayor que cero.")
+
+    demand = skus["demand"].to_numpy(dtype=np.float64)
+    S = skus["S"].to_numpy(dtype=np.float64)
+    H = skus["H"].to_numpy(dtype=np.float64)
+    sigma_lead = np.sqrt(skus["lead_time"].to_numpy(dtype=np.float64)) * skus["sigma_demand"].to_numpy(dtype=np.float64)
+    if "sigma_lead_time" in skus.columns:
+        rate = demand / periods_per_year
+        sigma_lead = np.sqrt(sigma_lead**2 + (rate * skus["sigma_lead_time"].to_numpy(dtype=np.float64)) ** 2)
+    eoq = np.sqrt(2.0 * demand * S / H)
+    shortage_cost = _optional(skus, "shortage_cost")
+
+    # Con nivel de servicio y multiplicador comunes a todo el catalogo,
+    # cada costo es (funcion del plan) x (suma de un coeficiente por SKU),
+    # de modo que miles de planes se evaluan en O(planes + SKUs).
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cycles_at_eoq = np.where(eoq > 0, demand / eoq, 0.0)
+    z = ndtri(service)
+    loss = normal_loss(z)
+    holding = multiplier * (H * eoq).sum() / 2.0 + z * (H * sigma_lead).sum()
+    ordering = (S * cycles_at_eoq).sum() / multiplier
+    short_units = loss / multiplier * (cycles_at_eoq * sigma_lead).sum()
+    shortage = loss / multiplier * (shortage_cost * cycles_at_eoq * sigma_lead).sum()
+
+    total_demand = demand.sum()
+    result = plans.reset_index(drop=True).assign(
+        materials=float((demand * _optional(skus, "unit_cost")).sum()),
+        labor=float((demand * _optional(skus, "labor_cost")).sum()),
+        holding=holding,
+        ordering=ordering,
+        shortage=shortage,
+    )
+    result["total"] = result[list(COST_COLUMNS)].sum(axis=1)
+    result["fill_rate"] = 1.0 - short_units / total_demand if total_demand > 0 else 1.0
+    return result
+
+
+def pareto_frontier(evaluated: pd.DataFrame, cost: str = "total", service: str = "fill_rate") -> pd.DataFrame:
+    """Planes no dominados: ningun otro plan cuesta menos con igual o mayor
+    nivel de servicio. Ordenados por costo."""
+    ordered = evaluated.sort_values([cost, service], ascending=[True, False])
+    level = ordered[service].to_numpy()
+    best_before = np.maximum.accumulate(np.concatenate([[-np.inf], level[:-1]]))
+    return ordered[level > best_before]
+
+
+def cheapest_plan(evaluated: pd.DataFrame, min_service: float, cost: str = "total", service: str = "fill_rate"):
+    """Plan de menor costo con nivel de servicio de al menos ``min_service``
+    (o el de mayor servicio si ninguno lo alcanza)."""
+    feasible = evaluated[evaluated[service] >= min_service]
+    if feasible.empty:
+        return evaluated.loc[evaluated[service].idxmax()]
+    return feasible.loc[feasible[cost].idxmin()]
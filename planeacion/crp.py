@@ -0,0 +1,253 @@
+"""Planeacion de requerimientos de capacidad (CRP) (Semana 3).
+
+La carga se obtiene uniendo las ordenes planeadas con sus rutas de
+fabricacion y agregando horas por centro de trabajo y periodo con un
+solo ``bincount`` sobre la llave (centro, periodo).
+
+Tablas de entrada:
+
+* ``orders``: ``item``, ``release_period``, ``quantity`` (por ejemplo,
+  ``MRPPlan.orders()``).
+* ``routings``: ``item``, ``work_center``, ``setup_time``, ``run_time``
+  (horas por unidad) y opcionalmente ``offset`` (periodos despues de la
+  liberacion en que se ejecuta la operacion).
+* ``capacity``: ``work_center``, ``capacity`` (horas por periodo) y
+  opcionalmente ``period`` para capacidades que cambian en el tiempo.
+
+``level_load`` convierte el perfil de carga infinita en uno de capacidad
+finita adelantando (o partiendo) operaciones hacia periodos anteriores
+con holgura; lo que no cabe se reporta como tiempo extra.
+"""
+
+import heapq
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass
+class CapacityProfile:
+    """Carga y capacidad por centro de trabajo (filas) y periodo (columnas)."""
+
+    work_centers: pd.Index
+    load: np.ndarray
+    capacity: np.ndarray
+
+    @property
+    def horizon(self) -> int:
+        return self.load.shape[1]
+
+    @property
+    def utilization(self) -> np.ndarray:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(self.capacity > 0, self.load / self.capacity, np.inf)
+
+    @property
+    def overload(self) -> np.ndarray:
+        """Horas que exceden la capacidad (cero si no hay sobrecarga)."""
+        return np.maximum(self.load - self.capacity, 0.0)
+
+    def work_center(self, work_center) -> pd.DataFrame:
+        """Perfil de un centro: carga, capacidad y sobrecarga por periodo."""
+        i = self.work_centers.get_loc(work_center)
+        return pd.DataFrame({
+            "period": np.arange(self.horizon),
+            "load": self.load[i],
+            "capacity": self.capacity[i],
+            "overload": self.overload[i],
+        })
+
+    def overloads(self) -> pd.DataFrame:
+        """Celdas (centro, periodo) con carga mayor a la capacidad."""
+        rows, periods = np.nonzero(self.load > self.capacity)
+        return pd.DataFrame({
+            "work_center": self.work_centers.to_numpy()[rows],
+            "period": periods,
+            "load": self.load[rows, periods],
+            "capacity": self.capacity[rows, periods],
+            "overload": self.overload[rows, periods],
+        }).sort_values("overload", ascending=False, ignore_index=True)
+
+    def summary(self) -> pd.DataFrame:
+        """Carga total, capacidad total y periodos sobrecargados por centro."""
+        return pd.DataFrame({
+            "work_center": self.work_centers.to_numpy(),
+            "load": self.load.sum(axis=1),
+            "capacity": self.capacity.sum(axis=1),
+            "overloaded_periods": (self.load > self.capacity).sum(axis=1),
+            "peak_utilization": self.utilization.max(axis=1),
+        })
+
+
+def operation_loads(orders: pd.DataFrame, routings: pd.DataFrame) -> pd.DataFrame:
+    """Una fila por operacion de cada orden, con sus horas y periodo de carga.
+
+    ``order`` es la posicion de la orden en ``orders`` y ``step`` el numero
+    de operacion dentro de la ruta del articulo (columna ``step`` de la ruta
+    o, si no existe, su orden de aparicion).
+    """
+    if "step" not in routings.columns:
+        routings = routings.assign(step=routings.groupby("item").cumcount())
+    operations = (
+        orders[["item", "release_period", "quantity"]]
+        .assign(order=np.arange(len(orders)))
+        .merge(routings, on="item", how="inner")
+    )
+    offset = operations["offset"].to_numpy(dtype=np.int64) if "offset" in operations.columns else 0
+    hours = (
+        operations["setup_time"].to_numpy(dtype=np.float64)
+        + operations["run_time"].to_numpy(dtype=np.float64) * operations["quantity"].to_numpy(dtype=np.float64)
+    )
+    return operations.assign(period=operations["release_period"].to_numpy(dtype=np.int64) + offset, hours=hours)
+
+
+def _capacity_matrix(capacity: pd.DataFrame, work_centers: pd.Index, horizon: int) -> np.ndarray:
+    rows = work_centers.get_indexer(capacity["work_center"])
+    known = rows >= 0
+    values = capacity["capacity"].to_numpy(dtype=np.float64)
+    matrix = np.zeros((len(work_centers), horizon))
+    if "period" in capacity.columns:
+        periods = capacity["period"].to_numpy(dtype=np.int64)
+        keep = known & (periods >= 0) & (periods < horizon)
+        matrix[rows[keep], periods[keep]] = values[keep]
+    else:
+        matrix[rows[known]] = values[known, None]
+    return matrix
+
+
+def _profile(operations, capacity, horizon: int) -> CapacityProfile:
+    work_centers = pd.Index(pd.unique(pd.concat([capacity["work_center"], operations["work_center"]])))
+
+    rows = work_centers.get_indexer(operations["work_center"])
+    periods = operations["period"].to_numpy(dtype=np.int64)
+    keep = (periods >= 0) & (periods < horizon)
+    load = np.bincount(
+        rows[keep] * horizon + periods[keep],
+        weights=operations["hours"].to_numpy(dtype=np.float64)[keep],
+        minlength=len(work_centers) * horizon,
+    ).reshape(len(work_centers), horizon)
+
+    return CapacityProfile(
+        work_centers=work_centers,
+        load=load,
+        capacity=_capacity_matrix(capacity, work_centers, horizon),
+    )
+
+
+def capacity_requirements(orders, routings, capacity, horizon: int) -> CapacityProfile:
+    """Calcula la carga por centro de trabajo y periodo (carga infinita)."""
+    return _profile(operation_loads(orders, routings), capacity, horizon)
+
+
+@dataclass
+class LevelingResult:
+    """Perfil nivelado, tiempo extra residual y movimientos propuestos."""
+
+    infinite: CapacityProfile
+    leveled: CapacityProfile
+    moves: pd.DataFrame
+
+    @property
+    def overtime(self) -> np.ndarray:
+        return self.leveled.overload
+
+
+def _predecessors(operations: pd.DataFrame) -> np.ndarray:
+    """Operacion anterior de la misma orden (-1 si es la primera)."""
+    order = operations["order"].to_numpy()
+    step = operations["step"].to_numpy()
+    sequence = np.lexsort((step, order))
+    previous = np.full(len(operations), -1, dtype=np.int64)
+    same_order = order[sequence[1:]] == order[sequence[:-1]]
+    previous[sequence[1:][same_order]] = sequence[:-1][same_order]
+    return previous
+
+
+def level_load(orders, routings, capacity, horizon: int, tolerance: float = 1e-9) -> LevelingResult:
+    """Nivelacion de carga con capacidad finita.
+
+    Cada centro se recorre en orden cronologico manteniendo un monticulo
+    con los periodos anteriores que tienen holgura; la cima es el periodo
+    con holgura mas cercano (menor adelanto), de modo que cada movimiento
+    cuesta O(log n). Las horas se mueven solo hacia periodos anteriores
+    (la fecha de entrega nunca se rebasa) y nunca antes del periodo en
+    que termina la operacion anterior de la misma orden. Una operacion
+    puede partirse entre varios periodos.
+    """
+    operations = operation_loads(orders, routings)
+    periods = operations["period"].to_numpy(dtype=np.int64)
+    operations = operations[(periods >= 0) & (periods < horizon)].reset_index(drop=True)
+
+    infinite = _profile(operations, capacity, horizon)
+    load = infinite.load.copy()
+    cap = infinite.capacity
+
+    work_center = infinite.work_centers.get_indexer(operations["work_center"])
+    period = operations["period"].to_numpy(dtype=np.int64)
+    hours = operations["hours"].to_numpy(dtype=np.float64)
+    remaining = hours.copy()
+    finish = period.copy()
+    previous = _predecessors(operations)
+
+    cell = work_center * horizon + period
+    by_cell = np.argsort(cell, kind="stable")
+    bounds = np.searchsorted(cell[by_cell], np.arange(len(infinite.work_centers) * horizon + 1))
+
+    moves = []
+    for w in np.flatnonzero((load > cap + tolerance).any(axis=1)):
+        slack_periods = []
+        for t in range(horizon):
+            excess = load[w, t] - cap[w, t]
+            if excess < -tolerance:
+                heapq.heappush(slack_periods, -t)
+                continue
+            if excess <= tolerance or not slack_periods:
+                continue
+
+            candidates = by_cell[bounds[w * horizon + t]:bounds[w * horizon + t + 1]]
+            earliest = np.where(previous[candidates] >= 0, finish[previous[candidates]], 0)
+            rank = np.argsort(earliest, kind="stable")
+            candidates, earliest = candidates[rank], earliest[rank]
+            latest_move = {}
+
+            j = 0
+            while excess > tolerance and slack_periods:
+                q = -slack_periods[0]
+                while j < len(candidates) and remaining[candidates[j]] <= tolerance:
+                    j += 1
+                if j == len(candidates) or earliest[j] > q:
+                    break
+                op = candidates[j]
+                amount = min(excess, cap[w, q] - load[w, q], remaining[op])
+                load[w, q] += amount
+                load[w, t] -= amount
+                remaining[op] -= amount
+                excess -= amount
+                latest_move[op] = max(latest_move.get(op, q), q)
+                moves.append((op, t, q, amount))
+                if cap[w, q] - load[w, q] <= tolerance:
+                    heapq.heappop(slack_periods)
+
+            for op, q in latest_move.items():
+                if remaining[op] <= tolerance:
+                    finish[op] = q
+
+    if moves:
+        op, source, target, amount = (np.array(column) for column in zip(*moves))
+    else:
+        op = source = target = np.empty(0, dtype=np.int64)
+        amount = np.empty(0)
+    moved = pd.DataFrame({
+        "order": operations["order"].to_numpy()[op],
+        "item": operations["item"].to_numpy()[op],
+        "step": operations["step"].to_numpy()[op],
+        "work_center": operations["work_center"].to_numpy()[op],
+        "original_period": source,
+        "new_period": target,
+        "hours": amount,
+        "quantity": operations["quantity"].to_numpy()[op] * amount / hours[op] if len(op) else amount,
+    })
+
+    leveled = CapacityProfile(work_centers=infinite.work_centers, load=load, capacity=cap)
+    return LevelingResult(infinite=infinite, leveled=leveled, moves=moved)
@@ -0,0 +1,175 @@
+"""Capa de datos local: tablas de SKUs, BOM, rutas, demanda y jerarquias
+(Semanas 2-4).
+
+Las tablas se leen de archivos CSV, Parquet o XLSX con tipos declarados
+por columna (lectura columnar, solo las columnas necesarias cuando el
+formato lo permite). ``DataStore`` guarda en memoria lo ya leido y solo
+vuelve a leer un archivo cuando cambia: primero compara ``mtime`` y
+tamano y, si difieren, el hash del contenido, de modo que copiar el
+mismo archivo encima no provoca una relectura.
+
+Un ``DataStore`` es seguro para compartirse entre sesiones de Streamlit
+(por ejemplo, con ``st.cache_resource``).
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import pandas as pd
+
+SUFFIXES = (".parquet", ".csv", ".xlsx")
+
+# Columnas requeridas y su tipo; las columnas adicionales se conservan.
+SCHEMAS = {
+    "skus": {
+        "demand": "float64", "S": "float64", "H": "float64", "lead_time": "float64",
+        "sigma_demand": "float64", "service_level": "float64",
+    },
+    "items": {"item": "string", "lead_time": "int64", "on_hand": "float64"},
+    "bom": {"parent": "string", "child": "string", "qty_per": "float64"},
+    "routings": {"item": "string", "work_center": "string", "setup_time": "float64", "run_time": "float64"},
+    "demand": {"item": "string", "period": "int64", "quantity": "float64"},
+    "hierarchy": {"id": "string", "parent": "string", "value": "float64"},
+}
+OPTIONAL = {
+    "skus": {"sku": "string", "sigma_lead_time": "float64", "shortage_cost": "float64", "unit_cost": "float64",
+             "unit_space": "float64", "labor_cost": "float64"},
+    "items": {"safety_stock": "float64"},
+    "bom": {"scrap": "float64"},
+    "routings": {"offset": "int64", "step": "int64"},
+    "demand": {},
+    "hierarchy": {"label": "string"},
+}
+
+
+def file_digest(path, block_size: int = 1 << 20) -> str:
+    """Hash SHA-1 del contenido del archivo, leido por bloques."""
+    digest = hashlib.sha1()
+    with open(path, "rb") as handle:
+        for block in iter(lambda: handle.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _columns(path: Path, sheet) -> list:
+    suffix = path.suffix.lower()
+    if suffix == ".parquet":
+        import pyarrow.parquet as pq
+
+        return list(pq.read_schema(path).names)
+    if suffix == ".csv":
+        return list(pd.read_csv(path, nrows=0).columns)
+    return list(pd.read_excel(path, sheet_name=sheet or 0, nrows=0).columns)
+
+
+def read_table(path, kind=None, sheet=None) -> pd.DataFrame:
+    """Lee una tabla con los tipos de ``SCHEMAS[kind]``.
+
+    Sin ``kind`` se lee el archivo completo con los tipos inferidos. Con
+    ``kind`` se leen las columnas requeridas y opcionales presentes; si
+    falta alguna requerida se lanza ``ValueError``.
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix not in SUFFIXES:
+        raise ValueError(f"Formato no soportado: {path.suffix} (use {', '.join(SUFFIXES)})")
+
+    if kind is None:
+        if suffix == ".parquet":
+            return pd.read_parquet(path)
+        if suffix == ".csv":
+            return pd.read_csv(path)
+        return pd.read_excel(path, sheet_name=sheet or 0)
+
+    schema = {**SCHEMAS[kind], **OPTIONAL[kind]}
+    present = _columns(path, sheet)
+    missing = [c for c in SCHEMAS[kind] if c not in present]
+    if missing:
+        raise ValueError(f"Faltan columnas en {path.name}: {', '.join(missing)}")
+    keep = [c for c in present if c in schema]
+    dtypes = {c: schema[c] for c in keep}
+
+    if suffix == ".parquet":
+        frame = pd.read_parquet(path, columns=keep)
+    elif suffix == ".csv":
+        frame = pd.read_csv(path, usecols=keep, dtype=dtypes)
+    else:
+        frame = pd.read_excel(path, sheet_name=sheet or 0, usecols=keep, dtype=dtypes)
+    return frame[keep].astype(dtypes)
+
+
+def read_workbook(path) -> dict:
+    """Todas las hojas de un XLSX (o la unica tabla de un CSV/Parquet)."""
+    path = Path(path)
+    if path.suffix.lower() == ".xlsx":
+        return pd.read_excel(path, sheet_name=None)
+    return {path.stem: read_table(path)}
+
+
+class DataStore:
+    """Tablas leidas de ``root`` con invalidacion por ``mtime`` / hash.
+
+    ``table(name, kind)`` busca ``root/name`` con cualquiera de las
+    extensiones de ``SUFFIXES`` (en ese orden de preferencia). Se guardan
+    a lo mas ``max_entries`` lecturas; las menos usadas se descartan.
+    """
+
+    def __init__(self, root, max_entries: int = 32):
+        self.root = Path(root)
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.reads = 0
+
+    def path(self, name):
+        """Archivo de la tabla ``name`` o ``None`` si no existe."""
+        for suffix in SUFFIXES:
+            candidate = self.root / f"{name}{suffix}"
+            if candidate.is_file():
+                return candidate
+        return None
+
+    def _load(self, key, path: Path, reader):
+        stat = path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry["signature"] == signature:
+                self._entries.move_to_end(key)
+                return entry["value"]
+
+        digest = file_digest(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry["digest"] == digest:
+                entry["signature"] = signature
+                self._entries.move_to_end(key)
+                return entry["value"]
+
+        value = reader(path)
+        with self._lock:
+            self.reads += 1
+            self._entries[key] = {"signature": signature, "digest": digest, "value": value}
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def table(self, name, kind=None, sheet=None):
+        """Tabla ``name`` (tipada segun ``kind``) o ``None`` si no hay archivo.
+
+        El resultado se comparte entre llamadas: no debe modificarse en sitio.
+        """
+        path = self.path(name)
+        if path is None:
+            return None
+        return self._load(("table", name, kind, sheet), path, lambda p: read_table(p, kind, sheet))
+
+    def workbook(self, name):
+        """Hojas del libro ``name`` o ``None`` si no hay archivo."""
+        path = self.path(name)
+        if path is None:
+            return None
+        return self._load(("workbook", name), path, read_workbook)
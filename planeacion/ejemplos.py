@@ -0,0 +1,185 @@
+"""Datos de ejemplo reproducibles para demostrar los motores en la app."""
+
+import numpy as np
+import pandas as pd
+
+from planeacion.mrp import explode
+
+
+def demo_skus(n: int = 1000, seed: int = 42) -> pd.DataFrame:
+    """Catalogo sintetico de SKUs con las columnas de ``inventario``."""
+    rng = np.random.default_rng(seed)
+    demand = rng.lognormal(mean=8.0, sigma=1.0, size=n).round()
+    weekly = demand / 52.0
+    return pd.DataFrame({
+        "sku": np.char.add("SKU-", np.arange(1, n + 1).astype(str)),
+        "demand": demand,
+        "S": rng.uniform(20, 250, size=n).round(2),
+        "H": rng.uniform(0.5, 15, size=n).round(2),
+        "lead_time": rng.integers(1, 9, size=n).astype(float),
+        "sigma_demand": (weekly * rng.uniform(0.1, 0.6, size=n)).round(2),
+        "service_level": rng.choice([0.90, 0.95, 0.975, 0.99], size=n),
+        "shortage_cost": rng.uniform(5, 60, size=n).round(2),
+        "unit_cost": rng.lognormal(mean=3.0, sigma=0.8, size=n).round(2),
+        "unit_space": rng.uniform(0.01, 0.5, size=n).round(3),
+        "labor_cost": rng.uniform(0.5, 12, size=n).round(2),
+    })
+
+
+def demo_mrp(n_items: int = 2000, horizon: int = 24, levels: int = 5, seed: int = 7):
+    """Estructura multinivel sintetica: articulos, BOM y PMP de articulos finales.
+
+    Cada componente tiene entre uno y tres padres en niveles superiores, de
+    modo que los componentes comunes reciben demanda de varias ramas. El
+    inventario inicial cubre el requerimiento dentro del lead time de cada
+    articulo, como en un plan en marcha, para que no aparezcan atrasos.
+    """
+    rng = np.random.default_rng(seed)
+    level = np.sort(rng.integers(1, levels, size=n_items))
+    n_end = max(1, n_items // 20)
+    level[:n_end] = 0
+    level = np.sort(level)
+    items = pd.DataFrame({
+        "item": np.char.add("P-", np.arange(n_items).astype(str)),
+        "lead_time": rng.integers(0, 4, size=n_items),
+        "on_hand": rng.integers(0, 200, size=n_items).astype(float),
+    })
+
+    first_of_level = np.searchsorted(level, level)
+    n_parents = np.where(level > 0, rng.integers(1, 4, size=n_items), 0)
+    child = np.repeat(np.arange(n_items), n_parents)
+    parent = (rng.random(len(child)) * first_of_level[child]).astype(np.int64)
+    edges = pd.DataFrame({"parent": parent, "child": child}).drop_duplicates()
+    bom = pd.DataFrame({
+        "parent": items["item"].to_numpy()[edges["parent"]],
+        "child": items["item"].to_numpy()[edges["child"]],
+        "qty_per": rng.integers(1, 3, size=len(edges)).astype(float),
+    })
+
+    # Factor semanal comun a todos los articulos finales (estacionalidad).
+    season = 1.0 + 0.15 * np.sin(np.arange(horizon) * 2 * np.pi / 13) + rng.normal(0, 0.05, size=horizon)
+    end_items = np.repeat(items["item"].to_numpy()[:n_end], horizon)
+    periods = np.tile(np.arange(horizon), n_end)
+    mps = pd.DataFrame({
+        "item": end_items,
+        "period": periods,
+        "quantity": rng.poisson(100 * np.tile(season, n_end)).astype(float),
+    })
+
+    # Se ajusta nivel por nivel: el bruto de un nivel depende del
+    # inventario ya fijado en los niveles superiores.
+    within_lead_time = np.arange(horizon)[None, :] < items["lead_time"].to_numpy()[:, None]
+    buffer = items["on_hand"].to_numpy()
+    items["on_hand"] = 0.0
+    plan = explode(items, bom, mps, horizon)
+    for level in range(plan.low_level_code.max() + 1):
+        rows = plan.low_level_code == level
+        covered = (plan.gross * within_lead_time).sum(axis=1)
+        items.loc[rows, "on_hand"] = covered[rows] + buffer[rows]
+        plan = explode(items, bom, mps, horizon)
+    return items, bom, mps
+
+
+def demo_routings(items, n_work_centers: int = 20, seed: int = 11) -> pd.DataFrame:
+    """Rutas sinteticas: de una a tres operaciones por articulo."""
+    rng = np.random.default_rng(seed)
+    keys = np.asarray(items)
+    n_operations = rng.integers(1, 4, size=len(keys))
+    item = np.repeat(keys, n_operations)
+    step = np.concatenate([np.arange(n) for n in n_operations])
+    return pd.DataFrame({
+        "item": item,
+        "work_center": np.char.add("CT-", rng.integers(1, n_work_centers + 1, size=len(item)).astype(str)),
+        "setup_time": rng.uniform(0.5, 3.0, size=len(item)).round(2),
+        "run_time": rng.uniform(0.01, 0.2, size=len(item)).round(3),
+        "offset": np.minimum(step, 1),
+    })
+
+
+def demo_capacity(load: pd.DataFrame, seed: int = 13) -> pd.DataFrame:
+    """Capacidad por centro alrededor de su carga semanal mediana, de modo
+    que algunos periodos queden sobrecargados.
+
+    ``load`` es la tabla de ``operation_loads`` (columnas ``work_center``,
+    ``period`` y ``hours``).
+    """
+    rng = np.random.default_rng(seed)
+    weekly = load.groupby(["work_center", "period"])["hours"].sum().groupby(level="work_center").median()
+    return pd.DataFrame({
+        "work_center": weekly.index.to_numpy(),
+        "capacity": (weekly.to_numpy() * rng.uniform(0.95, 1.15, size=len(weekly))).round(-1),
+    })
+
+
+def demo_lot_costs(n_items: int, seed: int = 17):
+    """Costo por pedido ``S`` y costo de mantener por periodo ``H``."""
+    rng = np.random.default_rng(seed)
+    return rng.uniform(100, 1500, size=n_items).round(2), rng.uniform(0.1, 2.0, size=n_items).round(3)
+
+
+def demo_demand_history(n_series: int = 1000, n_periods: int = 104, season_length: int = 13, seed: int = 23):
+    """Historia semanal sintetica: un tercio estable con tendencia, un tercio
+    estacional y un tercio intermitente."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(n_periods)
+    base = rng.uniform(20, 200, size=(n_series, 1))
+    trend = rng.normal(0, 0.3, size=(n_series, 1)) * t
+    seasonal = np.sin(2 * np.pi * t / season_length) * rng.uniform(0, 0.4, size=(n_series, 1)) * base
+    kind = np.arange(n_series) % 3
+    mean = np.maximum(base + trend + np.where(kind[:, None] == 1, seasonal, 0.0), 1.0)
+    history = rng.poisson(mean).astype(float)
+    intermittent = (kind == 2)[:, None] & (rng.random((n_series, n_periods)) < 0.75)
+    history[intermittent] = 0.0
+    return history
+
+
+def demo_aggregate(n_families: int = 50, horizon: int = 18, seed: int = 29):
+    """Familias de productos y demanda mensual estacional para la
+    planeacion agregada (costos en pesos por mes)."""
+    rng = np.random.default_rng(seed)
+    months = np.arange(horizon)
+    base = rng.uniform(2_000, 20_000, size=(n_families, 1))
+    amplitude = rng.uniform(0.1, 0.5, size=(n_families, 1))
+    phase = rng.uniform(0, 2 * np.pi, size=(n_families, 1))
+    demand = np.round(base * (1 + amplitude * np.sin(2 * np.pi * months / 12 + phase)))
+    productivity = rng.uniform(80, 160, size=n_families).round()
+    families = pd.DataFrame({
+        "family": np.char.add("FAM-", np.arange(1, n_families + 1).astype(str)),
+        "initial_workforce": np.round(base[:, 0] / productivity),
+        "initial_inventory": np.round(base[:, 0] * rng.uniform(0, 0.5, size=n_families)),
+        "units_per_worker": productivity,
+        "overtime_limit": np.round(productivity * 0.2),
+        "wage": rng.uniform(9_000, 14_000, size=n_families).round(-2),
+        "hire_cost": rng.uniform(5_000, 12_000, size=n_families).round(-2),
+        "fire_cost": rng.uniform(8_000, 20_000, size=n_families).round(-2),
+        "overtime_cost": rng.uniform(100, 180, size=n_families).round(2),
+        "subcontract_cost": rng.uniform(150, 260, size=n_families).round(2),
+        "holding_cost": rng.uniform(2, 8, size=n_families).round(2),
+        "backorder_cost": rng.uniform(15, 40, size=n_families).round(2),
+    })
+    return families, demand
+
+
+def demo_hierarchy(n_nodes: int = 50_000, levels: int = 6, seed: int = 31) -> pd.DataFrame:
+    """Arbol de costos sintetico (tabla ``hierarchy``): cada nivel tiene
+    mas nodos que el anterior y cada nodo cuelga de uno del nivel previo.
+    Solo las hojas traen valor propio; los totales se acumulan al leerlo."""
+    rng = np.random.default_rng(seed)
+    weights = np.geomspace(1, 8 ** (levels - 2), levels - 1)
+    sizes = np.maximum(np.round(weights / weights.sum() * (n_nodes - 1)).astype(int), 1)
+    sizes[-1] += n_nodes - 1 - sizes.sum()
+    level = np.concatenate([[0], np.repeat(np.arange(1, levels), sizes)])
+    starts = np.concatenate([[0], np.cumsum(np.concatenate([[1], sizes]))])
+    parent = np.full(n_nodes, -1)
+    for depth in range(1, levels):
+        lo, hi = starts[depth], starts[depth + 1]
+        parent[lo:hi] = np.sort(rng.integers(starts[depth - 1], starts[depth], size=hi - lo))
+    ids = np.char.add("N", np.arange(n_nodes).astype(str))
+    names = np.array(["Costo total", "Division", "Planta", "Linea", "Ensamble", "Componente", "Pieza"])
+    is_leaf = np.bincount(parent[1:], minlength=n_nodes) == 0
+    return pd.DataFrame({
+        "id": ids,
+        "parent": np.where(parent >= 0, ids[np.maximum(parent, 0)], ""),
+        "value": np.where(is_leaf, rng.lognormal(mean=6.0, sigma=1.0, size=n_nodes).round(2), 0.0),
+        "label": np.char.add(np.char.add(names[np.minimum(level, len(names) - 1)], " "), np.arange(n_nodes).astype(str)),
+    })
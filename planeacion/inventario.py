@@ -0,0 +1,105 @@
+"""Modelos de inventario vectorizados (Semana 2).
+
+Todas las funciones reciben una tabla de SKUs y calculan las politicas
+columna a columna, sin ciclos de Python por renglon.
+
+Columnas de entrada:
+
+* ``demand``: demanda anual (unidades / ano).
+* ``S``: costo de ordenar por pedido.
+* ``H``: costo de mantener una unidad durante un ano.
+* ``lead_time``: tiempo de entrega en periodos (semanas por defecto).
+* ``sigma_demand``: desviacion estandar de la demanda por periodo.
+* ``service_level``: nivel de servicio de ciclo deseado (0-1).
+* ``sigma_lead_time`` (opcional): desviacion estandar del lead time.
+"""
+
+import numpy as np
+import pandas as pd
+from scipy.special import ndtri
+
+REQUIRED_COLUMNS = ("demand", "S", "H", "lead_time", "sigma_demand", "service_level")
+
+
+def _column(skus, name):
+    return skus[name].to_numpy(dtype=np.float64, copy=False)
+
+
+def validate_skus(skus: pd.DataFrame) -> None:
+    """Verifica que la tabla tenga las columnas requeridas y valores validos."""
+    missing = [c for c in REQUIRED_COLUMNS if c not in skus.columns]
+    if missing:
+        raise ValueError(f"Faltan columnas en la tabla de SKUs: {', '.join(missing)}")
+
+    if (_column(skus, "H") <= 0).any():
+        raise ValueError("El costo de mantener (H) debe ser mayor que cero.")
+
+    for name, label in (("demand", "La demanda"), ("S", "El costo de ordenar (S)"), ("lead_time", "El lead time")):
+        if (_column(skus, name) < 0).any():
+            raise ValueError(f"{label} no puede ser negativo.")
+
+    service = _column(skus, "service_level")
+    if ((service <= 0) | (service >= 1)).any():
+        raise ValueError("El nivel de servicio debe estar entre 0 y 1 (exclusivo).")
+
+
+def service_factor(service_level) -> np.ndarray:
+    """Factor z de la normal estandar para un nivel de servicio de ciclo."""
+    return ndtri(np.asarray(service_level, dtype=np.float64))
+
+
+def inventory_policy(skus: pd.DataFrame, periods_per_year: float = 52.0) -> pd.DataFrame:
+    """Calcula EOQ, Safety Stock, punto de reorden y Cycle Stock por SKU.
+
+    ``periods_per_year`` convierte la demanda anual a la unidad de tiempo
+    del lead time (52 para semanas, 365 para dias).
+    """
+    validate_skus(skus)
+
+    demand = _column(skus, "demand")
+    S = _column(skus, "S")
+    H = _column(skus, "H")
+    lead_time = _column(skus, "lead_time")
+    sigma_demand = _column(skus, "sigma_demand")
+
+    z = service_factor(_column(skus, "service_level"))
+    demand_rate = demand / periods_per_year
+
+    # Varianza de la demanda durante el lead time; si se conoce la
+    # variabilidad del lead time se usa la formula combinada.
+    lead_time_variance = lead_time * sigma_demand**2
+    if "sigma_lead_time" in skus.columns:
+        lead_time_variance = lead_time_variance + (demand_rate * _column(skus, "sigma_lead_time")) ** 2
+
+    eoq = np.sqrt(2.0 * demand * S / H)
+    safety_stock = z * np.sqrt(lead_time_variance)
+    cycle_stock = eoq / 2.0
+    reorder_point = demand_rate * lead_time + safety_stock
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        orders_per_year = np.where(eoq > 0, demand / eoq, 0.0)
+
+    ordering_cost = orders_per_year * S
+    holding_cost = (cycle_stock + safety_stock) * H
+
+    return skus.assign(
+        eoq=eoq,
+        safety_stock=safety_stock,
+        reorder_point=reorder_point,
+        cycle_stock=cycle_stock,
+        average_inventory=cycle_stock + safety_stock,
+        orders_per_year=orders_per_year,
+        ordering_cost=ordering_cost,
+        holding_cost=holding_cost,
+        total_cost=ordering_cost + holding_cost,
+    )
+
+
+def policy_summary(policy: pd.DataFrame) -> dict:
+    """Agregados del catalogo para mostrar como metricas."""
+    return {
+        "skus": int(len(policy)),
+        "average_inventory": float(policy["average_inventory"].sum()),
+        "safety_stock": float(policy["safety_stock"].sum()),
+        "total_cost": float(policy["total_cost"].sum()),
+    }
@@ -0,0 +1,167 @@
+"""Jerarquias grandes (BOM, arboles de costos, mapas conceptuales) para
+graficas tipo sunburst (Semana 3).
+
+La jerarquia se lee de una tabla con ``id``, ``parent`` (vacio en las
+raices), ``value`` (valor propio del nodo) y opcionalmente ``label``.
+Al construirla se guardan los hijos en formato CSR (un arreglo con los
+hijos agrupados por padre y sus desplazamientos), la profundidad y el
+valor acumulado de cada nodo, calculado en una sola pasada de abajo
+hacia arriba (nivel por nivel, del mas profundo a las raices).
+
+``view(focus, depth)`` regresa solo los nodos a ``depth`` niveles o
+menos debajo del foco, de modo que el navegador nunca recibe el arbol
+completo; los niveles siguientes se piden al cambiar el foco.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+OTHERS = "__otros__"
+
+
+def _gather(offsets, order, nodes) -> np.ndarray:
+    """Hijos de ``nodes`` concatenados (en el orden de ``nodes``)."""
+    starts = offsets[nodes]
+    counts = offsets[nodes + 1] - starts
+    total = int(counts.sum())
+    if total == 0:
+        return np.zeros(0, dtype=np.int64)
+    shift = np.repeat(starts - np.concatenate([[0], np.cumsum(counts)[:-1]]), counts)
+    return order[np.arange(total) + shift]
+
+
+@dataclass
+class Hierarchy:
+    """Arbol (o bosque) en arreglos; los nodos se identifican por posicion."""
+
+    ids: pd.Index
+    labels: np.ndarray
+    parent: np.ndarray
+    depth: np.ndarray
+    value: np.ndarray
+    total: np.ndarray
+    child_offsets: np.ndarray
+    child_order: np.ndarray
+
+    @classmethod
+    def from_table(cls, table: pd.DataFrame, id="id", parent="parent", value="value", label="label"):
+        """Construye la jerarquia; lanza ``ValueError`` si hay ids repetidos,
+        padres inexistentes o ciclos."""
+        ids = pd.Index(table[id].astype(str).to_numpy(), name="id")
+        if ids.has_duplicates:
+            raise ValueError(f"Ids repetidos en la jerarquia: {', '.join(ids[ids.duplicated()][:5])}")
+        parents = table[parent].astype("string").fillna("").to_numpy(dtype=object)
+        parent_idx = ids.get_indexer(parents).astype(np.int64)
+        orphans = (parent_idx < 0) & (parents != "")
+        if orphans.any():
+            raise ValueError(f"Padres que no existen en la jerarquia: {', '.join(map(str, parents[orphans][:5]))}")
+        n = len(ids)
+        values = table[value].to_numpy(dtype=np.float64) if value in table.columns else np.zeros(n)
+        if (values < 0).any():
+            raise ValueError("Los valores de la jerarquia no pueden ser negativos.")
+        labels = table[label].astype(str).to_numpy(dtype=object) if label in table.columns else ids.to_numpy()
+
+        has_parent = parent_idx >= 0
+        children = np.flatnonzero(has_parent)
+        order = children[np.argsort(parent_idx[children], kind="stable")]
+        offsets = np.concatenate([[0], np.cumsum(np.bincount(parent_idx[children], minlength=n))])
+
+        # Profundidad por niveles desde las raices; lo que no se alcanza esta en un ciclo.
+        depth = np.full(n, -1, dtype=np.int64)
+        levels = [np.flatnonzero(~has_parent)]
+        while len(levels[-1]):
+            depth[levels[-1]] = len(levels) - 1
+            levels.append(_gather(offsets, order, levels[-1]))
+        if (depth < 0).any():
+            raise ValueError("La jerarquia tiene ciclos.")
+
+        total = values.copy()
+        for level in reversed(levels[1:-1]):
+            total += np.bincount(parent_idx[level], weights=total[level], minlength=n)
+        return cls(ids, labels, parent_idx, depth, values, total, offsets, order)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def nbytes(self) -> int:
+        arrays = (self.parent, self.depth, self.value, self.total, self.child_offsets, self.child_order)
+        return int(sum(a.nbytes for a in arrays) + self.ids.memory_usage(deep=True) + 64 * len(self.labels))
+
+    @property
+    def roots(self) -> np.ndarray:
+        return np.flatnonzero(self.parent < 0)
+
+    def n_children(self, nodes) -> np.ndarray:
+        nodes = np.asarray(nodes, dtype=np.int64)
+        return self.child_offsets[nodes + 1] - self.child_offsets[nodes]
+
+    def children(self, node) -> np.ndarray:
+        return self.child_order[self.child_offsets[node]:self.child_offsets[node + 1]]
+
+    def position(self, node_id) -> int:
+        return self.ids.get_loc(str(node_id))
+
+    def path(self, node_id) -> list:
+        """Ids desde la raiz hasta ``node_id`` (inclusive)."""
+        node = self.position(node_id)
+        path = []
+        while node >= 0:
+            path.append(self.ids[node])
+            node = self.parent[node]
+        return path[::-1]
+
+    def view(self, focus=None, depth: int = 2, max_nodes: int = 2000) -> pd.DataFrame:
+        """Nodos a ``depth`` niveles o menos debajo de ``focus`` (``None``:
+        todas las raices), con el valor acumulado de cada uno.
+
+        Se agregan niveles completos mientras quepan en ``max_nodes``. Si el
+        primer nivel no cabe, se conservan los hijos de mayor valor y el resto
+        se agrupa en un nodo "otros". ``more`` indica los nodos con hijos que
+        no se enviaron; ``parent`` es ``""`` en la cima de la vista.
+        """
+        if focus is None:
+            top = self.roots
+        else:
+            top = np.array([self.position(focus)], dtype=np.int64)
+        selected, tops = [top], len(top)
+        frontier, count = top, len(top)
+        for _ in range(max(int(depth), 0)):
+            nxt = _gather(self.child_offsets, self.child_order, frontier)
+            if not len(nxt):
+                break
+            if count + len(nxt) > max_nodes:
+                if len(selected) == 1:
+                    selected.append(nxt[np.argsort(-self.total[nxt], kind="stable")[:max(max_nodes - count - 1, 1)]])
+                break
+            selected.append(nxt)
+            frontier, count = nxt, count + len(nxt)
+        nodes = np.concatenate(selected)
+
+        parents = np.where(self.parent[nodes] >= 0, self.parent[nodes], 0)
+        view = pd.DataFrame({
+            "id": self.ids.to_numpy()[nodes],
+            "parent": np.where(np.arange(len(nodes)) < tops, "", self.ids.to_numpy()[parents]),
+            "label": self.labels[nodes],
+            "value": self.total[nodes],
+            "depth": self.depth[nodes] - self.depth[nodes[0]],
+            "children": self.n_children(nodes),
+        })
+        included = np.zeros(len(self), dtype=bool)
+        included[nodes] = True
+        shown = np.bincount(self.parent[nodes[tops:]], minlength=len(self))[nodes] if len(nodes) > tops else 0
+        view["more"] = view["children"] > shown
+
+        # Hijos que no cupieron en el primer nivel: un solo nodo "otros" por padre.
+        if len(selected) == 2 and len(selected[1]) < int(self.n_children(top).sum()):
+            missing = [(p, self.total[p] - self.value[p] - self.total[self.children(p)[included[self.children(p)]]].sum())
+                       for p in top]
+            others = pd.DataFrame([
+                {"id": f"{OTHERS}{self.ids[p]}", "parent": self.ids[p], "label": "Otros", "value": rest,
+                 "depth": 1, "children": 0, "more": True}
+                for p, rest in missing if rest > 0
+            ])
+            view = pd.concat([view, others], ignore_index=True)
+        return view
@@ -0,0 +1,246 @@
+"""Dimensionamiento de lotes para el PMP (Semana 4).
+
+Cada tecnica recibe una matriz de requerimientos netos (articulos x
+periodos) y regresa otra del mismo tamano con la cantidad a recibir en
+cada periodo. El trabajo se vectoriza sobre los articulos; los ciclos
+de Python solo recorren los periodos del horizonte.
+
+Costos: ``S`` es el costo por pedido y ``H`` el costo de mantener una
+unidad durante un periodo (ambos por articulo). El inventario se cobra
+al cierre de cada periodo.
+"""
+
+import numpy as np
+import pandas as pd
+
+POLICIES = ("L4L", "FOQ", "POQ", "Silver-Meal", "Wagner-Whitin")
+
+
+def _as_matrix(requirements) -> np.ndarray:
+    matrix = np.asarray(requirements, dtype=np.float64)
+    if matrix.ndim == 1:
+        matrix = matrix[None, :]
+    if (matrix < 0).any():
+        raise ValueError("Los requerimientos netos no pueden ser negativos.")
+    return matrix
+
+
+def _per_item(value, n_items: int) -> np.ndarray:
+    return np.broadcast_to(np.asarray(value, dtype=np.float64), (n_items,))
+
+
+def _prefix(matrix: np.ndarray) -> np.ndarray:
+    """Acumulado con un cero inicial: ``prefix[:, m]`` suma los periodos < m."""
+    return np.concatenate([np.zeros((matrix.shape[0], 1)), np.cumsum(matrix, axis=1)], axis=1)
+
+
+def lot_for_lot(requirements) -> np.ndarray:
+    """Lote por lote: se recibe exactamente el requerimiento de cada periodo."""
+    return _as_matrix(requirements).copy()
+
+
+def fixed_order_quantity(requirements, quantity) -> np.ndarray:
+    """Cantidad fija de pedido (por ejemplo, el EOQ de cada articulo).
+
+    Cuando el inventario no alcanza se piden tantos lotes de ``quantity``
+    como hagan falta para cubrir el periodo.
+    """
+    req = _as_matrix(requirements)
+    n_items, horizon = req.shape
+    quantity = _per_item(quantity, n_items)
+    if (quantity <= 0).any():
+        raise ValueError("La cantidad fija de pedido debe ser mayor que cero.")
+
+    lots = np.zeros_like(req)
+    inventory = np.zeros(n_items)
+    for t in range(horizon):
+        short = np.maximum(req[:, t] - inventory, 0.0)
+        lots[:, t] = np.ceil(short / quantity) * quantity
+        inventory += lots[:, t] - req[:, t]
+    return lots
+
+
+def periodic_order_quantity(requirements, periods) -> np.ndarray:
+    """POQ: cada pedido cubre los requerimientos de ``periods`` periodos."""
+    req = _as_matrix(requirements)
+    n_items, horizon = req.shape
+    periods = _per_item(periods, n_items).astype(np.int64)
+    if (periods < 1).any():
+        raise ValueError("El intervalo del POQ debe ser de al menos un periodo.")
+
+    prefix = _prefix(req)
+    rows = np.arange(n_items)
+    lots = np.zeros_like(req)
+    covered_until = np.zeros(n_items, dtype=np.int64)
+    for t in range(horizon):
+        order = (t >= covered_until) & (req[:, t] > 0)
+        end = np.minimum(t + periods, horizon)
+        lots[order, t] = prefix[rows[order], end[order]] - prefix[rows[order], t]
+        covered_until = np.where(order, end, covered_until)
+    return lots
+
+
+def poq_periods(requirements, S, H) -> np.ndarray:
+    """Intervalo del POQ a partir del EOQ y la demanda promedio por periodo."""
+    req = _as_matrix(requirements)
+    n_items = req.shape[0]
+    demand = req.mean(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        eoq = np.sqrt(2.0 * demand * _per_item(S, n_items) / _per_item(H, n_items))
+        periods = np.where(demand > 0, np.rint(eoq / demand), 1)
+    return np.maximum(periods, 1).astype(np.int64)
+
+
+def silver_meal(requirements, S, H) -> np.ndarray:
+    """Heuristica de Silver-Meal: se extiende la cobertura del pedido
+    mientras el costo promedio por periodo siga bajando."""
+    req = _as_matrix(requirements)
+    n_items, horizon = req.shape
+    S = _per_item(S, n_items)
+    H = _per_item(H, n_items)
+
+    rows = np.arange(n_items)
+    lots = np.zeros_like(req)
+    start = np.full(n_items, -1, dtype=np.int64)
+    holding = np.zeros(n_items)
+    average = np.zeros(n_items)
+    for t in range(horizon):
+        demand = req[:, t]
+        open_order = start >= 0
+        extended_holding = holding + H * (t - start) * demand
+        extended_average = (S + extended_holding) / (t - start + 1)
+
+        new_order = (demand > 0) & (~open_order | (extended_average > average))
+        extend = open_order & ~new_order
+
+        start = np.where(new_order, t, start)
+        holding = np.where(new_order, 0.0, np.where(extend, extended_holding, holding))
+        average = np.where(new_order, S, np.where(extend, extended_average, average))
+        has_order = start >= 0
+        lots[rows[has_order], start[has_order]] += demand[has_order]
+    return lots
+
+
+def wagner_whitin(requirements, S, H) -> np.ndarray:
+    """Solucion optima de Wagner-Whitin en O(n) amortizado por articulo.
+
+    Con ``S`` y ``H`` constantes en el tiempo, el costo de cubrir los
+    periodos ``j..t`` con un pedido en ``j`` es lineal en la demanda
+    acumulada ``D(t)``::
+
+        F(t) = H*W(t) + min_j [ G(j) - H*j*D(t) ]
+
+    Cada periodo ``j`` aporta una recta de pendiente ``-H*j`` (decreciente)
+    y las consultas en ``D(t)`` son no decrecientes, asi que el minimo se
+    mantiene con una envolvente convexa monotona (Wagelmans, van Hoesel y
+    Kolen): cada recta entra y sale de la envolvente una sola vez. Esta es
+    la forma eficiente del teorema del horizonte de planeacion: el ultimo
+    pedido optimo nunca retrocede. Las envolventes de todos los articulos
+    se actualizan a la vez con operaciones enmascaradas.
+    """
+    req = _as_matrix(requirements)
+    n_items, horizon = req.shape
+    S = _per_item(S, n_items)
+    H = _per_item(H, n_items)
+    if (H <= 0).any():
+        raise ValueError("Wagner-Whitin requiere un costo de mantener mayor que cero.")
+
+    rows = np.arange(n_items)
+    D = _prefix(req)
+    W = _prefix(req * np.arange(horizon))
+
+    F = np.zeros((n_items, horizon + 1))
+    intercept = np.zeros((n_items, horizon))
+    hull = np.zeros((n_items, horizon), dtype=np.int64)
+    head = np.zeros(n_items, dtype=np.int64)
+    tail = np.full(n_items, -1, dtype=np.int64)
+    last_order = np.zeros((n_items, horizon), dtype=np.int64)
+
+    def value(r, j, x):
+        return intercept[r, j] - H[r] * j * x
+
+    for t in range(horizon):
+        # Recta del pedido en t: G(t) = F(t-1) + S - H*W(t) + H*t*D(t).
+        intercept[:, t] = F[:, t] + S - H * W[:, t] + H * t * D[:, t]
+        while True:
+            pop = tail - head >= 1
+            if not pop.any():
+                break
+            r = rows[pop]
+            l1, l2 = hull[r, tail[r] - 1], hull[r, tail[r]]
+            m1, m2, m3 = -H[r] * l1, -H[r] * l2, -H[r] * t
+            b1, b2, b3 = intercept[r, l1], intercept[r, l2], intercept[r, t]
+            useless = (b3 - b1) * (m1 - m2) <= (b2 - b1) * (m1 - m3)
+            if not useless.any():
+                break
+            tail[r[useless]] -= 1
+        tail += 1
+        hull[rows, tail] = t
+
+        x = D[:, t + 1]
+        while True:
+            advance = tail > head
+            if not advance.any():
+                break
+            r = rows[advance]
+            better = value(r, hull[r, head[r] + 1], x[r]) <= value(r, hull[r, head[r]], x[r])
+            if not better.any():
+                break
+            head[r[better]] += 1
+
+        best = hull[rows, head]
+        last_order[:, t] = best
+        cost = H * W[:, t + 1] + value(rows, best, x)
+        F[:, t + 1] = np.where(x > 0, cost, 0.0)
+
+    # Reconstruccion: desde el final, el pedido en j cubre los periodos j..t.
+    lots = np.zeros_like(req)
+    t = np.full(n_items, horizon - 1, dtype=np.int64)
+    active = D[:, horizon] > 0
+    while active.any():
+        r = rows[active]
+        j = last_order[r, t[r]]
+        lots[r, j] = D[r, t[r] + 1] - D[r, j]
+        t[r] = j - 1
+        active[r] = (t[r] >= 0) & (D[r, np.maximum(t[r], 0) + 1] > 0)
+    return lots
+
+
+def lot_sizing_cost(requirements, lots, S, H) -> pd.DataFrame:
+    """Costo de pedir, de mantener y total de un plan de lotes por articulo."""
+    req = _as_matrix(requirements)
+    lots = _as_matrix(lots)
+    n_items = req.shape[0]
+    inventory = np.cumsum(lots - req, axis=1)
+    if (inventory < -1e-6).any():
+        raise ValueError("El plan de lotes no cubre los requerimientos.")
+    ordering = _per_item(S, n_items) * (lots > 0).sum(axis=1)
+    holding = _per_item(H, n_items) * np.maximum(inventory, 0.0).sum(axis=1)
+    return pd.DataFrame({"ordering_cost": ordering, "holding_cost": holding, "total_cost": ordering + holding})
+
+
+def compare_policies(requirements, S, H, quantity=None, periods=None):
+    """Evalua todas las tecnicas para todo el catalogo en una corrida.
+
+    ``quantity`` (FOQ) y ``periods`` (POQ) se derivan del EOQ si se omiten.
+    Regresa una tabla articulo x tecnica con el costo total, la mejor
+    tecnica por articulo y un diccionario con los planes de lotes.
+    """
+    req = _as_matrix(requirements)
+    n_items = req.shape[0]
+    if quantity is None:
+        demand = req.mean(axis=1)
+        quantity = np.maximum(np.sqrt(2.0 * demand * _per_item(S, n_items) / _per_item(H, n_items)), 1.0)
+    if periods is None:
+        periods = poq_periods(req, S, H)
+
+    plans = {
+        "L4L": lot_for_lot(req),
+        "FOQ": fixed_order_quantity(req, quantity),
+        "POQ": periodic_order_quantity(req, periods),
+        "Silver-Meal": silver_meal(req, S, H),
+        "Wagner-Whitin": wagner_whitin(req, S, H),
+    }
+    costs = pd.DataFrame({name: lot_sizing_cost(req, lots, S, H)["total_cost"] for name, lots in plans.items()})
+    costs["best"] = costs[list(POLICIES)].idxmin(axis=1)
+    return costs, plans
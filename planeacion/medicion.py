@@ -0,0 +1,126 @@
+"""Instrumentacion opcional: tiempos por tramo (span) del codigo.
+
+``TRACER.span(nombre)`` es un administrador de contexto que mide el
+tiempo de su bloque. La medicion se activa por hilo con
+``TRACER.begin(True)``; Streamlit ejecuta cada sesion en su propio hilo,
+asi que una sesion puede medir sin afectar a las demas. Desactivado,
+``span`` regresa un contexto vacio compartido: el costo es una llamada
+y la lectura de un atributo.
+
+Los tramos del rerun en curso quedan en ``spans()``. ``run`` (opcional)
+regresa un identificador del rerun en curso: si cambia sin pasar por
+``begin`` (un fragmento que se vuelve a ejecutar solo), los tramos se
+limpian al medir el primero del nuevo rerun. Ademas se acumulan
+(conteo, suma y maximo por nombre) entre todas las sesiones y se
+exportan como JSON o en el formato de texto de Prometheus.
+"""
+
+import contextlib
+import json
+import threading
+import time
+from pathlib import Path
+
+_NULL = contextlib.nullcontext()
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "start")
+
+    def __init__(self, tracer, name):
+        self.tracer = tracer
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.tracer._record(self.name, time.perf_counter() - self.start)
+        return False
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class Tracer:
+    """Tramos medidos por hilo y estadisticas acumuladas por nombre."""
+
+    def __init__(self, run=None):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._stats = {}
+        self.run = run
+
+    @property
+    def enabled(self) -> bool:
+        return getattr(self._local, "enabled", False)
+
+    def begin(self, enabled: bool) -> None:
+        """Inicia un rerun en este hilo: activa o desactiva la medicion y
+        limpia los tramos del rerun anterior."""
+        self._local.enabled = bool(enabled)
+        self._local.spans = []
+        self._local.run = self.run() if self.run is not None else None
+
+    def span(self, name: str):
+        if not getattr(self._local, "enabled", False):
+            return _NULL
+        if self.run is not None:
+            run = self.run()
+            if run is not self._local.run:
+                self._local.spans = []
+                self._local.run = run
+        return _Span(self, name)
+
+    def _record(self, name: str, seconds: float) -> None:
+        self._local.spans.append((name, seconds))
+        with self._lock:
+            count, total, peak = self._stats.get(name, (0, 0.0, 0.0))
+            self._stats[name] = (count + 1, total + seconds, max(peak, seconds))
+
+    def spans(self) -> list:
+        """Tramos ``(nombre, segundos)`` del rerun en curso en este hilo,
+        en el orden en que terminaron."""
+        return list(getattr(self._local, "spans", []))
+
+    def stats(self) -> dict:
+        """``{nombre: {"count", "sum_s", "max_s"}}`` de todas las sesiones."""
+        with self._lock:
+            items = list(self._stats.items())
+        return {name: {"count": c, "sum_s": s, "max_s": m} for name, (c, s, m) in sorted(items)}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    def to_json(self) -> str:
+        return json.dumps({"timestamp": time.time(), "spans": self.stats()}, indent=2)
+
+    def to_prometheus(self, prefix: str = "planeacion") -> str:
+        metric = f"{prefix}_span_seconds"
+        lines = [
+            f"# HELP {metric} Duracion de los tramos instrumentados.",
+            f"# TYPE {metric} summary",
+        ]
+        stats = self.stats()
+        for name, row in stats.items():
+            lines.append(f'{metric}_count{{span="{_label(name)}"}} {row["count"]}')
+            lines.append(f'{metric}_sum{{span="{_label(name)}"}} {row["sum_s"]:.9f}')
+        lines += [f"# HELP {metric}_max Duracion maxima observada.", f"# TYPE {metric}_max gauge"]
+        for name, row in stats.items():
+            lines.append(f'{metric}_max{{span="{_label(name)}"}} {row["max_s"]:.9f}')
+        return "\n".join(lines) + "\n"
+
+    def export(self, path) -> Path:
+        """Escribe las estadisticas en ``path``: Prometheus si termina en
+        ``.prom`` o ``.txt``, JSON en otro caso."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        text = self.to_prometheus() if path.suffix in (".prom", ".txt") else self.to_json()
+        path.write_text(text, encoding="utf-8")
+        return path
+
+
+TRACER = Tracer()
@@ -0,0 +1,312 @@
+"""Explosion MRP multinivel con codigos de bajo nivel (Semana 4).
+
+El calculo se hace por nivel y no por articulo: todos los articulos con
+el mismo codigo de bajo nivel se netean, desfasan y liberan en una sola
+operacion matricial (articulos x periodos), y sus liberaciones se
+explotan a los componentes del siguiente nivel antes de continuar.
+
+``net_change`` regenera un plan existente tras cambios en el PMP, el
+inventario disponible o los lead times, re-explotando solo el subarbol
+y los periodos que realmente cambian.
+
+Tablas de entrada:
+
+* ``items``: ``item``, ``lead_time`` (periodos), ``on_hand`` y
+  opcionalmente ``safety_stock``.
+* ``bom``: ``parent``, ``child``, ``qty_per`` y opcionalmente ``scrap``
+  (fraccion de merma que se agrega al requerimiento del componente), o
+  un ``BOM`` ya construido con el mismo orden de articulos.
+* ``mps``: ``item``, ``period``, ``quantity`` (demanda independiente).
+* ``receipts`` (opcional): ``item``, ``period``, ``quantity``.
+"""
+
+from dataclasses import dataclass, replace
+
+import numpy as np
+import pandas as pd
+
+from planeacion.bom import BOM
+
+RECORD_ROWS = (
+    ("gross", "Requerimiento bruto"),
+    ("scheduled", "Recepciones programadas"),
+    ("projected", "Inventario proyectado"),
+    ("net", "Requerimiento neto"),
+    ("receipts", "Recepcion planeada"),
+    ("releases", "Liberacion planeada"),
+)
+
+
+@dataclass
+class MRPPlan:
+    """Resultado de una explosion: matrices de articulos x periodos."""
+
+    items: np.ndarray
+    low_level_code: np.ndarray
+    gross: np.ndarray
+    scheduled: np.ndarray
+    projected: np.ndarray
+    net: np.ndarray
+    receipts: np.ndarray
+    releases: np.ndarray
+    past_due: np.ndarray
+    # Entradas de la explosion, necesarias para la regeneracion net-change.
+    independent: np.ndarray
+    on_hand: np.ndarray
+    lead_time: np.ndarray
+    safety_stock: np.ndarray
+    bom: BOM
+
+    @property
+    def horizon(self) -> int:
+        return self.gross.shape[1]
+
+    def index_of(self, item) -> int:
+        matches = np.flatnonzero(self.items == item)
+        if not len(matches):
+            raise KeyError(f"Articulo desconocido: {item}")
+        return int(matches[0])
+
+    def record(self, item) -> pd.DataFrame:
+        """Registro MRP clasico (filas de conceptos, columnas de periodos)."""
+        i = self.index_of(item)
+        columns = [f"S{t + 1}" for t in range(self.horizon)]
+        return pd.DataFrame(
+            [getattr(self, attr)[i] for attr, _ in RECORD_ROWS],
+            index=[label for _, label in RECORD_ROWS],
+            columns=columns,
+        )
+
+    def peg(self, item, period: int) -> pd.DataFrame:
+        """Articulos finales y semanas del PMP que generan el requerimiento
+        bruto de ``item`` en ``period``."""
+        return self.bom.peg(item, period, self.releases, self.receipts, self.lead_time, self.independent)
+
+    def orders(self) -> pd.DataFrame:
+        """Ordenes planeadas en formato largo (solo periodos con cantidad)."""
+        rows, periods = np.nonzero(self.releases)
+        return pd.DataFrame({
+            "item": self.items[rows],
+            "low_level_code": self.low_level_code[rows],
+            "release_period": periods,
+            "quantity": self.releases[rows, periods],
+        })
+
+
+def _item_index(items: pd.DataFrame) -> pd.Index:
+    index = pd.Index(items["item"])
+    if not index.is_unique:
+        raise ValueError("La tabla de articulos tiene claves repetidas.")
+    return index
+
+
+def _to_matrix(table, index: pd.Index, horizon: int) -> np.ndarray:
+    matrix = np.zeros((len(index), horizon))
+    if table is None or not len(table):
+        return matrix
+    rows = index.get_indexer(table["item"])
+    if (rows < 0).any():
+        raise ValueError("Hay cantidades para articulos que no existen en la tabla de articulos.")
+    periods = table["period"].to_numpy(dtype=np.int64)
+    keep = (periods >= 0) & (periods < horizon)
+    np.add.at(matrix, (rows[keep], periods[keep]), table["quantity"].to_numpy(dtype=np.float64)[keep])
+    return matrix
+
+
+def net_requirements(gross, scheduled, on_hand, safety_stock):
+    """Neteo lote por lote para un bloque de articulos (filas) a la vez.
+
+    La recepcion planeada acumulada es el minimo no decreciente que
+    mantiene el inventario proyectado por encima del stock de seguridad,
+    por lo que se obtiene con un maximo acumulado sobre los periodos.
+    """
+    shortfall = np.cumsum(gross - scheduled, axis=1) - (on_hand - safety_stock)[:, None]
+    cumulative = np.maximum(np.maximum.accumulate(shortfall, axis=1), 0.0)
+    receipts = np.diff(cumulative, axis=1, prepend=0.0)
+    projected = on_hand[:, None] + np.cumsum(scheduled + receipts - gross, axis=1)
+    net = np.maximum(receipts, 0.0)
+    return projected, net, receipts
+
+
+def offset_releases(receipts, lead_time):
+    """Desfasa las recepciones planeadas por el lead time de cada fila.
+
+    Lo que tendria que liberarse antes del periodo 0 se acumula como
+    atrasado (``past_due``) y se libera en el primer periodo.
+    """
+    n, horizon = receipts.shape
+    releases = np.zeros_like(receipts)
+    release_period = np.arange(horizon)[None, :] - lead_time[:, None]
+    on_time = release_period >= 0
+    rows = np.broadcast_to(np.arange(n)[:, None], receipts.shape)
+    releases[rows[on_time], release_period[on_time]] = receipts[on_time]
+    past_due = np.where(on_time, 0.0, receipts).sum(axis=1)
+    releases[:, 0] += past_due
+    return releases, past_due
+
+
+def _explode_rows(rows, gross, bom, usage, delta):
+    """Suma ``delta`` (liberaciones de ``rows``) al bruto de sus componentes.
+
+    Regresa los componentes afectados y el primer periodo en que cambia
+    su requerimiento bruto.
+    """
+    edges = bom.children_edges(rows)
+    if not len(edges):
+        return edges, edges
+    owner = np.repeat(np.arange(len(rows)), bom.child_ptr[rows + 1] - bom.child_ptr[rows])
+    children = bom.child[edges].astype(np.int64)
+    np.add.at(gross, children, delta[owner] * usage[edges, None])
+    changed = delta != 0
+    first = np.where(changed.any(axis=1), changed.argmax(axis=1), delta.shape[1])
+    return children, first[owner]
+
+
+def explode(items, bom, mps, horizon: int, receipts=None) -> MRPPlan:
+    """Ejecuta la explosion MRP completa en una sola pasada por niveles."""
+    index = _item_index(items)
+    n_items = len(index)
+
+    if not isinstance(bom, BOM):
+        bom = BOM.from_frame(bom, index)
+    elif not bom.items.equals(index):
+        raise ValueError("La BOM y la tabla de articulos no tienen el mismo orden de articulos.")
+    usage = bom.usage
+
+    llc = bom.low_level_codes()
+    lead_time = items["lead_time"].to_numpy(dtype=np.int64)
+    on_hand = items["on_hand"].to_numpy(dtype=np.float64)
+    if "safety_stock" in items.columns:
+        safety_stock = items["safety_stock"].to_numpy(dtype=np.float64)
+    else:
+        safety_stock = np.zeros(n_items)
+
+    independent = _to_matrix(mps, index, horizon)
+    gross = independent.copy()
+    scheduled = _to_matrix(receipts, index, horizon)
+    projected = np.empty_like(gross)
+    net = np.empty_like(gross)
+    planned = np.empty_like(gross)
+    releases = np.empty_like(gross)
+    past_due = np.empty(n_items)
+
+    item_order = np.argsort(llc, kind="stable")
+    item_bounds = np.searchsorted(llc[item_order], np.arange(llc.max() + 2))
+
+    for level in range(llc.max() + 1):
+        rows = item_order[item_bounds[level]:item_bounds[level + 1]]
+        projected[rows], net[rows], planned[rows] = net_requirements(
+            gross[rows], scheduled[rows], on_hand[rows], safety_stock[rows]
+        )
+        releases[rows], past_due[rows] = offset_releases(planned[rows], lead_time[rows])
+        _explode_rows(rows, gross, bom, usage, releases[rows])
+
+    return MRPPlan(
+        items=index.to_numpy(),
+        low_level_code=llc,
+        gross=gross,
+        scheduled=scheduled,
+        projected=projected,
+        net=net,
+        receipts=planned,
+        releases=releases,
+        past_due=past_due,
+        independent=independent,
+        on_hand=on_hand,
+        lead_time=lead_time,
+        safety_stock=safety_stock,
+        bom=bom,
+    )
+
+
+def net_change(plan: MRPPlan, mps=None, on_hand=None, lead_time=None, tolerance: float = 1e-9):
+    """Regenera ``plan`` aplicando solo los cambios indicados.
+
+    * ``mps``: tabla ``item``, ``period``, ``quantity`` con las nuevas
+      cantidades del PMP (reemplazan a las anteriores en esas celdas).
+    * ``on_hand`` / ``lead_time``: mapeos ``item -> nuevo valor``.
+
+    Solo se re-netean los articulos cuyo requerimiento bruto, inventario o
+    lead time cambian, y solo desde el primer periodo afectado; los
+    componentes se visitan unicamente si las liberaciones del padre se
+    modifican. Regresa el nuevo plan y los indices de los articulos
+    recalculados; el plan original no se modifica.
+    """
+    new = replace(
+        plan,
+        gross=plan.gross.copy(),
+        projected=plan.projected.copy(),
+        net=plan.net.copy(),
+        receipts=plan.receipts.copy(),
+        releases=plan.releases.copy(),
+        past_due=plan.past_due.copy(),
+        independent=plan.independent.copy(),
+        on_hand=plan.on_hand.copy(),
+        lead_time=plan.lead_time.copy(),
+    )
+    index = plan.bom.items
+    usage = plan.bom.usage
+    horizon = plan.horizon
+    n_items = len(index)
+
+    # Primer periodo afectado por articulo (``horizon`` = solo re-desfasar).
+    start = np.full(n_items, horizon + 1, dtype=np.int64)
+
+    if mps is not None and len(mps):
+        rows = index.get_indexer(mps["item"])
+        if (rows < 0).any():
+            raise ValueError("El cambio de PMP referencia articulos inexistentes.")
+        periods = mps["period"].to_numpy(dtype=np.int64)
+        keep = (periods >= 0) & (periods < horizon)
+        rows, periods = rows[keep], periods[keep]
+        quantity = mps["quantity"].to_numpy(dtype=np.float64)[keep]
+        new.gross[rows, periods] += quantity - new.independent[rows, periods]
+        new.independent[rows, periods] = quantity
+        np.minimum.at(start, rows, periods)
+
+    for values, target, first in ((on_hand, new.on_hand, 0), (lead_time, new.lead_time, horizon)):
+        if not values:
+            continue
+        rows = index.get_indexer(list(values))
+        if (rows < 0).any():
+            raise ValueError("El cambio referencia articulos inexistentes.")
+        target[rows] = list(values.values())
+        np.minimum.at(start, rows, first)
+
+    pending = np.flatnonzero(start <= horizon)
+    regenerated = [pending]
+    while len(pending):
+        level = new.low_level_code[pending].min()
+        rows = pending[new.low_level_code[pending] == level]
+        pending = pending[new.low_level_code[pending] != level]
+
+        first = int(start[rows].min())
+        if first < horizon:
+            initial = new.on_hand[rows] if first == 0 else new.projected[rows, first - 1]
+            (
+                new.projected[rows, first:],
+                new.net[rows, first:],
+                new.receipts[rows, first:],
+            ) = net_requirements(
+                new.gross[rows, first:],
+                new.scheduled[rows, first:],
+                initial,
+                new.safety_stock[rows],
+            )
+
+        releases, new.past_due[rows] = offset_releases(new.receipts[rows], new.lead_time[rows])
+        delta = releases - new.releases[rows]
+        delta[np.abs(delta) <= tolerance] = 0.0
+        new.releases[rows] = releases
+
+        moved = delta.any(axis=1)
+        children, child_start = _explode_rows(
+            rows[moved], new.gross, new.bom, usage, delta[moved]
+        )
+        if len(children):
+            np.minimum.at(start, children, child_start)
+            children = np.unique(children)
+            regenerated.append(children)
+            pending = np.union1d(pending, children)
+
+    return new, np.unique(np.concatenate(regenerated))
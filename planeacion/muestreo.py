@@ -0,0 +1,134 @@
+"""Reduccion de series largas para graficarlas (Semanas 3 y 4).
+
+Una grafica de 1,000 pixeles de ancho no puede mostrar mas de unos
+cuantos puntos por pixel; enviar cada periodo de 104 semanas x cientos
+de centros de trabajo solo agranda el JSON de la figura y el tiempo de
+dibujo del navegador. Los metodos regresan los *indices* de los puntos
+que se conservan, de modo que ``x``, ``y`` y el texto de cada punto se
+recortan igual:
+
+* ``lttb``: Largest-Triangle-Three-Buckets. Conserva la forma visual de
+  la serie eligiendo, en cada cubeta, el punto que forma el triangulo
+  mas grande con el punto elegido antes y el promedio de la cubeta
+  siguiente.
+* ``min_max``: el minimo y el maximo de cada cubeta. Nunca pierde un
+  pico (por ejemplo, una semana sobrecargada en CRP).
+
+``downsample`` ademas conserva los huecos (``NaN``): agrega el primer
+faltante de cada cubeta que tenga alguno, para que la linea se corte
+donde se cortaba la serie original.
+
+``compact`` reduce el tipo de los arreglos (``float32`` o el entero mas
+chico que alcance) para que viajen como arreglos tipados de menos bytes.
+"""
+
+import numpy as np
+
+METHODS = ("lttb", "min_max")
+
+
+def _positions(x, n: int) -> np.ndarray:
+    if x is None:
+        return np.arange(n, dtype=np.float64)
+    x = np.asarray(x)
+    if x.dtype.kind in "iuf":
+        return x.astype(np.float64)
+    if x.dtype.kind == "M":
+        return x.astype("datetime64[ns]").astype(np.int64).astype(np.float64)
+    # Categorias (etiquetas de semana, SKUs, ...): equiespaciadas.
+    return np.arange(n, dtype=np.float64)
+
+
+def lttb(y, n_out: int, x=None) -> np.ndarray:
+    """Indices (ordenados) de a lo mas ``n_out`` puntos de ``y`` por LTTB."""
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    px = _positions(x, n)
+
+    # Cubetas de los puntos interiores; el primero y el ultimo siempre quedan.
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    finite = np.isfinite(y)
+    sums_y = np.add.reduceat(np.where(finite, y, 0.0), edges[:-1])
+    sums_x = np.add.reduceat(np.where(finite, px, 0.0), edges[:-1])
+    counts = np.add.reduceat(finite.astype(np.int64), edges[:-1])
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean_x = np.append(sums_x / counts, px[-1])
+        mean_y = np.append(sums_y / counts, y[-1])
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        # El doble del area del triangulo (a, punto, promedio siguiente).
+        area = np.abs(
+            (px[a] - mean_x[i + 1]) * (y[lo:hi] - y[a]) - (px[a] - px[lo:hi]) * (mean_y[i + 1] - y[a])
+        )
+        a = lo + int(np.argmax(np.where(np.isnan(area), -1.0, area)))
+        selected[i + 1] = a
+    return selected
+
+
+def min_max(y, n_out: int) -> np.ndarray:
+    """Indices (ordenados) del minimo y el maximo de ``n_out // 2`` cubetas."""
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if n_out >= n or n_out < 4:
+        return np.arange(n)
+    size = -(-n // (n_out // 2))
+    buckets = -(-n // size)
+    padded = np.full(buckets * size, np.nan)
+    padded[:n] = y
+    padded = padded.reshape(buckets, size)
+    missing = np.isnan(padded)
+    low = np.where(missing, np.inf, padded).argmin(axis=1)
+    high = np.where(missing, -np.inf, padded).argmax(axis=1)
+    offsets = np.arange(buckets) * size
+    indices = np.concatenate([[0, n - 1], offsets + low, offsets + high])
+    return np.unique(indices[indices < n])
+
+
+def downsample(y, n_out: int, x=None, method: str = "lttb") -> np.ndarray:
+    """Indices de unos ``n_out`` puntos a graficar con ``method`` (``METHODS``)."""
+    if method == "lttb":
+        indices = lttb(y, n_out, x)
+    elif method == "min_max":
+        indices = min_max(y, n_out)
+    else:
+        raise ValueError(f"Metodo de muestreo desconocido: {method!r} (opciones: {', '.join(METHODS)})")
+    missing = np.flatnonzero(np.isnan(np.asarray(y, dtype=np.float64)))
+    if len(indices) == len(y) or not len(missing):
+        return indices
+    size = -(-len(y) // max(n_out // 2, 1))
+    _, first = np.unique(missing // size, return_index=True)
+    return np.union1d(indices, missing[first])
+
+
+def compact(values) -> np.ndarray:
+    """``values`` con el tipo mas chico que no cambia lo que se grafica.
+
+    Enteros (o flotantes sin decimales ni ``NaN``) pasan al entero con
+    signo mas chico que los contiene; los demas flotantes a ``float32``
+    (7 cifras significativas, de sobra para una grafica). Fechas, texto
+    y booleanos se regresan sin cambio.
+    """
+    array = np.asarray(values)
+    if array.dtype.kind == "f":
+        finite = np.isfinite(array)
+        if array.size and finite.all() and np.array_equal(array, np.round(array)):
+            if np.abs(array).max() < 2**31:
+                array = array.astype(np.int64)
+        else:
+            too_large = finite & (np.abs(np.where(finite, array, 0.0)) > np.finfo(np.float32).max)
+            return array if too_large.any() else array.astype(np.float32)
+    if array.dtype.kind in "iu":
+        if not array.size:
+            return array.astype(np.int8)
+        low, high = int(array.min()), int(array.max())
+        for dtype in (np.int8, np.int16, np.int32):
+            info = np.iinfo(dtype)
+            if info.min <= low and high <= info.max:
+                return array.astype(dtype)
+    return array
@@ -0,0 +1,233 @@
+"""Politicas de inventario multi-articulo (Semana 2).
+
+``constrained_eoq`` calcula los lotes de todo el catalogo sujetos a un
+presupuesto de inversion y a un espacio de almacen compartidos::
+
+    min  sum D*S/Q + H*Q/2
+    s.a. sum c*Q <= presupuesto      (c: costo unitario)
+         sum w*Q <= espacio          (w: espacio por unidad)
+
+Con multiplicadores de Lagrange ``lam`` y ``mu`` el lote de cada
+articulo tiene forma cerrada::
+
+    Q = sqrt(2*D*S / (H + 2*lam*c + 2*mu*w))
+
+y el problema se reduce a encontrar dos escalares. ``mu`` se busca por
+biseccion y, para cada ``mu``, ``lam`` con Newton protegido (el uso del
+presupuesto es convexo y decreciente en ``lam``); cada evaluacion
+actualiza todos los articulos a la vez.
+
+``abc_xyz`` clasifica el catalogo por valor anual (ABC) y por
+variabilidad de la demanda (XYZ) para fijar politicas por clase.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass
+class ConstrainedPolicy:
+    """Lotes con restricciones, multiplicadores y uso de los recursos."""
+
+    policy: pd.DataFrame
+    budget_multiplier: float
+    space_multiplier: float
+    budget_used: float
+    space_used: float
+
+    @property
+    def cost_increase(self) -> float:
+        """Costo anual adicional frente al EOQ sin restricciones."""
+        return float(self.policy["total_cost"].sum() - self.policy["unconstrained_cost"].sum())
+
+
+def _column(skus, name):
+    if name not in skus.columns:
+        raise ValueError(f"Falta la columna requerida: {name}")
+    return skus[name].to_numpy(dtype=np.float64)
+
+
+class _Lots:
+    """Evalua ``Q(lam, mu)`` y el uso de los recursos para todo el catalogo."""
+
+    def __init__(self, demand, S, H, weights):
+        self.scale = np.sqrt(2.0 * demand * S)
+        self.H = H
+        self.weights = weights
+
+    def quantity(self, multipliers):
+        return self.scale / np.sqrt(self.H + 2.0 * (multipliers @ self.weights))
+
+    def usage(self, multipliers):
+        return self.weights @ self.quantity(multipliers)
+
+    def budget_slope(self, multipliers):
+        # d/d lam de sum c*Q = -sum c^2 * Q^3 / (2*D*S)
+        q = self.quantity(multipliers)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            factor = np.where(self.scale > 0, q**3 / self.scale**2, 0.0)
+        return self.weights @ q, -(self.weights[0] ** 2) @ factor
+
+
+def _solve_budget(lots, mu, budget, tolerance, max_iter, start=0.0):
+    """Menor ``lam`` >= 0 con ``sum c*Q <= budget`` (Newton protegido).
+
+    Desde un ``start`` a la izquierda de la raiz Newton avanza de forma
+    monotona; desde la derecha el primer paso la cruza y luego converge.
+    """
+    multipliers = np.array([0.0, mu])
+    if lots.usage(multipliers)[0] <= budget:
+        return 0.0
+    lam = start
+    for _ in range(max_iter):
+        multipliers[0] = lam
+        usage, slope = lots.budget_slope(multipliers)
+        excess = usage[0] - budget
+        if abs(excess) <= tolerance * budget or slope >= 0:
+            break
+        lam = max(lam - excess / slope, 0.0)
+    return lam
+
+
+def constrained_eoq(
+    skus: pd.DataFrame,
+    budget=None,
+    space=None,
+    cost_column: str = "unit_cost",
+    space_column: str = "unit_space",
+    tolerance: float = 1e-6,
+    max_iter: int = 100,
+) -> ConstrainedPolicy:
+    """EOQ multi-articulo con restricciones de presupuesto y espacio.
+
+    ``budget`` limita la inversion en lotes ``sum c*Q`` y ``space`` el
+    espacio ``sum w*Q``; cualquiera puede omitirse. Al final los lotes se
+    escalan, si hace falta, para que ambas restricciones se cumplan
+    exactamente a pesar de la tolerancia numerica.
+    """
+    demand = _column(skus, "demand")
+    S = _column(skus, "S")
+    H = _column(skus, "H")
+    if (H <= 0).any():
+        raise ValueError("El costo de mantener (H) debe ser mayor que cero.")
+    cost = _column(skus, cost_column) if budget is not None else np.zeros(len(skus))
+    unit_space = _column(skus, space_column) if space is not None else np.zeros(len(skus))
+    for limit, name in ((budget, "presupuesto"), (space, "espacio")):
+        if limit is not None and limit <= 0:
+            raise ValueError(f"El {name} debe ser mayor que cero.")
+
+    lots = _Lots(demand, S, H, np.stack([cost, unit_space]))
+    budget_limit = np.inf if budget is None else float(budget)
+    space_limit = np.inf if space is None else float(space)
+
+    lam = _solve_budget(lots, 0.0, budget_limit, tolerance, max_iter)
+    mu = 0.0
+    if lots.usage(np.array([lam, 0.0]))[1] > space_limit:
+        # El espacio se viola: biseccion sobre mu. Al crecer mu los lotes
+        # bajan, asi que lam(mu) solo puede bajar y sirve de arranque.
+        low, high = 0.0, 1.0
+        while True:
+            lam_high = _solve_budget(lots, high, budget_limit, tolerance, max_iter)
+            if lots.usage(np.array([lam_high, high]))[1] <= space_limit:
+                break
+            low, high = high, high * 2.0
+        for _ in range(max_iter):
+            middle = 0.5 * (low + high)
+            lam_middle = _solve_budget(lots, middle, budget_limit, tolerance, max_iter, start=lam_high)
+            if lots.usage(np.array([lam_middle, middle]))[1] > space_limit:
+                low = middle
+            else:
+                high, lam_high = middle, lam_middle
+            if high - low <= tolerance * high:
+                break
+        lam, mu = lam_high, high
+
+    quantity = lots.quantity(np.array([lam, mu]))
+    used = lots.weights @ quantity
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratios = np.array([budget_limit, space_limit]) / used
+    quantity *= min(1.0, np.nanmin(np.where(used > 0, ratios, np.inf)))
+    used = lots.weights @ quantity
+
+    eoq = np.sqrt(2.0 * demand * S / H)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ordering = np.where(quantity > 0, demand * S / quantity, 0.0)
+        unconstrained = np.where(eoq > 0, demand * S / eoq, 0.0) + eoq * H / 2.0
+    holding = quantity * H / 2.0
+    policy = skus.assign(
+        eoq=eoq,
+        eoq_constrained=quantity,
+        investment=cost * quantity,
+        space_used=unit_space * quantity,
+        ordering_cost=ordering,
+        holding_cost=holding,
+        total_cost=ordering + holding,
+        unconstrained_cost=unconstrained,
+    )
+    return ConstrainedPolicy(
+        policy=policy,
+        budget_multiplier=float(lam),
+        space_multiplier=float(mu),
+        budget_used=float(used[0]),
+        space_used=float(used[1]),
+    )
+
+
+def abc_xyz(
+    skus: pd.DataFrame,
+    abc=(0.8, 0.95),
+    xyz=(0.5, 1.0),
+    cost_column: str = "unit_cost",
+    periods_per_year: float = 52.0,
+) -> pd.DataFrame:
+    """Clasificacion ABC por valor anual y XYZ por coeficiente de variacion.
+
+    Un articulo es A si el valor acumulado de los articulos mas valiosos
+    que el no llega a ``abc[0]`` del total, B si no llega a ``abc[1]`` y
+    C en otro caso. El coeficiente de variacion es ``sigma_demand``
+    entre la demanda por periodo; X hasta ``xyz[0]``, Y hasta ``xyz[1]``
+    y Z en otro caso (los articulos sin demanda son Z).
+    """
+    demand = _column(skus, "demand")
+    value = demand * _column(skus, cost_column) if cost_column in skus.columns else demand
+
+    order = np.argsort(-value, kind="stable")
+    total = value.sum()
+    before = np.empty(len(value))
+    before[order] = np.cumsum(value[order]) - value[order]
+    share = before / total if total > 0 else np.zeros(len(value))
+    abc_class = np.array(list("ABC"))[np.searchsorted(np.asarray(abc), share, side="right")]
+
+    rate = demand / periods_per_year
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cv = np.where(rate > 0, _column(skus, "sigma_demand") / rate, np.inf)
+    xyz_class = np.array(list("XYZ"))[np.searchsorted(np.asarray(xyz), cv, side="left")]
+
+    return skus.assign(
+        annual_value=value,
+        value_share=share,
+        cv=cv,
+        abc=abc_class,
+        xyz=xyz_class,
+        abc_xyz=np.char.add(abc_class, xyz_class),
+    )
+
+
+def assign_by_class(classified: pd.DataFrame, column: str, values: dict) -> pd.DataFrame:
+    """Fija ``column`` por clase; las llaves pueden ser ``"AX"`` o ``"A"``.
+
+    Las llaves de dos letras tienen prioridad; los articulos cuya clase no
+    aparece conservan su valor actual.
+    """
+    if column in classified.columns:
+        result = classified[column].to_numpy(dtype=np.float64, copy=True)
+    else:
+        result = np.full(len(classified), np.nan)
+    for key, size in (("abc", 1), ("abc_xyz", 2)):
+        labels = classified[key].to_numpy()
+        for label, value in values.items():
+            if len(label) == size:
+                result[labels == label] = value
+    return classified.assign(**{column: result})
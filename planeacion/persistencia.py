@@ -0,0 +1,276 @@
+"""Cache persistente de resultados en disco (SQLite).
+
+Guarda resultados ya calculados (corridas MRP, pronosticos,
+simulaciones, ...) identificados por un hash del contenido de sus
+entradas y parametros, de modo que sobreviven a reinicios del servidor
+y se comparten entre sesiones y procesos.
+
+* Los valores se serializan con ``pickle``; solo debe usarse con datos
+  generados por la propia aplicacion.
+* La base usa el modo WAL de SQLite: varios procesos pueden leer a la
+  vez y las escrituras se serializan con transacciones ``IMMEDIATE``.
+* Cuando el tamano total rebasa ``max_bytes`` se eliminan las entradas
+  usadas hace mas tiempo (LRU). Una lectura solo actualiza la hora de
+  uso si tiene mas de ``touch_interval`` segundos, para que los aciertos
+  no compitan por el candado de escritura.
+* ``memoize`` incluye en la clave ``code_version`` de la funcion: el hash
+  del codigo fuente de su paquete, que es igual en todos los procesos y
+  cambia cuando cambia la funcion o cualquiera de los auxiliares que usa.
+"""
+
+import functools
+import hashlib
+import os
+import pickle
+import sqlite3
+import sys
+import threading
+import time
+import types
+from dataclasses import fields, is_dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed);
+"""
+
+
+def _update(digest, value) -> None:
+    if isinstance(value, pd.DataFrame):
+        digest.update(b"frame")
+        digest.update(repr((list(map(str, value.columns)), list(map(str, value.dtypes)))).encode())
+        digest.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+    elif isinstance(value, (pd.Series, pd.Index)):
+        digest.update(b"series")
+        digest.update(str(value.dtype).encode())
+        digest.update(pd.util.hash_pandas_object(value).to_numpy().tobytes())
+    elif isinstance(value, np.ndarray):
+        digest.update(b"array")
+        digest.update(repr((value.dtype.str, value.shape)).encode())
+        digest.update(np.ascontiguousarray(value).tobytes() if value.dtype != object else pickle.dumps(value))
+    elif isinstance(value, (list, tuple)):
+        digest.update(f"{type(value).__name__}{len(value)}".encode())
+        for item in value:
+            _update(digest, item)
+    elif isinstance(value, dict):
+        digest.update(f"dict{len(value)}".encode())
+        for name in sorted(value, key=repr):
+            _update(digest, name)
+            _update(digest, value[name])
+    elif is_dataclass(value) and not isinstance(value, type):
+        digest.update(type(value).__qualname__.encode())
+        for field in fields(value):
+            _update(digest, getattr(value, field.name))
+    elif value is None or isinstance(value, (bool, int, float, str, bytes, np.generic)):
+        digest.update(repr(value).encode())
+    else:
+        digest.update(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def _const_repr(value) -> str:
+    # Los frozenset se ordenan: su orden de iteracion depende de la semilla de hash del proceso.
+    if isinstance(value, frozenset):
+        return "frozenset(" + repr(sorted(map(_const_repr, value))) + ")"
+    if isinstance(value, tuple):
+        return "(" + ", ".join(map(_const_repr, value)) + ")"
+    return repr(value)
+
+
+def _code_digest(digest, code) -> None:
+    # Se recorre el codigo anidado (comprensiones, funciones internas) en lugar
+    # de usar su repr, que incluye su direccion en memoria.
+    digest.update(code.co_code)
+    digest.update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            _code_digest(digest, const)
+        else:
+            digest.update(_const_repr(const).encode())
+
+
+_SOURCE_LOCK = threading.Lock()
+_SOURCE_DIGESTS = {}
+
+
+def _source_digest(paths) -> str:
+    """Hash del contenido de ``paths``; se relee solo si cambian sus ``mtime`` o tamanos."""
+    names = tuple(map(str, paths))
+    signature = tuple((stat.st_mtime_ns, stat.st_size) for stat in (path.stat() for path in paths))
+    with _SOURCE_LOCK:
+        cached = _SOURCE_DIGESTS.get(names)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    with _SOURCE_LOCK:
+        _SOURCE_DIGESTS[names] = (signature, digest.hexdigest())
+    return digest.hexdigest()
+
+
+def _package_files(root: Path) -> list:
+    # La lista se rehace solo si cambia el directorio (se agregan o quitan modulos).
+    stamp = root.stat().st_mtime_ns
+    with _SOURCE_LOCK:
+        cached = _SOURCE_DIGESTS.get(root)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    paths = sorted(path for path in root.rglob("*.py") if "__pycache__" not in path.parts)
+    with _SOURCE_LOCK:
+        _SOURCE_DIGESTS[root] = (stamp, paths)
+    return paths
+
+
+def code_version(function) -> str:
+    """Version del codigo de ``function``, estable entre procesos.
+
+    Es el hash del codigo fuente de su paquete (o de su modulo, si no
+    pertenece a uno), asi que cambia tambien cuando cambian las funciones
+    que llama. Si no hay archivo fuente se usa su bytecode, incluyendo el
+    codigo anidado.
+    """
+    module = sys.modules.get(getattr(function, "__module__", None) or "")
+    if module is not None:
+        top = sys.modules.get(module.__name__.split(".")[0])
+        if getattr(top, "__path__", None):
+            return _source_digest(_package_files(Path(list(top.__path__)[0])))
+        if getattr(module, "__file__", None) and Path(module.__file__).is_file():
+            return _source_digest([Path(module.__file__)])
+    code = getattr(function, "__code__", None)
+    if code is None:
+        return ""
+    digest = hashlib.sha256()
+    _code_digest(digest, code)
+    return digest.hexdigest()
+
+
+def content_key(*args, **kwargs) -> str:
+    """Hash SHA-256 del contenido de los argumentos (tablas, arreglos,
+    dataclasses, colecciones y escalares)."""
+    digest = hashlib.sha256()
+    _update(digest, args)
+    _update(digest, kwargs)
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """Cache LRU en un archivo SQLite, acotado a ``max_bytes``."""
+
+    def __init__(self, path, max_bytes: int = 512 * 2**20, timeout: float = 30.0, touch_interval: float = 60.0):
+        self.path = Path(path)
+        self.max_bytes = int(max_bytes)
+        self.timeout = timeout
+        self.touch_interval = float(touch_interval)
+        self._local = threading.local()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connection() as connection:
+            connection.executescript(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        # Una conexion por hilo y por proceso (no se heredan tras un fork).
+        connection = getattr(self._local, "connection", None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    def get(self, key: str, default=None):
+        connection = self._connection()
+        row = connection.execute("SELECT value, accessed FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return default
+        # La hora de uso solo ordena la eviccion: basta con refrescarla de vez en cuando.
+        now = time.time()
+        if now - row[1] >= self.touch_interval:
+            connection.execute(
+                "UPDATE entries SET accessed = ? WHERE key = ? AND accessed <= ?",
+                (now, key, now - self.touch_interval),
+            )
+        return pickle.loads(row[0])
+
+    def __contains__(self, key: str) -> bool:
+        row = self._connection().execute("SELECT 1 FROM entries WHERE key = ?", (key,)).fetchone()
+        return row is not None
+
+    def set(self, key: str, value) -> None:
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(blob) > self.max_bytes:
+            return
+        now = time.time()
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.execute(
+                "INSERT OR REPLACE INTO entries (key, value, size, created, accessed) VALUES (?, ?, ?, ?, ?)",
+                (key, blob, len(blob), now, now),
+            )
+            self._evict(connection)
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+    def _evict(self, connection) -> None:
+        total = connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        # Se borran las menos recientes hasta que el resto quepa.
+        connection.execute(
+            """
+            DELETE FROM entries WHERE key IN (
+                SELECT key FROM (
+                    SELECT key, SUM(size) OVER (ORDER BY accessed DESC, key) AS kept FROM entries
+                ) WHERE kept > ?
+            )
+            """,
+            (self.max_bytes,),
+        )
+
+    def delete(self, key: str) -> None:
+        self._connection().execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        connection = self._connection()
+        connection.execute("DELETE FROM entries")
+        connection.execute("VACUUM")
+
+    def stats(self) -> dict:
+        entries, size = self._connection().execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()
+        return {"entries": int(entries), "bytes": int(size), "max_bytes": self.max_bytes}
+
+    def memoize(self, function=None, *, namespace: str = None):
+        """Decorador: guarda el resultado de ``function`` por el hash de sus
+        argumentos, del nombre de la funcion y de ``code_version`` (un
+        cambio en la funcion o en el codigo de su paquete invalida sus
+        entradas)."""
+        if function is None:
+            return functools.partial(self.memoize, namespace=namespace)
+        identity = (namespace or f"{function.__module__}.{function.__qualname__}", code_version(function))
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            key = content_key(identity, args, kwargs)
+            missing = object()
+            value = self.get(key, missing)
+            if value is missing:
+                value = function(*args, **kwargs)
+                self.set(key, value)
+            return value
+
+        return wrapper
@@ -0,0 +1,264 @@
+"""Pronostico de demanda por lotes para alimentar el PMP (Semana 4).
+
+Todas las tecnicas operan sobre una matriz de historia (series x
+periodos): el unico ciclo de Python recorre los periodos y cada paso
+actualiza todas las series a la vez. ``run`` y ``best_fit`` pueden
+procesar la matriz por bloques de renglones para acotar la memoria.
+
+Los parametros (``alpha``, ``beta``, ...) aceptan un escalar o un
+arreglo con un valor por serie.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass
+class Forecast:
+    """Ajuste un paso adelante y pronostico fuera de muestra por serie."""
+
+    method: np.ndarray
+    fitted: np.ndarray
+    forecast: np.ndarray
+    mae: np.ndarray
+
+    def to_mps(self, items, start_period: int = 0) -> pd.DataFrame:
+        """Pronostico en el formato largo del PMP (``item``, ``period``,
+        ``quantity``) que consume ``planeacion.mrp.explode``."""
+        n_items, horizon = self.forecast.shape
+        return pd.DataFrame({
+            "item": np.repeat(np.asarray(items), horizon),
+            "period": np.tile(np.arange(start_period, start_period + horizon), n_items),
+            "quantity": np.maximum(self.forecast, 0.0).ravel(),
+        })
+
+
+def _history(history) -> np.ndarray:
+    matrix = np.asarray(history, dtype=np.float64)
+    if matrix.ndim == 1:
+        matrix = matrix[None, :]
+    return matrix
+
+
+def _param(value, n_series: int) -> np.ndarray:
+    return np.broadcast_to(np.asarray(value, dtype=np.float64), (n_series,))
+
+
+def _mae(history, fitted, window=None) -> np.ndarray:
+    """MAE por serie en los periodos con ajuste (y dentro de ``window``, si se da)."""
+    with np.errstate(invalid="ignore"):
+        errors = np.abs(history - fitted)
+    if window is not None:
+        errors = np.where(window, errors, np.nan)
+    counted = (~np.isnan(errors)).sum(axis=1)
+    return np.where(counted > 0, np.nansum(errors, axis=1) / np.maximum(counted, 1), np.inf)
+
+
+def _result(name, history, fitted, forecast) -> Forecast:
+    return Forecast(
+        method=np.full(len(history), name, dtype=object), fitted=fitted, forecast=forecast,
+        mae=_mae(history, fitted),
+    )
+
+
+def moving_average(history, horizon: int, window: int = 4) -> Forecast:
+    """Promedio movil de las ultimas ``window`` observaciones."""
+    y = _history(history)
+    n_series, n_periods = y.shape
+    window = max(1, min(int(window), n_periods))
+    prefix = np.concatenate([np.zeros((n_series, 1)), np.cumsum(y, axis=1)], axis=1)
+
+    fitted = np.full_like(y, np.nan)
+    fitted[:, window:] = (prefix[:, window:-1] - prefix[:, :-window - 1]) / window
+    level = (prefix[:, -1] - prefix[:, -window - 1]) / window
+    return _result("Promedio movil", y, fitted, np.repeat(level[:, None], horizon, axis=1))
+
+
+def exponential_smoothing(history, horizon: int, alpha=0.3) -> Forecast:
+    """Suavizamiento exponencial simple."""
+    y = _history(history)
+    alpha = _param(alpha, len(y))
+
+    fitted = np.full_like(y, np.nan)
+    level = y[:, 0].copy()
+    for t in range(1, y.shape[1]):
+        fitted[:, t] = level
+        level = alpha * y[:, t] + (1 - alpha) * level
+    return _result("Suavizamiento simple", y, fitted, np.repeat(level[:, None], horizon, axis=1))
+
+
+def holt(history, horizon: int, alpha=0.3, beta=0.1) -> Forecast:
+    """Suavizamiento exponencial doble (nivel y tendencia) de Holt.
+
+    El nivel y la tendencia se inicializan con los dos primeros periodos,
+    asi que el ajuste empieza en el tercero: ajustar el segundo con una
+    tendencia calculada con el mismo dato daria un error de cero.
+    """
+    y = _history(history)
+    alpha = _param(alpha, len(y))
+    beta = _param(beta, len(y))
+
+    fitted = np.full_like(y, np.nan)
+    if y.shape[1] > 1:
+        level, trend = y[:, 1].copy(), y[:, 1] - y[:, 0]
+    else:
+        level, trend = y[:, 0].copy(), np.zeros(len(y))
+    for t in range(2, y.shape[1]):
+        fitted[:, t] = level + trend
+        previous = level
+        level = alpha * y[:, t] + (1 - alpha) * (level + trend)
+        trend = beta * (level - previous) + (1 - beta) * trend
+    steps = np.arange(1, horizon + 1)
+    return _result("Holt", y, fitted, level[:, None] + trend[:, None] * steps)
+
+
+def holt_winters(history, horizon: int, season_length: int = 13, alpha=0.3, beta=0.05, gamma=0.2) -> Forecast:
+    """Holt-Winters aditivo (nivel, tendencia y estacionalidad).
+
+    Requiere al menos dos temporadas completas de historia para
+    inicializar la tendencia y los indices estacionales.
+    """
+    y = _history(history)
+    n_series, n_periods = y.shape
+    m = int(season_length)
+    if n_periods < 2 * m:
+        raise ValueError("Holt-Winters requiere al menos dos temporadas de historia.")
+    alpha = _param(alpha, n_series)
+    beta = _param(beta, n_series)
+    gamma = _param(gamma, n_series)
+
+    first, second = y[:, :m].mean(axis=1), y[:, m:2 * m].mean(axis=1)
+    level = first.copy()
+    trend = (second - first) / m
+    season = y[:, :m] - first[:, None]
+
+    fitted = np.full_like(y, np.nan)
+    for t in range(m, n_periods):
+        s = season[:, t % m]
+        fitted[:, t] = level + trend + s
+        previous = level
+        level = alpha * (y[:, t] - s) + (1 - alpha) * (level + trend)
+        trend = beta * (level - previous) + (1 - beta) * trend
+        season[:, t % m] = gamma * (y[:, t] - level) + (1 - gamma) * s
+
+    steps = np.arange(1, horizon + 1)
+    seasonal = season[:, (n_periods + steps - 1) % m]
+    return _result("Holt-Winters", y, fitted, level[:, None] + trend[:, None] * steps + seasonal)
+
+
+def croston(history, horizon: int, alpha=0.1, sba: bool = True) -> Forecast:
+    """Croston para demanda intermitente (con la correccion SBA por defecto).
+
+    Se suavizan por separado el tamano de la demanda y el intervalo entre
+    demandas; ambos solo se actualizan en los periodos con demanda.
+    """
+    y = _history(history)
+    n_series, n_periods = y.shape
+    alpha = _param(alpha, n_series)
+    correction = (1 - alpha / 2) if sba else 1.0
+
+    size = np.zeros(n_series)
+    interval = np.ones(n_series)
+    since = np.ones(n_series)
+    seen = np.zeros(n_series, dtype=bool)
+    fitted = np.full_like(y, np.nan)
+    for t in range(n_periods):
+        fitted[seen, t] = (correction * size / interval)[seen]
+        demand = y[:, t] > 0
+        first = demand & ~seen
+        update = demand & seen
+        size = np.where(first, y[:, t], np.where(update, size + alpha * (y[:, t] - size), size))
+        interval = np.where(first, since, np.where(update, interval + alpha * (since - interval), interval))
+        seen |= demand
+        since = np.where(demand, 1.0, since + 1.0)
+
+    level = np.where(seen, correction * size / interval, 0.0)
+    return _result("Croston", y, fitted, np.repeat(level[:, None], horizon, axis=1))
+
+
+METHODS = {
+    "moving_average": moving_average,
+    "exponential_smoothing": exponential_smoothing,
+    "holt": holt,
+    "holt_winters": holt_winters,
+    "croston": croston,
+}
+
+
+def _chunks(n_series: int, chunk_size):
+    step = n_series if not chunk_size else int(chunk_size)
+    for start in range(0, n_series, max(step, 1)):
+        yield slice(start, min(start + step, n_series))
+
+
+def _slice_params(params: dict, rows: slice, n_series: int) -> dict:
+    return {
+        name: value[rows] if np.ndim(value) == 1 and len(value) == n_series else value
+        for name, value in params.items()
+    }
+
+
+def _concat(parts) -> Forecast:
+    return Forecast(
+        method=np.concatenate([p.method for p in parts]),
+        fitted=np.concatenate([p.fitted for p in parts]),
+        forecast=np.concatenate([p.forecast for p in parts]),
+        mae=np.concatenate([p.mae for p in parts]),
+    )
+
+
+def run(history, method: str, horizon: int, chunk_size=None, **params) -> Forecast:
+    """Aplica una tecnica a todas las series, opcionalmente por bloques."""
+    y = _history(history)
+    function = METHODS[method]
+    return _concat([
+        function(y[rows], horizon, **_slice_params(params, rows, len(y)))
+        for rows in _chunks(len(y), chunk_size)
+    ])
+
+
+def best_fit(history, horizon: int, methods=None, chunk_size=None, params=None) -> Forecast:
+    """Corre varias tecnicas y conserva, por serie, la de menor MAE.
+
+    ``params`` mapea el nombre de cada tecnica a sus parametros. Las
+    tecnicas que no aplican a la historia (por ejemplo, Holt-Winters sin
+    dos temporadas) se omiten; si ninguna aplica se lanza ``ValueError``.
+
+    Cada tecnica empieza a ajustar en un periodo distinto (Holt-Winters
+    despues de una temporada, el promedio movil despues de su ventana),
+    asi que todas se comparan en la misma ventana final de cada serie: los
+    periodos en que todas tienen ajuste. El ``mae`` reportado es el de esa
+    ventana.
+    """
+    y = _history(history)
+    methods = list(methods or METHODS)
+    params = params or {}
+    parts = []
+    for rows in _chunks(len(y), chunk_size):
+        candidates, skipped = [], []
+        for name in methods:
+            try:
+                candidates.append(METHODS[name](y[rows], horizon, **_slice_params(params.get(name, {}), rows, len(y))))
+            except ValueError as exc:
+                skipped.append(f"{name}: {exc}")
+        if not candidates:
+            raise ValueError("Ninguna tecnica aplica a la historia" + (f" ({'; '.join(skipped)})" if skipped else "."))
+
+        window = np.logical_and.reduce([~np.isnan(candidate.fitted) for candidate in candidates])
+        shared = window.any(axis=1)
+        best = None
+        for candidate in candidates:
+            # Series sin periodos en comun: se usa el MAE propio de cada tecnica.
+            candidate.mae = np.where(shared, _mae(y[rows], candidate.fitted, window), candidate.mae)
+            if best is None:
+                best = candidate
+                continue
+            better = candidate.mae < best.mae
+            best.method[better] = candidate.method[better]
+            best.fitted[better] = candidate.fitted[better]
+            best.forecast[better] = candidate.forecast[better]
+            best.mae[better] = candidate.mae[better]
+        parts.append(best)
+    return _concat(parts)
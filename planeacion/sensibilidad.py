@@ -0,0 +1,144 @@
+"""Analisis de sensibilidad del EOQ (Semana 2).
+
+El costo total relevante (pedir + mantener) se evalua sobre una rejilla
+de factores S x H x D para todos los SKUs con una sola operacion de
+broadcasting (SKUs x S x H x D), por bloques de SKUs para acotar la
+memoria cuando se piden los resultados por SKU. Se reportan dos costos:
+
+* ``optimal``: el lote se re-optimiza con los nuevos parametros.
+* ``fixed``: se conserva el EOQ calculado con los parametros base, es
+  decir, el costo de decidir con datos que resultan equivocados.
+
+``SensitivityCache`` guarda rebanadas S x H por factor de demanda,
+identificadas por un hash del contenido de la tabla, para que mover un
+control reutilice lo ya calculado.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+COLUMNS = ("demand", "S", "H")
+
+
+def inputs_key(skus: pd.DataFrame) -> str:
+    """Hash del contenido de las columnas que intervienen en el costo."""
+    missing = [c for c in COLUMNS if c not in skus.columns]
+    if missing:
+        raise ValueError(f"Faltan columnas en la tabla de SKUs: {', '.join(missing)}")
+    hashed = pd.util.hash_pandas_object(skus[list(COLUMNS)], index=False).to_numpy()
+    return hashlib.sha1(hashed.tobytes()).hexdigest()
+
+
+def _factors(values) -> np.ndarray:
+    return np.atleast_1d(np.asarray(values, dtype=np.float64))
+
+
+def cost_grid(skus: pd.DataFrame, s_factors, h_factors, d_factors, chunk_size: int = 20_000, per_sku: bool = False):
+    """Costo total relevante sobre la rejilla de factores.
+
+    Regresa ``(optimal, fixed)`` con forma ``(S, H, D)`` sumados sobre el
+    catalogo o, con ``per_sku=True``, con forma ``(SKUs, S, H, D)``.
+
+    Ambos costos son el producto de un coeficiente por SKU y una funcion
+    de los factores::
+
+        optimal = sqrt(2*D*S*H) * sqrt(fs*fh*fd)
+        fixed   = (D*S/Q0) * fs*fd + (Q0*H/2) * fh
+
+    por lo que la rejilla completa es un broadcast SKUs x (S, H, D) de
+    esos coeficientes contra tres bases de factores; los totales del
+    catalogo suman primero los coeficientes.
+    """
+    fs = _factors(s_factors)[:, None, None]
+    fh = _factors(h_factors)[None, :, None]
+    fd = _factors(d_factors)[None, None, :]
+    demand = skus["demand"].to_numpy(dtype=np.float64)
+    S = skus["S"].to_numpy(dtype=np.float64)
+    H = skus["H"].to_numpy(dtype=np.float64)
+    if (H <= 0).any():
+        raise ValueError("El costo de mantener (H) debe ser mayor que cero.")
+
+    q0 = np.sqrt(2.0 * demand * S / H)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ordering = np.where(q0 > 0, demand * S / q0, 0.0)
+    # Columnas: optimo, pedir y mantener; bases de factores en el mismo orden.
+    coefficients = np.stack([np.sqrt(2.0 * demand * S * H), ordering, q0 * H / 2.0], axis=1)
+    shape = np.broadcast_shapes(fs.shape, fh.shape, fd.shape)
+    basis = np.stack([
+        np.broadcast_to(np.sqrt(fs * fh * fd), shape),
+        np.broadcast_to(fs * fd, shape),
+        np.broadcast_to(fh, shape),
+    ])
+
+    if not per_sku:
+        total = coefficients.sum(axis=0)
+        return total[0] * basis[0], total[1] * basis[1] + total[2] * basis[2]
+
+    optimal = np.empty((len(skus),) + shape)
+    fixed = np.empty((len(skus),) + shape)
+    chunk_size = max(int(chunk_size), 1)
+    for start in range(0, len(skus), chunk_size):
+        rows = slice(start, start + chunk_size)
+        c = coefficients[rows, :, None, None, None]
+        optimal[rows] = c[:, 0] * basis[0]
+        fixed[rows] = c[:, 1] * basis[1] + c[:, 2] * basis[2]
+    return optimal, fixed
+
+
+def tornado(skus: pd.DataFrame, change: float = 0.2) -> pd.DataFrame:
+    """Variacion del costo del catalogo al mover cada parametro +/- ``change``
+    manteniendo el EOQ base (sensibilidad del costo a errores de estimacion)."""
+    low, high = 1.0 - change, 1.0 + change
+    _, fixed = cost_grid(skus, [low, 1.0, high], [low, 1.0, high], [low, 1.0, high])
+    base = fixed[1, 1, 1]
+    rows = []
+    for axis, name in enumerate(("S", "H", "D")):
+        index = [1, 1, 1]
+        index[axis] = 0
+        at_low = fixed[tuple(index)]
+        index[axis] = 2
+        at_high = fixed[tuple(index)]
+        rows.append({"parameter": name, "low": at_low - base, "high": at_high - base, "base": base})
+    return pd.DataFrame(rows)
+
+
+class SensitivityCache:
+    """Memoizacion LRU de rebanadas S x H por (hash de entradas, factor D).
+
+    Es segura para usarse desde varias sesiones de Streamlit a la vez.
+    """
+
+    def __init__(self, max_slices: int = 512):
+        self.max_slices = max_slices
+        self._slices = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def slice(self, skus: pd.DataFrame, s_factors, h_factors, d_factor: float, key=None):
+        """Rebanada ``(optimal, fixed)`` con forma ``(S, H)`` para un factor D."""
+        s_factors, h_factors = _factors(s_factors), _factors(h_factors)
+        cache_key = (
+            key or inputs_key(skus),
+            s_factors.tobytes(),
+            h_factors.tobytes(),
+            round(float(d_factor), 12),
+        )
+        with self._lock:
+            if cache_key in self._slices:
+                self._slices.move_to_end(cache_key)
+                self.hits += 1
+                return self._slices[cache_key]
+            self.misses += 1
+
+        optimal, fixed = cost_grid(skus, s_factors, h_factors, [d_factor])
+        value = (optimal[:, :, 0], fixed[:, :, 0])
+        with self._lock:
+            self._slices[cache_key] = value
+            while len(self._slices) > self.max_slices:
+                self._slices.popitem(last=False)
+        return value
@@ -0,0 +1,236 @@
+"""Trabajos en segundo plano para calculos largos (MRP, Monte Carlo,
+planes agregados, ...).
+
+``JobRunner`` ejecuta funciones en un ``ProcessPoolExecutor`` propio con
+un numero acotado de procesos, de modo que varias sesiones pueden enviar
+corridas a la vez sin ocupar los hilos del servidor web; los trabajos
+que no caben esperan en la cola del pool. No requiere un broker externo:
+el progreso, las solicitudes de cancelacion y los resultados viven en un
+``ResultCache`` (SQLite) que comparten el proceso principal y los
+procesos de trabajo.
+
+* Cada trabajo tiene un id; ``status(job_id)`` da su estado (``queued``,
+  ``running``, ``done``, ``failed`` o ``cancelled``) y su avance.
+* Si la funcion acepta el argumento ``progress`` recibe un ``Progress``:
+  llamarlo con ``(hechos, total)`` publica el avance.
+* ``cancel(job_id)`` quita de la cola los trabajos que no han empezado;
+  los que ya corren se detienen en su siguiente reporte de progreso.
+* Los procesos se crean con ``spawn``: el servidor tiene varios hilos y
+  ``fork`` podria heredar candados tomados. La funcion y sus argumentos
+  deben poder serializarse con ``pickle`` (funciones de modulo).
+"""
+
+import inspect
+import multiprocessing
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import CancelledError, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+
+from planeacion.persistencia import ResultCache
+
+STATES = ("queued", "running", "done", "failed", "cancelled")
+
+
+class JobCancelled(Exception):
+    """El trabajo se detuvo porque se solicito su cancelacion."""
+
+
+def _key(job_id: str, kind: str) -> str:
+    return f"job:{job_id}:{kind}"
+
+
+class Progress:
+    """Publica el avance de un trabajo y detecta su cancelacion.
+
+    Las escrituras se espacian al menos ``interval`` segundos (salvo la
+    ultima, ``hechos == total``); la cancelacion se revisa en cada llamada.
+    """
+
+    def __init__(self, store: ResultCache, job_id: str, interval: float = 0.25):
+        self.store = store
+        self.job_id = job_id
+        self.interval = interval
+        self._last = 0.0
+
+    def __call__(self, done, total=None, message: str = "") -> None:
+        if _key(self.job_id, "cancel") in self.store:
+            raise JobCancelled(self.job_id)
+        now = time.monotonic()
+        if now - self._last >= self.interval or (total is not None and done >= total):
+            self.store.set(_key(self.job_id, "progress"), (done, total, message))
+            self._last = now
+
+
+def _run(store_path, max_bytes, job_id, function, args, kwargs, with_progress):
+    # Se ejecuta en el proceso de trabajo.
+    store = ResultCache(store_path, max_bytes=max_bytes)
+    store.set(_key(job_id, "started"), time.time())
+    if with_progress:
+        kwargs = {**kwargs, "progress": Progress(store, job_id)}
+    value = function(*args, **kwargs)
+    store.set(_key(job_id, "result"), value)
+    if _key(job_id, "result") in store:
+        return True, None
+    # Demasiado grande para el almacen: viaja de regreso por el pool.
+    return False, value
+
+
+@dataclass
+class JobStatus:
+    """Estado de un trabajo; ``total`` es ``None`` si no reporta avance."""
+
+    job_id: str
+    label: str
+    state: str
+    done: float
+    total: float
+    message: str
+    submitted: float
+    error: str = None
+
+    @property
+    def fraction(self) -> float:
+        if self.state == "done":
+            return 1.0
+        if not self.total:
+            return 0.0
+        return min(max(self.done / self.total, 0.0), 1.0)
+
+
+@dataclass
+class _Job:
+    job_id: str
+    label: str
+    future: object
+    submitted: float
+
+
+class JobRunner:
+    """Cola de trabajos sobre un pool de ``max_workers`` procesos.
+
+    Por omision usa la mitad de los CPUs (al menos uno) para dejar
+    capacidad al servidor. Se conservan los ultimos ``max_jobs``
+    trabajos terminados.
+    """
+
+    def __init__(self, store_path, max_workers=None, max_bytes: int = 512 * 2**20, max_jobs: int = 256):
+        self.store_path = Path(store_path)
+        self.store = ResultCache(self.store_path, max_bytes=max_bytes)
+        self.max_workers = max_workers or max(1, (os.cpu_count() or 2) // 2)
+        self.max_jobs = max_jobs
+        self._jobs = {}
+        self._lock = threading.Lock()
+        self._pool = self._new_pool()
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn"))
+
+    def submit(self, function, *args, label: str = None, **kwargs) -> str:
+        """Envia ``function(*args, **kwargs)`` a la cola y regresa su id."""
+        job_id = uuid.uuid4().hex
+        try:
+            with_progress = "progress" in inspect.signature(function).parameters
+        except (TypeError, ValueError):
+            with_progress = False
+        task = (_run, self.store_path, self.store.max_bytes, job_id, function, args, kwargs, with_progress)
+        try:
+            future = self._pool.submit(*task)
+        except BrokenProcessPool:
+            # Un proceso de trabajo murio (por ejemplo, sin memoria): se reemplaza el pool.
+            self._pool = self._new_pool()
+            future = self._pool.submit(*task)
+        with self._lock:
+            self._jobs[job_id] = _Job(job_id, label or getattr(function, "__name__", "trabajo"), future, time.time())
+            self._trim()
+        return job_id
+
+    def _trim(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job.future.done()]
+        for job_id in finished[:max(len(self._jobs) - self.max_jobs, 0)]:
+            self._forget(job_id)
+
+    def _forget(self, job_id) -> None:
+        job = self._jobs.pop(job_id, None)
+        if job is None or job.future.done():
+            self._drop(job_id)
+            return
+        # Un trabajo que sigue corriendo necesita ver su solicitud de
+        # cancelacion; sus claves (y lo que escriba antes de detenerse) se
+        # borran cuando termina.
+        self._drop(job_id, kinds=("progress", "started", "result"))
+        job.future.add_done_callback(lambda _: self._drop(job_id))
+
+    def _drop(self, job_id, kinds=("progress", "started", "result", "cancel")) -> None:
+        for kind in kinds:
+            self.store.delete(_key(job_id, kind))
+
+    def status(self, job_id: str):
+        """Estado del trabajo o ``None`` si el id no existe."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        future = job.future
+        error = None
+        if future.cancelled():
+            state = "cancelled"
+        elif future.done():
+            exc = future.exception()
+            if exc is None:
+                state = "done"
+            elif isinstance(exc, JobCancelled):
+                state = "cancelled"
+            else:
+                state, error = "failed", f"{type(exc).__name__}: {exc}"
+        elif _key(job_id, "started") in self.store:
+            state = "running"
+        else:
+            state = "queued"
+        done, total, message = self.store.get(_key(job_id, "progress"), (0, None, ""))
+        return JobStatus(job_id, job.label, state, done, total, message, job.submitted, error)
+
+    def result(self, job_id: str, timeout=None):
+        """Resultado del trabajo; espera a que termine (hasta ``timeout``).
+
+        Lanza ``JobCancelled`` si se cancelo, la excepcion del trabajo si
+        fallo o ``KeyError`` si el almacen ya desalojo el resultado.
+        """
+        with self._lock:
+            job = self._jobs[job_id]
+        try:
+            stored, value = job.future.result(timeout)
+        except CancelledError:
+            raise JobCancelled(job_id) from None
+        if stored:
+            missing = object()
+            value = self.store.get(_key(job_id, "result"), missing)
+            if value is missing:
+                raise KeyError(f"El resultado del trabajo {job_id} ya no esta en el almacen.")
+        return value
+
+    def cancel(self, job_id: str) -> None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None or job.future.done():
+            return
+        if not job.future.cancel():
+            self.store.set(_key(job_id, "cancel"), True)
+
+    def forget(self, job_id: str) -> None:
+        """Cancela el trabajo si sigue activo y borra su registro y resultado."""
+        self.cancel(job_id)
+        with self._lock:
+            self._forget(job_id)
+
+    def jobs(self) -> list:
+        with self._lock:
+            job_ids = list(self._jobs)
+        return [status for status in map(self.status, job_ids) if status is not None]
+
+    def shutdown(self, cancel: bool = True) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=cancel)
@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from planeacion.bullwhip import customer_demand, simulate_chain
+
+LEAD_TIMES = [2, 2, 2]
+
+
+@pytest.fixture(scope="module")
+def demand():
+    return customer_demand(500, 114, seed=7)
+
+
+def _ratios(demand, **kwargs):
+    return simulate_chain(demand, lead_times=LEAD_TIMES, **kwargs).amplification()["amplification"].to_numpy()
+
+
+def test_smoothed_order_up_to_dampens_bullwhip(demand):
+    order_up_to = _ratios(demand, policy="order_up_to")
+    proportional = _ratios(demand, policy="proportional", smoothing=0.3)
+    assert (proportional[1:] < order_up_to[1:]).all()
+    assert np.allclose(_ratios(demand, policy="proportional", smoothing=1.0), order_up_to)
+
+
+def test_lot_ordering_amplifies_bullwhip(demand):
+    order_up_to = _ratios(demand, policy="order_up_to", negative_orders=False)
+    s_S = _ratios(demand, policy="s_S", lot_periods=2.0)
+    assert (s_S[1:] > order_up_to[1:]).all()
+    assert np.allclose(_ratios(demand, policy="s_S", lot_periods=0.0), order_up_to)
+
+
+def test_policy_per_echelon(demand):
+    mixed = _ratios(demand, policy=["proportional", "order_up_to", "order_up_to"], smoothing=0.3)
+    order_up_to = _ratios(demand, policy="order_up_to")
+    assert mixed[1] < order_up_to[1]
+    with pytest.raises(ValueError):
+        simulate_chain(demand, lead_times=LEAD_TIMES, policy=["order_up_to", "s_S"])
+    with pytest.raises(ValueError):
+        simulate_chain(demand, lead_times=LEAD_TIMES, policy="kanban")
@@ -0,0 +1,20 @@
+import pytest
+
+from planeacion.ejemplos import demo_skus
+from planeacion.inventario import inventory_policy
+
+
+@pytest.mark.parametrize("column", ["demand", "S", "lead_time"])
+def test_negative_inputs_are_rejected(column):
+    skus = demo_skus(10)
+    skus.loc[3, column] = -1.0
+    with pytest.raises(ValueError, match="negativo"):
+        inventory_policy(skus)
+
+
+def test_zero_demand_gives_zero_lot():
+    skus = demo_skus(10)
+    skus.loc[0, "demand"] = 0.0
+    policy = inventory_policy(skus)
+    assert policy.loc[0, "eoq"] == 0.0
+    assert policy[["eoq", "safety_stock", "reorder_point"]].notna().all().all()
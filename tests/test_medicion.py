@@ -0,0 +1,21 @@
+from planeacion.medicion import Tracer
+
+
+def test_spans_reset_when_the_run_changes():
+    current = [None]
+
+    def run():
+        return current[0]
+
+    tracer = Tracer(run=run)
+    tracer.begin(True)
+    with tracer.span("pagina"):
+        pass
+    assert [name for name, _ in tracer.spans()] == ["pagina"]
+
+    for token in ("fragmento-1", "fragmento-2"):
+        current[0] = token
+        with tracer.span("fragmento"):
+            pass
+        assert [name for name, _ in tracer.spans()] == ["fragmento"]
+    assert tracer.stats()["fragmento"]["count"] == 2
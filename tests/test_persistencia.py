@@ -0,0 +1,52 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from planeacion.persistencia import ResultCache
+
+ROOT = Path(__file__).resolve().parent.parent
+
+SCRIPT = """
+import sys
+import numpy as np
+from planeacion import pronostico
+from planeacion.persistencia import ResultCache, code_version
+
+cache = ResultCache(sys.argv[1])
+history = np.arange(1.0, 41.0).reshape(2, 20)
+cache.memoize(pronostico.run)(history, "moving_average", 4)
+print(code_version(pronostico.run), cache.stats()["entries"])
+"""
+
+
+def _run(store, seed):
+    env = {**os.environ, "PYTHONPATH": str(ROOT), "PYTHONHASHSEED": str(seed)}
+    result = subprocess.run(
+        [sys.executable, "-c", SCRIPT, str(store)], env=env, capture_output=True, text=True, check=True,
+    )
+    return result.stdout.split()
+
+
+def test_memoize_key_is_stable_across_interpreters(tmp_path):
+    store = tmp_path / "resultados.sqlite"
+    first_version, first_entries = _run(store, 1)
+    second_version, second_entries = _run(store, 2)
+    assert first_version == second_version
+    assert first_entries == second_entries == "1"
+
+
+def _accessed(cache, key):
+    return cache._connection().execute("SELECT accessed FROM entries WHERE key = ?", (key,)).fetchone()[0]
+
+
+def test_hits_only_touch_stale_entries(tmp_path):
+    cache = ResultCache(tmp_path / "resultados.sqlite", touch_interval=60.0)
+    cache.set("a", 1)
+    stored = _accessed(cache, "a")
+    assert cache.get("a") == 1
+    assert _accessed(cache, "a") == stored
+
+    cache._connection().execute("UPDATE entries SET accessed = accessed - 120 WHERE key = 'a'")
+    assert cache.get("a") == 1
+    assert _accessed(cache, "a") >= stored
@@ -0,0 +1,34 @@
+import numpy as np
+import pandas as pd
+
+from planeacion import pronostico
+from planeacion.ejemplos import demo_demand_history
+from planeacion.mrp import explode
+
+
+def test_holt_does_not_score_its_initialization():
+    history = np.array([[10.0, 30.0, 20.0, 25.0, 28.0, 31.0]])
+    fc = pronostico.holt(history, 2)
+    assert np.isnan(fc.fitted[:, :2]).all()
+    errors = np.abs(history[:, 2:] - fc.fitted[:, 2:])
+    assert np.allclose(fc.mae, errors.mean(axis=1))
+
+
+def test_best_fit_forecast_reaches_mrp_explosion():
+    horizon = 8
+    items = pd.DataFrame({
+        "item": ["A", "B", "C"],
+        "lead_time": [1, 0, 2],
+        "on_hand": [0.0, 0.0, 0.0],
+    })
+    bom = pd.DataFrame({"parent": ["A", "B"], "child": ["C", "C"], "qty_per": [2.0, 1.0]})
+    end_items = items.loc[~items["item"].isin(bom["child"]), "item"].to_numpy()
+
+    fc = pronostico.best_fit(demo_demand_history(len(end_items), n_periods=52), horizon)
+    plan = explode(items, bom, fc.to_mps(end_items), horizon)
+
+    rows = [plan.index_of(item) for item in end_items]
+    assert np.allclose(plan.independent[rows], np.maximum(fc.forecast, 0.0))
+    # El componente recibe las liberaciones de sus padres por su uso.
+    c = plan.index_of("C")
+    assert np.allclose(plan.gross[c], 2.0 * plan.releases[rows[0]] + plan.releases[rows[1]])
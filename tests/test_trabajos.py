@@ -0,0 +1,45 @@
+import time
+
+import pytest
+
+from planeacion.trabajos import JobRunner, _key
+
+
+def _slow(steps, progress):
+    for i in range(steps):
+        progress(i, steps)
+        time.sleep(0.02)
+    return steps
+
+
+@pytest.fixture
+def runner(tmp_path):
+    runner = JobRunner(tmp_path / "trabajos.sqlite", max_workers=1)
+    yield runner
+    runner.shutdown()
+
+
+def _wait(condition, timeout=60.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.05)
+
+
+def test_forget_running_job_drops_cancel_key_when_it_stops(runner):
+    job_id = runner.submit(_slow, 500)
+    future = runner._jobs[job_id].future
+    _wait(lambda: runner.status(job_id).state == "running")
+    runner.forget(job_id)
+    assert _key(job_id, "cancel") in runner.store
+    _wait(future.done)
+    _wait(lambda: _key(job_id, "cancel") not in runner.store, timeout=5.0)
+    assert _key(job_id, "result") not in runner.store
+
+
+def test_evicted_result_raises_key_error(runner):
+    job_id = runner.submit(_slow, 2)
+    assert runner.result(job_id, timeout=60) == 2
+    runner.store.delete(_key(job_id, "result"))
+    with pytest.raises(KeyError):
+        runner.result(job_id)